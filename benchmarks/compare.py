@@ -0,0 +1,167 @@
+import json
+import random
+
+DEFAULT_THRESHOLD = 0.05
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_RESAMPLES = 1000
+
+REGRESSION = "regression"
+IMPROVEMENT = "improvement"
+UNCHANGED = "unchanged"
+MISSING = "missing"
+
+def get_median(samples: list[float]) -> float:
+    '''Return the median of the samples.
+
+    Args:
+        samples - A non-empty list of numbers.
+    '''
+    sorted_samples = sorted(samples)
+    middle = len(sorted_samples) // 2
+    if len(sorted_samples)%2:
+        return sorted_samples[middle]
+
+    return (sorted_samples[middle-1] + sorted_samples[middle]) / 2
+
+def _resample_median(rounds: list[list[float]], rng: random.Random) -> float:
+    '''Return the median of a bootstrap resample of the rounds. The rounds are resampled with 
+    replacement, and then the samples within each chosen round.
+
+    Args:
+        rounds - A non-empty 2-dimensional list of numbers containing the samples of each round.
+        rng - A random.Random object used to resample the rounds.
+    '''
+    return get_median([sample for chosen_round in rng.choices(rounds, k=len(rounds)) 
+                       for sample in rng.choices(chosen_round, k=len(chosen_round))])
+
+def bootstrap_ratio_interval(baseline_rounds: list[list[float]], rounds: list[list[float]], 
+                             confidence: float=DEFAULT_CONFIDENCE, resamples: int=DEFAULT_RESAMPLES, 
+                             rng: random.Random=None) -> tuple[float, float]:
+    '''Return the confidence interval of the ratio between the median time and the median baseline
+    time, estimated with a two-level bootstrap: the rounds are resampled, then the times within each 
+    round, so the interval widens when the machine was faster or slower in some rounds. A ratio above 
+    1 means the operation has become slower than the baseline.
+
+    Args:
+        baseline_rounds - A non-empty 2-dimensional list of numbers containing the baseline times of
+                each round.
+        rounds - A non-empty 2-dimensional list of numbers containing the new times of each round.
+        confidence - A number between 0 and 1 representing the confidence level of the interval. 
+                Default is DEFAULT_CONFIDENCE.
+        resamples - An integer representing the number of bootstrap resamples. Default is DEFAULT_RESAMPLES.
+        rng - A random.Random object used to resample the times. Default is None, which creates a 
+                generator with a fixed seed so the interval is reproducible.
+    '''
+    rng = rng or random.Random(0)
+    ratios = sorted(_resample_median(rounds, rng) / max(_resample_median(baseline_rounds, rng), 1e-9)
+                    for _ in range(resamples))
+    tail = (1 - confidence) / 2
+    return ratios[int(tail * (resamples-1))], ratios[round((1 - tail) * (resamples-1))]
+
+class Comparison:
+    def __init__(self, name: str, status: str, ratio: float=None, interval: tuple[float, float]=None):
+        '''Construct a Comparison object. A Comparison object holds the result of comparing a benchmark
+        with its baseline.
+
+        Args:
+            name - A string representing the name of the benchmark.
+            status - A string representing the outcome: REGRESSION, IMPROVEMENT, UNCHANGED or MISSING.
+            ratio - A number representing the median time divided by the baseline median time. Default
+                    is None, when the benchmark is missing from the baseline or the results.
+            interval - A tuple containing the lower and upper bounds of the confidence interval of the 
+                    ratio. Default is None.
+        '''
+        self.name = name
+        self.status = status
+        self.ratio = ratio
+        self.interval = interval
+
+    def get_name(self) -> str:
+        '''Return the name of the benchmark.'''
+        return self.name
+
+    def get_status(self) -> str:
+        '''Return the outcome of the comparison.'''
+        return self.status
+
+    def get_ratio(self) -> float or None:
+        '''Return the median time divided by the baseline median time, or None if the benchmark is missing.'''
+        return self.ratio
+
+    def get_interval(self) -> tuple[float, float] or None:
+        '''Return the confidence interval of the ratio, or None if the benchmark is missing.'''
+        return self.interval
+
+    def is_regression(self) -> bool:
+        '''Return True if the benchmark is slower than its baseline, False otherwise.'''
+        return self.status==REGRESSION
+
+    def __repr__(self):
+        if self.ratio is None:
+            return f"{self.name}: {self.status}"
+
+        low, high = self.interval
+        return f"{self.name}: {self.status}, {self.ratio:.3f}x the baseline time ({low:.3f}x to {high:.3f}x)"
+
+def compare_results(baseline: dict, results: dict, threshold: float=DEFAULT_THRESHOLD, 
+                    confidence: float=DEFAULT_CONFIDENCE, resamples: int=DEFAULT_RESAMPLES) -> list[Comparison]:
+    '''Compare the benchmark results with the baseline results, see runner.run_benchmarks(). A benchmark
+    has regressed when the whole confidence interval of its median time ratio is above 1 plus the 
+    threshold, and improved when the whole interval is below 1 minus the threshold, so noise between
+    runs is not reported as a change.
+
+    Args:
+        baseline - A dictionary containing the baseline benchmark results.
+        results - A dictionary containing the new benchmark results.
+        threshold - A number representing the relative change in time that is ignored. Default is 
+                DEFAULT_THRESHOLD, a 5% change.
+        confidence - A number between 0 and 1 representing the confidence level. Default is DEFAULT_CONFIDENCE.
+        resamples - An integer representing the number of bootstrap resamples. Default is DEFAULT_RESAMPLES.
+    '''
+    baseline_benchmarks, benchmarks = baseline["benchmarks"], results["benchmarks"]
+    comparisons = list()
+    for name in list(benchmarks) + [name for name in baseline_benchmarks if name not in benchmarks]:
+        if name not in benchmarks or name not in baseline_benchmarks:
+            comparisons.append(Comparison(name, MISSING))
+            continue
+
+        baseline_rounds, rounds = baseline_benchmarks[name]["rounds_ns"], benchmarks[name]["rounds_ns"]
+        baseline_median = get_median([sample for samples in baseline_rounds for sample in samples])
+        ratio = get_median([sample for samples in rounds for sample in samples]) / max(baseline_median, 1e-9)
+        low, high = bootstrap_ratio_interval(baseline_rounds, rounds, confidence, resamples)
+        if low>1+threshold:
+            status = REGRESSION
+        elif high<1-threshold:
+            status = IMPROVEMENT
+        else:
+            status = UNCHANGED
+
+        comparisons.append(Comparison(name, status, ratio, (low, high)))
+
+    return comparisons
+
+def save_baseline(results: dict, path: str) -> None:
+    '''Write the benchmark results to the baseline file.
+
+    Args:
+        results - A dictionary containing the benchmark results, see runner.run_benchmarks().
+        path - A string representing the path of the baseline file.
+    '''
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+def load_baseline(path: str) -> dict:
+    '''Return the benchmark results stored in the baseline file.
+
+    Args:
+        path - A string representing the path of the baseline file.
+
+    Raises: ValueError when the file does not contain benchmark results.
+    '''
+    with open(path) as file:
+        baseline = json.load(file)
+
+    if "benchmarks" not in baseline:
+        raise ValueError(f"The file '{path}' does not contain benchmark results.")
+
+    return baseline
@@ -0,0 +1,122 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import benchmarks.compare as compare
+from benchmarks.suite import BENCHMARKS
+from benchmarks.timing import measure
+
+DEFAULT_ITERATIONS = 1000
+DEFAULT_WARMUP = 50
+DEFAULT_ROUNDS = 5
+
+def run_benchmarks(names: list[str]=None, iterations: int=DEFAULT_ITERATIONS, warmup: int=DEFAULT_WARMUP, 
+                   seed: int=0, rounds: int=DEFAULT_ROUNDS) -> dict:
+    '''Run the benchmarks and return the results as a dictionary that can be written as JSON. Each 
+    benchmark is given its own random number generator seeded with the provided seed, so the same 
+    operations are timed on every run. The operations are timed in rounds, taking turns between the
+    benchmarks, so a slow period of the machine is shared by every benchmark and shows up as a 
+    difference between rounds, see compare.bootstrap_ratio_interval().
+
+    Args:
+        names - A list of strings representing the names of the benchmarks to run, see 
+                suite.BENCHMARKS. Default is None, which runs every benchmark.
+        iterations - An integer representing the number of operations timed in each benchmark.
+                Default is DEFAULT_ITERATIONS.
+        warmup - An integer representing the number of operations called before timing starts. 
+                Default is DEFAULT_WARMUP.
+        seed - An integer used to seed the random number generators. Default is 0.
+        rounds - An integer representing the number of rounds the operations are split into. Default 
+                is DEFAULT_ROUNDS.
+
+    Raises: ValueError when a benchmark name is not recognised, or there are fewer iterations than rounds.
+    '''
+    names = list(BENCHMARKS) if names is None else names
+    for name in names:
+        if name not in BENCHMARKS:
+            raise ValueError(f"The benchmark '{name}' is not recognised. Choose from {list(BENCHMARKS)}.")
+
+    if not 0<rounds<=iterations:
+        raise ValueError(f"The number of rounds '{rounds}' must be between 1 and the number of iterations.")
+
+    operations = {name:BENCHMARKS[name](random.Random(seed)) for name in names}
+    results = dict()
+    for round_number in range(rounds):
+        round_iterations = iterations // rounds + (round_number < iterations%rounds)
+        for name, (setup, operation) in operations.items():
+            result = measure(name, setup, operation, round_iterations, 0 if round_number else warmup)
+            if name in results:
+                results[name].add_round(result)
+            else:
+                results[name] = result
+
+    return {"python":platform.python_version(), 
+            "platform":platform.platform(),
+            "iterations":iterations,
+            "rounds":rounds,
+            "seed":seed,
+            "benchmarks":{name:result.to_dict() for name, result in results.items()}}
+
+def get_arguments(argv: list[str]=None) -> argparse.Namespace:
+    '''Return the command line arguments.
+
+    Args:
+        argv - A list of strings representing the command line arguments. Default is None, which 
+                uses sys.argv.
+    '''
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark the landlord game engine.")
+    parser.add_argument("benchmarks", nargs="*", metavar="benchmark",
+                        help=f"the benchmarks to run, from {', '.join(BENCHMARKS)}. Default is every benchmark.")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS, help="the operations timed in each benchmark.")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="the operations called before timing starts.")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="the rounds the operations are split into.")
+    parser.add_argument("--seed", type=int, default=0, help="the seed of the random number generators.")
+    parser.add_argument("--output", default=None, help="the JSON file the results are written to. Default is stdout.")
+    parser.add_argument("--save-baseline", default=None, metavar="PATH", help="save the results as the baseline file.")
+    parser.add_argument("--compare", default=None, metavar="PATH", 
+                        help="compare the results with the baseline file, exiting with status 1 on a regression.")
+    parser.add_argument("--threshold", type=float, default=compare.DEFAULT_THRESHOLD, 
+                        help="the relative change in time ignored when comparing. Default is 0.05.")
+    parser.add_argument("--confidence", type=float, default=compare.DEFAULT_CONFIDENCE, 
+                        help="the confidence level of the bootstrap intervals. Default is 0.95.")
+    parser.add_argument("--resamples", type=int, default=compare.DEFAULT_RESAMPLES, 
+                        help="the number of bootstrap resamples. Default is 1000.")
+    args = parser.parse_args(argv)
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f"the benchmark '{name}' is not recognised, choose from {', '.join(BENCHMARKS)}.")
+
+    return args
+
+def main(argv: list[str]=None) -> int:
+    '''Run the benchmarks from the command line, writing the results as JSON. When a baseline file is
+    given, the results are compared with the baseline instead. Returns the exit status, which is 1 when
+    a benchmark has regressed, 0 otherwise.
+
+    Args:
+        argv - A list of strings representing the command line arguments. Default is None, which 
+                uses sys.argv.
+    '''
+    args = get_arguments(argv)
+    # the baseline is read first, so a missing baseline is reported before the benchmarks run.
+    baseline = compare.load_baseline(args.compare) if args.compare else None
+    results = run_benchmarks(args.benchmarks or None, args.iterations, args.warmup, args.seed, args.rounds)
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    elif args.save_baseline is None and baseline is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+
+    if args.save_baseline is not None:
+        compare.save_baseline(results, args.save_baseline)
+
+    if baseline is None:
+        return 0
+
+    comparisons = compare.compare_results(baseline, results, args.threshold, args.confidence, args.resamples)
+    for comparison in comparisons:
+        print(comparison)
+
+    return 1 if any(comparison.is_regression() for comparison in comparisons) else 0
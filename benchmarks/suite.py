@@ -0,0 +1,133 @@
+import itertools
+import random
+from collections.abc import Callable
+import game.rules as rules
+from example import LandlordGame
+from game.core.deck import CardDeck
+from game.core.hand import CardHand
+from game.core.player import Player
+from game.engine.bidding import BiddingEngine
+from tests import helpers
+
+TOTAL_PLAYERS = 3
+# the number of deals prepared before timing, which the benchmarks cycle through.
+TOTAL_DEALS = 64
+
+def get_fixture_hands() -> list[list[int]]:
+    '''Return a 2-dimensional list of integers containing every valid and invalid card hand in the
+    test fixtures, see tests/helpers.py.'''
+    test_helpers = helpers.TestHelpers()
+    fixtures = [getattr(test_helpers, name) for name in dir(test_helpers)
+                if name.startswith(("get_valid_", "get_invalid_", "get_hands_"))]
+    return [hand for fixture in fixtures for hand in fixture()]
+
+def _deal_cards(rng: random.Random) -> list[tuple[list]]:
+    '''Return a list of deals, where each deal contains the three players' cards and the wildcards.
+
+    Args:
+        rng - A random.Random object used to shuffle the deck.
+    '''
+    deck, deals = CardDeck(rng), list()
+    for _ in range(TOTAL_DEALS):
+        deck.reset()
+        deck.shuffle()
+        deals.append(deck.deal())
+
+    return deals
+
+def rules_hand_category(rng: random.Random) -> tuple[Callable, Callable]:
+    '''Benchmark rules.get_hand_category() on each fixture hand, including the unrecognised hands.'''
+    number_freqs = itertools.cycle([{number:hand.count(number) for number in hand} for hand in get_fixture_hands()])
+
+    def get_hand_category(number_freq):
+        try:
+            rules.get_hand_category(number_freq)
+        except RuntimeError:
+            pass
+
+    return lambda: (next(number_freqs),), get_hand_category
+
+def _set_random_hand(rng: random.Random, with_wildcards: bool, respond: bool) -> tuple[Callable, Callable]:
+    '''Benchmark CardHand.set_random_hand() on a players' cards.
+
+    Args:
+        rng - A random.Random object used to deal the cards and choose the hands.
+        with_wildcards - A boolean, True if the wildcards are added to the players' cards.
+        respond - A boolean, True if the hand must beat a hand played by another player.
+    '''
+    hand, other_hand = CardHand(rng), CardHand(rng)
+    cases = list()
+    for player1, player2, _, wildcards in _deal_cards(rng):
+        previous_hand = other_hand.set_random_hand(player2) if respond else None
+        cases.append((player1 + wildcards if with_wildcards else player1, previous_hand))
+
+    cases = itertools.cycle(cases)
+
+    def setup():
+        hand.reset()
+        return next(cases)
+
+    return setup, hand.set_random_hand
+
+def set_random_hand_17(rng: random.Random) -> tuple[Callable, Callable]:
+    '''Benchmark CardHand.set_random_hand() leading a round with 17 cards.'''
+    return _set_random_hand(rng, with_wildcards=False, respond=False)
+
+def set_random_hand_20(rng: random.Random) -> tuple[Callable, Callable]:
+    '''Benchmark CardHand.set_random_hand() leading a round with the landlords' 20 cards.'''
+    return _set_random_hand(rng, with_wildcards=True, respond=False)
+
+def set_random_hand_17_response(rng: random.Random) -> tuple[Callable, Callable]:
+    '''Benchmark CardHand.set_random_hand() responding to another players' hand with 17 cards.'''
+    return _set_random_hand(rng, with_wildcards=False, respond=True)
+
+def player_remove_cards(rng: random.Random) -> tuple[Callable, Callable]:
+    '''Benchmark Player.remove_cards() removing a random hand from a players' 17 cards.'''
+    player, hand = Player(rng), CardHand(rng)
+    cases = itertools.cycle([(player1, hand.set_random_hand(player1)) for player1, _, _, _ in _deal_cards(rng)])
+
+    def setup():
+        cards, played_hand = next(cases)
+        player.set_cards(list(cards))
+        player.get_move_index()
+        return (played_hand,)
+
+    return setup, player.remove_cards
+
+def bidding_round(rng: random.Random) -> tuple[Callable, Callable]:
+    '''Benchmark BiddingEngine.execute_bidding_round() with players that have not bid.'''
+    players = [Player(rng) for _ in range(TOTAL_PLAYERS)]
+    engine = BiddingEngine()
+    engine.set_players(players)
+    deals = itertools.cycle(_deal_cards(rng))
+
+    def setup():
+        for player, cards in zip(players, next(deals)):
+            player.reset()
+            player.set_cards(cards)
+        return ()
+
+    return setup, engine.execute_bidding_round
+
+def game_round(rng: random.Random) -> tuple[Callable, Callable]:
+    '''Benchmark LandlordGame.play(), dealing, bidding and playing a round of landlord. Rounds where
+    every player passes during bidding are included, and a new game starts when a game ends.'''
+    game = LandlordGame([Player() for _ in range(TOTAL_PLAYERS)], rng)
+
+    def setup():
+        if game.has_game_ended():
+            for player in game.get_players():
+                player.set_stake_amount(60)
+        return ()
+
+    return setup, game.play
+
+# maps the name of each benchmark to the function that prepares it. Each function takes a random.Random
+# object and returns the untimed setup function and the timed operation, see timing.measure().
+BENCHMARKS = {"rules_hand_category":rules_hand_category,
+    "set_random_hand_17":set_random_hand_17,
+    "set_random_hand_20":set_random_hand_20,
+    "set_random_hand_17_response":set_random_hand_17_response,
+    "player_remove_cards":player_remove_cards,
+    "bidding_round":bidding_round,
+    "game_round":game_round}
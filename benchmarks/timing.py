@@ -0,0 +1,111 @@
+import gc
+import math
+import time
+from collections.abc import Callable
+
+PERCENTILES = (50, 90, 99)
+
+def get_percentile(sorted_samples: list[float], percentile: float) -> float:
+    '''Return the percentile of the samples, interpolating between the two closest samples.
+
+    Args:
+        sorted_samples - A non-empty list of numbers in ascending order.
+        percentile - A number from 0 to 100 representing the percentile.
+    '''
+    position = (len(sorted_samples) - 1) * percentile / 100
+    lower, upper = math.floor(position), math.ceil(position)
+    return sorted_samples[lower] + (sorted_samples[upper] - sorted_samples[lower]) * (position - lower)
+
+class BenchmarkResult:
+    def __init__(self, name: str, samples: list[int]):
+        '''Construct a BenchmarkResult object. A BenchmarkResult object holds the time taken by each
+        operation of a benchmark, grouped into the rounds the operations were timed in.
+
+        Args:
+            name - A string representing the name of the benchmark.
+            samples - A list of integers representing the time taken by each operation in the first 
+                    round, in nanoseconds.
+        '''
+        self.name = name
+        self.rounds = [samples]
+        self.samples = list(samples)
+
+    def get_name(self) -> str:
+        '''Return the name of the benchmark.'''
+        return self.name
+
+    def get_samples(self) -> list[int]:
+        '''Return a list of integers representing the time taken by each operation, in nanoseconds.'''
+        return self.samples
+
+    def get_rounds(self) -> list[list[int]]:
+        '''Return a 2-dimensional list of integers containing the time taken by each operation in each
+        round, in nanoseconds.'''
+        return self.rounds
+
+    def add_round(self, result: 'BenchmarkResult') -> None:
+        '''Add the operations timed in another round of the benchmark.
+
+        Args:
+            result - A BenchmarkResult object containing the operations timed in the round.
+        '''
+        self.rounds.extend(result.get_rounds())
+        self.samples.extend(result.get_samples())
+
+    def get_ops_per_second(self) -> float:
+        '''Return the number of operations per second, over all the operations timed.'''
+        return len(self.samples) * 1e9 / max(sum(self.samples), 1)
+
+    def get_percentiles(self) -> dict[str, float]:
+        '''Return a dictionary mapping the percentile names, such as p50, to the time taken by an 
+        operation at that percentile, in nanoseconds.'''
+        sorted_samples = sorted(self.samples)
+        return {f"p{percentile}":get_percentile(sorted_samples, percentile) for percentile in PERCENTILES}
+
+    def to_dict(self) -> dict:
+        '''Return a dictionary of the results that can be written as JSON. The times are in nanoseconds.'''
+        return {"iterations":len(self.samples), 
+                "ops_per_second":self.get_ops_per_second(),
+                "mean_ns":sum(self.samples) / len(self.samples),
+                "min_ns":min(self.samples),
+                "max_ns":max(self.samples),
+                **{f"{name}_ns":value for name, value in self.get_percentiles().items()},
+                "rounds_ns":self.rounds}
+
+def measure(name: str, setup: Callable[[], tuple], operation: Callable, iterations: int, 
+            warmup: int=0) -> BenchmarkResult:
+    '''Time each call of the operation, and return the results. The setup function is called before
+    each operation and is not timed; the operation is called with the values it returns. Garbage
+    collection is disabled while the operations are timed.
+
+    Args:
+        name - A string representing the name of the benchmark.
+        setup - A function returning a tuple of the arguments of the operation.
+        operation - The function being timed.
+        iterations - An integer representing the number of operations to time.
+        warmup - An integer representing the number of operations called before timing starts. 
+                Default is 0.
+
+    Raises: ValueError when the number of iterations is not a positive integer.
+    '''
+    if iterations<=0:
+        raise ValueError(f"The number of iterations '{iterations}' must be a positive integer.")
+
+    for _ in range(warmup):
+        operation(*setup())
+
+    samples = list()
+    timer = time.perf_counter_ns
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(iterations):
+            args = setup()
+            start = timer()
+            operation(*args)
+            samples.append(timer() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return BenchmarkResult(name, samples)
@@ -1,14 +1,22 @@
+from game.events import EVENT
+from game.instrumentation import PHASE
 from game.interface.simulation import SimulationInterface
 
 class LandlordGame(SimulationInterface):
-    def __init__(self, players):
+    def __init__(self, players, rng=None, phase_timer=None, event_sink=None):
         '''Construct a Landlord Game object.
         
         Args:
             players - A list of Player objects that represent the players
                     in the game.
+            rng - A random number generator shared by the deck and the players.
+                    Default is None, see SimulationInterface.
+            phase_timer - A PhaseTimer object recording the time spent in each phase
+                    of the game. Default is None, see SimulationInterface.
+            event_sink - An EventSink object receiving the events of the game.
+                    Default is None, see SimulationInterface.
         '''
-        super().__init__(players)
+        super().__init__(players, rng, phase_timer, event_sink)
 
     def play(self) -> bool:
         '''Play a round of Landlord. True is returned if a round can be
@@ -16,33 +24,35 @@ class LandlordGame(SimulationInterface):
         if self.has_game_ended():
             return False
         
+        start = self.phase_timer.start()
         wildcards = self.deal_cards_to_players()
 
         if self.all_players_passed_during_bidding():
             self.reset() 
+            self.phase_timer.stop(PHASE.ROUND, start)
 
             return False
         else:
             # execute the bidding round
             if not self._execute_bidding():
                 self.reset() 
+                self.phase_timer.stop(PHASE.ROUND, start)
 
                 return False
             
-            # reveal wildcards to all players at the end of bidding 
-            print(wildcards)
-
             # add cards to the landlords cards.
             self.give_landlord_wildcards(wildcards)
 
             # play round
             # get play order
             order = self.gameplay_engine.get_play_order(self.get_landlord(), self.get_peasants())
-            winner, total_stake = self.gameplay_engine.play_round(order, self.get_round_stake())
+            winner, total_stake = self.gameplay_engine.play_round(order, self.get_round_stake(), wildcards)
+            self.event_sink.emit(EVENT.PLAY, winner=self.players.index(winner), stake=total_stake)
             self.update_players_stake(winner, total_stake)
 
             # round ends, prepare next round.
             self.reset()
+            self.phase_timer.stop(PHASE.ROUND, start)
 
             return True
     
\ No newline at end of file
@@ -1,17 +1,23 @@
 import misc.constants as const
 import misc.helpers as hlpr
 
+CARD_POINTS_MAP = hlpr.get_fibonacci_sequence_hash_map()
+
 class Card:
+    __slots__ = ('_number', '_suit', '_points', '_repr')
+
     def __init__(self, number: int, suit: str):
-        '''Construct a Card object.
-        
+        '''Construct a Card object. Card objects are immutable, so the cards in the deck
+        are created once and shared, see get_card().
+
         Args:
-            number - An integer representing the card number. 
-            suit - A string representing the card suit. 
+            number - An integer representing the card number.
+            suit - A string representing the card suit.
         '''
-        self._number = number
-        self._suit = suit 
-        self._points = self._get_card_points_value(self.get_number()) 
+        object.__setattr__(self, '_number', number)
+        object.__setattr__(self, '_suit', suit)
+        object.__setattr__(self, '_points', self._get_card_points_value(number))
+        object.__setattr__(self, '_repr', self._get_card_repr(number))
 
     def get_number(self) -> int:
         '''Return an integer representing the card number.'''
@@ -28,22 +34,65 @@ class Card:
     def _get_card_points_map(self) -> dict[int:int]:
         '''Return a hash table that maps card number keys to a number representing
         the amount of points the card represents.'''
-        return hlpr.get_fibonacci_sequence_hash_map()
+        return CARD_POINTS_MAP
 
     def _get_card_points_value(self, card_number: int) -> int:
         '''Return an integer representing the value of the individual card.
-        
+
         Args:
-            card_number - The number of the card to return the points value for. 
+            card_number - The number of the card to return the points value for.
         '''
         return self._get_card_points_map()[card_number]
-    
-    def __repr__(self):
-        if self.get_number()==1 or self.get_number()>10:
-            return const.SPECIAL_CARDS_MAP[self.get_number()]
+
+    def _get_card_repr(self, card_number: int) -> str:
+        '''Return a string representing the card number.
+
+        Args:
+            card_number - The number of the card to return the representation for.
+        '''
+        if card_number==1 or card_number>10:
+            return const.SPECIAL_CARDS_MAP[card_number]
         else:
-            return str(self.get_number())
+            return str(card_number)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Card objects are immutable, '{name}' cannot be set.")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Card objects are immutable, '{name}' cannot be deleted.")
+
+    def __repr__(self):
+        return self._repr
 
     def __str__(self):
-        return self.__repr__()
-    
\ No newline at end of file
+        return self._repr
+
+def _create_card_universe() -> tuple[Card]:
+    '''Return a tuple containing the 54 Card objects in a deck of cards, in the order
+    the cards are added to a new deck.'''
+    cards = list()
+    for number in range(1, 14):
+        for suit in const.SUITS:
+            cards.append(Card(number, suit))
+
+    cards.append(Card(14, const.JOKER_SUIT))
+    cards.append(Card(15, const.JOKER_SUIT))
+
+    return tuple(cards)
+
+CARDS = _create_card_universe()
+_CARDS_BY_KEY = {(card.get_number(), card.get_suit()):card for card in CARDS}
+
+def get_card(number: int, suit: str) -> Card:
+    '''Return the shared Card object for the provided card number and suit. A new Card
+    object is only created when the card is not part of the deck of cards.
+
+    Args:
+        number - An integer representing the card number.
+        suit - A string representing the card suit.
+    '''
+    card = _CARDS_BY_KEY.get((number, suit))
+    if card is None:
+        return Card(number, suit)
+
+    return card
@@ -0,0 +1,154 @@
+import misc.constants as const
+from game.core.card import Card, CARDS
+
+# Each rank owns a 4-bit slot in the mask, ordered from the lowest ranking card
+# (three) to the highest ranking card (red joker). A card's bit within its slot is
+# given by its suit, so the 54 cards fit into the lowest 57 bits of the integer.
+BITS_PER_RANK = 4
+RANK_SLOT = (1 << BITS_PER_RANK) - 1
+
+def get_card_index(number: int, suit: str) -> int:
+    '''Return an integer representing the position of the card in the card set mask.
+
+    Args:
+        number - An integer representing the card number.
+        suit - A string representing the card suit.
+
+    Raises: ValueError when the number or suit is not part of the deck of cards.
+    '''
+    if number not in const.RANK_INDEX:
+        raise ValueError(f"The card number '{number}' is not part of the deck of cards.")
+
+    rank = const.RANK_INDEX[number]
+    if number==14 or number==15:
+        return rank * BITS_PER_RANK
+
+    if suit not in const.SUITS:
+        raise ValueError(f"The card suit '{suit}' is not part of the deck of cards.")
+
+    return rank * BITS_PER_RANK + const.SUITS.index(suit)
+
+CARDS_BY_INDEX = {get_card_index(card.get_number(), card.get_suit()):card for card in CARDS}
+_INDEX_BY_CARD = {card:index for index, card in CARDS_BY_INDEX.items()}
+
+class CardSet:
+    __slots__ = ('_mask',)
+
+    def __init__(self, mask: int=0):
+        '''Construct a CardSet object. A CardSet object represents a collection of distinct
+        cards as a single integer, where each bit marks a card in the deck.
+
+        Args:
+            mask - An integer where each set bit represents a card in the set. Default is 0.
+        '''
+        self._mask = mask
+
+    @classmethod
+    def from_cards(cls, cards: list[Card]) -> 'CardSet':
+        '''Return a CardSet object containing the provided cards. Repeated cards are
+        only added to the set once.
+
+        Args:
+            cards - A list of Card objects.
+        '''
+        mask = 0
+        for card in cards:
+            index = _INDEX_BY_CARD.get(card)
+            if index is None:
+                index = get_card_index(card.get_number(), card.get_suit())
+
+            mask |= 1 << index
+
+        return cls(mask)
+
+    def get_mask(self) -> int:
+        '''Return the integer representing the cards in the set.'''
+        return self._mask
+
+    def get_cards(self) -> list[Card]:
+        '''Return a list of Card objects in the set, ordered from the lowest to the
+        highest ranking card.'''
+        cards = list()
+        mask = self._mask
+        while mask:
+            lowest_bit = mask & -mask
+            cards.append(CARDS_BY_INDEX[lowest_bit.bit_length()-1])
+            mask ^= lowest_bit
+
+        return cards
+
+    def get_rank_counts(self) -> tuple[int]:
+        '''Return a tuple of 15 integers, where each integer is the number of cards
+        in the set for the rank at that index.'''
+        mask = self._mask
+        return tuple(((mask >> (rank * BITS_PER_RANK)) & RANK_SLOT).bit_count()
+                     for rank in range(const.TOTAL_RANKS))
+
+    def get_rank_count(self, number: int) -> int:
+        '''Return the number of cards in the set with the provided card number.
+
+        Args:
+            number - An integer representing the card number.
+        '''
+        rank = const.RANK_INDEX[number]
+        return ((self._mask >> (rank * BITS_PER_RANK)) & RANK_SLOT).bit_count()
+
+    def union(self, other: 'CardSet') -> 'CardSet':
+        '''Return a CardSet object containing the cards in either set.
+
+        Args:
+            other - A CardSet object.
+        '''
+        return CardSet(self._mask | other._mask)
+
+    def difference(self, other: 'CardSet') -> 'CardSet':
+        '''Return a CardSet object containing the cards in this set that are not
+        in the other set.
+
+        Args:
+            other - A CardSet object.
+        '''
+        return CardSet(self._mask & ~other._mask)
+
+    def intersection(self, other: 'CardSet') -> 'CardSet':
+        '''Return a CardSet object containing the cards found in both sets.
+
+        Args:
+            other - A CardSet object.
+        '''
+        return CardSet(self._mask & other._mask)
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __len__(self):
+        return self._mask.bit_count()
+
+    def __bool__(self):
+        return self._mask!=0
+
+    def __contains__(self, card):
+        try:
+            index = get_card_index(card.get_number(), card.get_suit())
+        except ValueError:
+            return False
+
+        return (self._mask >> index) & 1==1
+
+    def __iter__(self):
+        return iter(self.get_cards())
+
+    def __eq__(self, other):
+        return isinstance(other, CardSet) and self._mask==other._mask
+
+    def __hash__(self):
+        return hash(self._mask)
+
+    def __repr__(self):
+        return str(self.get_cards())
@@ -0,0 +1,65 @@
+import numpy as np
+from game.core.card import CARDS
+from game.core.cardset import CardSet, get_card_index
+
+# the bit of each shared Card object in a card set mask.
+CARD_BITS = np.array([1 << get_card_index(card.get_number(), card.get_suit()) for card in CARDS], dtype=np.uint64)
+
+CARDS_PER_PLAYER = 17
+TOTAL_PLAYERS = 3
+DEFAULT_POOL_SIZE = 4096
+
+class DealPool:
+    def __init__(self, size: int=DEFAULT_POOL_SIZE, seed: int or np.random.Generator=None):
+        '''Construct a DealPool object. A DealPool object shuffles many decks at once as a matrix of 
+        permutations, and stores each deal as the card set masks of the three players' cards and the
+        wildcards. Deals are handed out one at a time, and a new batch is generated when the pool 
+        runs out.
+
+        Args:
+            size - An integer representing the number of deals generated at a time. Default is 
+                    DEFAULT_POOL_SIZE.
+            seed - An integer used to seed the random number generator, or a NumPy Generator object.
+                    Default is None, which seeds the generator from the operating system.
+
+        Raises: ValueError when the size is not a positive integer.
+        '''
+        if size<=0:
+            raise ValueError(f"The pool size '{size}' must be a positive integer.")
+
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.deals = list()
+        self.position = 0
+
+    def get_size(self) -> int:
+        '''Return the number of deals generated at a time.'''
+        return self.size
+
+    def next_deal(self) -> tuple[CardSet, CardSet, CardSet, CardSet]:
+        '''Return the next deal in the pool as four CardSet objects, where the first three sets 
+        contain the players' 17 cards and the final set contains the 3 wildcards.'''
+        if self.position==len(self.deals):
+            self.deals = self._generate_deals()
+            self.position = 0
+
+        p1, p2, p3, wildcards = self.deals[self.position]
+        self.position += 1
+        return CardSet(p1), CardSet(p2), CardSet(p3), CardSet(wildcards)
+
+    def _generate_deals(self) -> list[tuple[int]]:
+        '''Return a list of tuples containing the card set masks of the players' cards and the 
+        wildcards for a batch of deals.'''
+        decks = self.rng.permuted(np.tile(np.arange(len(CARDS)), (self.size, 1)), axis=1)
+        card_bits = CARD_BITS[decks]
+        masks = np.empty((self.size, TOTAL_PLAYERS+1), dtype=np.uint64)
+        for player in range(TOTAL_PLAYERS):
+            start = player * CARDS_PER_PLAYER
+            masks[:, player] = np.bitwise_or.reduce(card_bits[:, start:start+CARDS_PER_PLAYER], axis=1)
+
+        masks[:, TOTAL_PLAYERS] = np.bitwise_or.reduce(card_bits[:, TOTAL_PLAYERS*CARDS_PER_PLAYER:], axis=1)
+        # tolist() converts the masks to Python integers in a single call.
+        return [tuple(deal) for deal in masks.tolist()]
+
+    def __len__(self):
+        return len(self.deals) - self.position
@@ -1,18 +1,134 @@
 import misc.constants as const
 import misc.helpers as hlpr
+import math
 import random
-from game.core.card import Card
+from game.core.card import Card, CARDS, get_card
+from game.core.cardset import CardSet
+
+CARDS_PER_PLAYER = 17
+TOTAL_WILDCARDS = 3
+# the number of cards in each part of a deal: the three players' cards and the wildcards.
+DEAL_SIZES = (CARDS_PER_PLAYER, CARDS_PER_PLAYER, CARDS_PER_PLAYER, TOTAL_WILDCARDS)
+# the number of distinct deals, and the number of bytes needed to store the rank of any deal.
+TOTAL_DEALS = math.factorial(len(CARDS)) // math.prod(math.factorial(size) for size in DEAL_SIZES)
+DEAL_BYTES = (TOTAL_DEALS.bit_length() + 7) // 8
+# the card set mask of each shared Card object.
+_CARD_MASKS = [CardSet.from_cards([card]).get_mask() for card in CARDS]
+
+def encode_deal(player1: list[Card] or CardSet, player2: list[Card] or CardSet, player3: list[Card] or CardSet, 
+                wildcards: list[Card] or CardSet) -> int:
+    '''Return the rank of a deal, an integer from 0 to TOTAL_DEALS-1 that identifies the deal. Each card 
+    in the deck, in the order of the shared Card objects, is assigned to one of the four parts of the 
+    deal, and the deal is ranked among all assignments with the same part sizes. The rank can be stored 
+    in DEAL_BYTES bytes with int.to_bytes(), and is converted back to the deal with decode_deal().
+
+    Args:
+        player1 - A list of Card objects or a CardSet object representing the first players' cards.
+        player2 - A list of Card objects or a CardSet object representing the second players' cards.
+        player3 - A list of Card objects or a CardSet object representing the third players' cards.
+        wildcards - A list of Card objects or a CardSet object representing the wildcards.
+
+    Raises: ValueError when the cards are not a deal of the deck of cards.
+    '''
+    card_sets = [part if isinstance(part, CardSet) else CardSet.from_cards(part) 
+                 for part in (player1, player2, player3, wildcards)]
+    masks = [card_set.get_mask() for card_set in card_sets]
+    if tuple(map(len, card_sets))!=DEAL_SIZES or len(CardSet(masks[0] | masks[1] | masks[2] | masks[3]))!=len(CARDS):
+        raise ValueError("The cards are not a deal of the deck of cards. Each player must have 17 cards and "
+                         "the remaining 3 cards must be wildcards.")
+
+    remaining, total_deals = list(DEAL_SIZES), TOTAL_DEALS
+    rank = 0
+    for total_cards, card_mask in zip(range(len(CARDS), 0, -1), _CARD_MASKS):
+        for part, mask in enumerate(masks):
+            # the number of deals where the card is in this part, given the cards already placed.
+            part_deals = total_deals * remaining[part] // total_cards
+            if mask & card_mask:
+                remaining[part] -= 1
+                total_deals = part_deals
+                break
+
+            rank += part_deals
+
+    return rank
+
+def decode_deal(rank: int) -> tuple[list[Card], list[Card], list[Card], list[Card]]:
+    '''Return the deal with the provided rank, see encode_deal(). Returns four lists containing Card 
+    objects, where the first three lists contain the players' cards, and the final list contains the
+    wildcards.
+
+    Args:
+        rank - An integer from 0 to TOTAL_DEALS-1 representing the rank of the deal.
+
+    Raises: ValueError when the rank is not the rank of a deal.
+    '''
+    if not 0<=rank<TOTAL_DEALS:
+        raise ValueError(f"The deal rank '{rank}' must be between 0 and {TOTAL_DEALS-1}.")
+
+    deal = tuple(list() for _ in DEAL_SIZES)
+    remaining, total_deals = list(DEAL_SIZES), TOTAL_DEALS
+    for total_cards, card in zip(range(len(CARDS), 0, -1), CARDS):
+        for part in range(len(DEAL_SIZES)):
+            part_deals = total_deals * remaining[part] // total_cards
+            if rank<part_deals:
+                deal[part].append(card)
+                remaining[part] -= 1
+                total_deals = part_deals
+                break
+
+            rank -= part_deals
+
+    return deal
+
+def sample_deal(rng: random.Random=None) -> tuple[list[Card], list[Card], list[Card], list[Card]]:
+    '''Return a deal chosen uniformly at random, by decoding a random rank, see decode_deal().
+
+    Args:
+        rng - A random number generator providing the randrange() method of random.Random. Default
+                is None, which uses the global random module.
+    '''
+    return decode_deal((rng or random).randrange(TOTAL_DEALS))
 
 class CardDeck:
-    def __init__(self):
+    def __init__(self, rng: random.Random=None, pool=None):
         '''Construct a deck of cards where individual cards in the deck 
-        are represented as Card objects.'''
+        are represented as Card objects.
+        
+        Args:
+            rng - A random number generator used to shuffle the deck, such as a random.Random
+                    object. Default is None, which uses the global random module.
+            pool - A DealPool object the deals are taken from, see set_pool(). Default is None.
+        '''
+        self.set_rng(rng)
+        self.set_pool(pool)
         self.reset()
 
+    def set_rng(self, rng: random.Random or None) -> None:
+        '''Set the random number generator used to shuffle the deck. The generator must provide
+        the shuffle() method of random.Random.
+
+        Args:
+            rng - A random number generator, or None to use the global random module.
+        '''
+        self.rng = random if rng is None else rng
+
+    def set_pool(self, pool) -> None:
+        '''Set the deal pool the deals are taken from. When a pool is set, shuffling the deck does
+        nothing, and each deal is the next pre-generated deal in the pool, see dealpool.DealPool.
+
+        Args:
+            pool - A DealPool object, or None to shuffle and deal the deck.
+        '''
+        self.pool = pool
+
     def get_card_deck(self) -> list[Card]:
         '''Return a list of Card objects representing the deck of cards.'''
         return self._deck
 
+    def get_card_set(self) -> CardSet:
+        '''Return a CardSet object containing the cards in the deck.'''
+        return CardSet.from_cards(self.get_card_deck())
+
     def add_card_to_deck(self, card_number: int, suit: str):
         '''Add a card to the deck.
         
@@ -23,11 +139,15 @@ class CardDeck:
         if card_number<=0 or card_number>15:
             return 
             
-        self.get_card_deck().append(Card(number=card_number, suit=suit))
+        self.get_card_deck().append(get_card(card_number, suit))
 
     def shuffle(self):
-        '''Randomly shuffle the card deck.'''
-        random.shuffle(self.get_card_deck()) 
+        '''Randomly shuffle the card deck. The deck is not shuffled when a deal pool is set, as 
+        the deals in the pool are already shuffled.'''
+        if self.pool is not None:
+            return
+
+        self.rng.shuffle(self.get_card_deck()) 
     
     def deal(self) -> list[Card]:
         '''Deal the cards to the three players in the game. Each player
@@ -35,10 +155,16 @@ class CardDeck:
 
         Returns four lists containing Card objects, where the first three sets 
         contain players' cards, and the final set containing the wildcard deck.
+        When a deal pool is set, four CardSet objects are returned instead.
         '''
         if len(self.get_card_deck())<54:
             return list(), list(), list(), list()
 
+        if self.pool is not None:
+            player1, player2, player3, wildcards = self.pool.next_deal()
+            self._deck = wildcards.get_cards()
+            return player1, player2, player3, wildcards
+
         player1, player2, player3 = list(), list(), list()
         for i in range(17*3):
             card = self.get_card_deck().pop()
@@ -52,11 +178,6 @@ class CardDeck:
         return player1, player2, player3, self.get_card_deck()
     
     def reset(self):
-        '''Reset the card deck.'''
-        self._deck = []
-        for num in range(1, 14):
-            for suit in ["hearts", "diamonds", "clubs", "spades"]:
-                self.add_card_to_deck(num, suit)
-
-        self.add_card_to_deck(14, "joker")
-        self.add_card_to_deck(15, "joker")
\ No newline at end of file
+        '''Reset the card deck. The deck is refilled with the shared Card objects, so
+        no new Card objects are created.'''
+        self._deck = list(CARDS)
\ No newline at end of file
@@ -1,41 +1,242 @@
-from collections import Counter, defaultdict
+from collections import Counter
+from collections.abc import Iterator
+import itertools
 import random
+import misc.constants as const
 from misc.constants import CARD_CATEGORY as CATEGORY
 import game.rules as rules
-from game.core.card import Card 
+from game.core.card import Card, CARD_POINTS_MAP
+from game.core.cardset import CardSet
+from game.core.moveindex import MoveIndex
+from game.instrumentation import PHASE, NULL_TIMER, NULL_MOVE_STATS, MoveStats, PhaseTimer
+
+# maps the categories containing trios to the number of cards in the hand for each trio. 
+CARDS_PER_TRIO = {CATEGORY.TRIO_CHAIN:3, CATEGORY.TRIO_WITH_SOLO:4, CATEGORY.TRIO_WITH_PAIR:5, 
+    CATEGORY.AIRPLANE_WITH_SOLO:4, CATEGORY.AIRPLANE_WITH_PAIR:5}
+
+# the probability of leading with a single card, see CardHand.set_random_hand().
+PLAY_SINGLE_PROB = 0.3
+
+# the number of cards of each rank in a chain, and the minimum and maximum number of ranks in the chain.
+CHAIN_LENGTHS = {CATEGORY.SOLO_CHAIN:(1, 5, 12), CATEGORY.PAIR_CHAIN:(2, 3, 10), CATEGORY.TRIO_CHAIN:(3, 2, 6)}
+
+def get_rank_counts(cards: list[Card] or CardSet) -> tuple[int]:
+    '''Return a tuple of 15 integers representing the number of cards of each rank in the cards.
+
+    Args:
+        cards - A list of Card objects or a CardSet object.
+    '''
+    if isinstance(cards, CardSet):
+        return cards.get_rank_counts()
+
+    rank_counts = [0] * const.TOTAL_RANKS
+    for card in cards:
+        rank_counts[const.RANK_INDEX[card.get_number()]] += 1
+
+    return tuple(rank_counts)
+
+def generate_hand_rank_counts(rank_counts: tuple[int], 
+                              previous_hand_class: tuple[int, int, int] or None=None) -> Iterator[tuple[int]]:
+    '''Yield the rank counts of every card hand that can be played from the provided cards. The hands
+    are produced one at a time, so the complete set of hands is never held in memory. Each hand is
+    yielded once, and every hand yielded is recognised by rules.classify().
+
+    When the previous hand is given, only the hands that beat it are produced: hands of the same 
+    category and length with a higher comparison rank, bombs and the rocket, see rules.can_beat().
+
+    Args:
+        rank_counts - A tuple of 15 integers representing the number of cards of each rank in the
+                    players' cards, see CardHand.get_rank_counts().
+        previous_hand_class - A tuple containing the card category, the comparison rank and the number 
+                    of cards in the previous hand, see rules.classify(). Default is None.
+    '''
+    if previous_hand_class is rules.NOT_A_HAND:
+        for category in range(CATEGORY.SOLO, CATEGORY.ROCKET+1):
+            yield from _generate_category_rank_counts(rank_counts, category)
+        return
+
+    category, rank, length = previous_hand_class
+    if category==CATEGORY.ROCKET:
+        return
+
+    yield from _generate_category_rank_counts(rank_counts, category, rank, length)
+    if category!=CATEGORY.BOMB:
+        yield from _generate_category_rank_counts(rank_counts, CATEGORY.BOMB)
+    yield from _generate_category_rank_counts(rank_counts, CATEGORY.ROCKET)
+
+def _generate_category_rank_counts(rank_counts: tuple[int], category: int, above_rank: int=-1, 
+                                   length: int=None) -> Iterator[tuple[int]]:
+    '''Yield the rank counts of every card hand in the category that can be played from the provided
+    cards.
+
+    Args:
+        rank_counts - A tuple of 15 integers representing the number of cards of each rank in the
+                    players' cards.
+        category - An integer representing the card category of the hands.
+        above_rank - An integer representing the rank index the comparison rank of each hand must be
+                    above. Default is -1.
+        length - An integer representing the number of cards in each hand. Default is None, which 
+                    produces hands of every length.
+    '''
+    def hand_of(ranks_and_counts):
+        counts = [0] * const.TOTAL_RANKS
+        for rank, count in ranks_and_counts:
+            counts[rank] = count
+        return tuple(counts)
+
+    def is_rocket_kicker(kickers):
+        return rules.BLACK_JOKER_RANK in kickers and rules.RED_JOKER_RANK in kickers
+
+    def ranks_with(min_count, max_rank=rules.TWO_RANK):
+        return [rank for rank in range(above_rank+1, max_rank+1) if rank_counts[rank]>=min_count]
+
+    def kicker_ranks(min_count, max_rank, excluded):
+        return [rank for rank in range(max_rank+1) if rank_counts[rank]>=min_count and rank not in excluded]
+
+    match category:
+        case CATEGORY.SOLO:
+            for rank in ranks_with(1, max_rank=rules.RED_JOKER_RANK):
+                yield hand_of([(rank, 1)])
+        case CATEGORY.PAIR:
+            for rank in ranks_with(2):
+                yield hand_of([(rank, 2)])
+        case CATEGORY.TRIO:
+            for rank in ranks_with(3):
+                yield hand_of([(rank, 3)])
+        case CATEGORY.BOMB:
+            for rank in ranks_with(4):
+                yield hand_of([(rank, 4)])
+        case CATEGORY.ROCKET:
+            if rank_counts[rules.BLACK_JOKER_RANK]>0 and rank_counts[rules.RED_JOKER_RANK]>0:
+                yield hand_of([(rules.BLACK_JOKER_RANK, 1), (rules.RED_JOKER_RANK, 1)])
+        case CATEGORY.SOLO_CHAIN | CATEGORY.PAIR_CHAIN | CATEGORY.TRIO_CHAIN:
+            # every chain ending above the rank, using the cards from three to ace. 
+            cards_per_rank, min_length, max_length = CHAIN_LENGTHS[category]
+            if length is not None:
+                min_length = max_length = length // cards_per_rank
+
+            for high in range(max(above_rank+1, min_length-1), rules.HIGHEST_CHAIN_RANK+1):
+                for low in range(high, max(high-max_length, -1), -1):
+                    if rank_counts[low]<cards_per_rank:
+                        break
+
+                    if high-low+1>=min_length:
+                        yield hand_of([(rank, cards_per_rank) for rank in range(low, high+1)])
+        case CATEGORY.TRIO_WITH_SOLO:
+            for trio in ranks_with(3):
+                for solo in kicker_ranks(1, rules.RED_JOKER_RANK, [trio]):
+                    yield hand_of([(trio, 3), (solo, 1)])
+        case CATEGORY.TRIO_WITH_PAIR:
+            # the rocket is accepted as the pair.
+            has_rocket = rank_counts[rules.BLACK_JOKER_RANK]>0 and rank_counts[rules.RED_JOKER_RANK]>0
+            for trio in ranks_with(3):
+                for pair in kicker_ranks(2, rules.TWO_RANK, [trio]):
+                    yield hand_of([(trio, 3), (pair, 2)])
+
+                if has_rocket:
+                    yield hand_of([(trio, 3), (rules.BLACK_JOKER_RANK, 1), (rules.RED_JOKER_RANK, 1)])
+        case CATEGORY.AIRPLANE_WITH_SOLO | CATEGORY.AIRPLANE_WITH_PAIR:
+            # every trio chain with every combination of distinct solo cards or pairs.
+            kicker_count = 1 if category==CATEGORY.AIRPLANE_WITH_SOLO else 2
+            max_kicker_rank = rules.RED_JOKER_RANK if kicker_count==1 else rules.TWO_RANK
+            max_trios = rules.MAX_HAND_SIZE // CARDS_PER_TRIO[category]
+            min_trios = 2
+            if length is not None:
+                min_trios = max_trios = length // CARDS_PER_TRIO[category]
+
+            for high in range(max(above_rank+1, min_trios-1), rules.HIGHEST_CHAIN_RANK+1):
+                for low in range(high, max(high-max_trios, -1), -1):
+                    if rank_counts[low]<3:
+                        break
+
+                    trios = high-low+1
+                    if trios<min_trios:
+                        continue
+
+                    chain = range(low, high+1)
+                    kickers = kicker_ranks(kicker_count, max_kicker_rank, chain)
+                    for combination in itertools.combinations(kickers, trios):
+                        if not is_rocket_kicker(combination):
+                            yield hand_of([(rank, 3) for rank in chain] + [(rank, kicker_count) for rank in combination])
+        case CATEGORY.BOMB_WITH_SOLO | CATEGORY.BOMB_WITH_PAIR:
+            # bomb with every combination of two distinct solo cards or two distinct pairs.
+            kicker_count = 1 if category==CATEGORY.BOMB_WITH_SOLO else 2
+            max_kicker_rank = rules.RED_JOKER_RANK if kicker_count==1 else rules.TWO_RANK
+            for bomb in ranks_with(4):
+                for combination in itertools.combinations(kicker_ranks(kicker_count, max_kicker_rank, [bomb]), 2):
+                    if not is_rocket_kicker(combination):
+                        yield hand_of([(bomb, 4)] + [(rank, kicker_count) for rank in combination])
 
 class CardHand:
-    def __init__(self):
+    def __init__(self, rng: random.Random=None):
         '''Construct a CardHand object. A CardHand object represents a player's
         hand in a card game. 
+
+        Args:
+            rng - A random number generator used to choose random hands, such as a random.Random 
+                    object. Default is None, which uses the global random module.
         '''
+        self.set_rng(rng)
+        self.phase_timer = NULL_TIMER
+        self.move_stats = NULL_MOVE_STATS
         self.reset()
 
+    def set_rng(self, rng: random.Random or None) -> None:
+        '''Set the random number generator used to choose random hands. The generator must provide 
+        the random() and choice() methods of random.Random.
+
+        Args:
+            rng - A random number generator, or None to use the global random module.
+        '''
+        self.rng = random if rng is None else rng
+
+    def set_phase_timer(self, phase_timer: PhaseTimer or None) -> None:
+        '''Set the timer recording the time spent generating and filtering hands, see instrumentation.PhaseTimer.
+
+        Args:
+            phase_timer - A PhaseTimer object, or None to stop recording.
+        '''
+        self.phase_timer = NULL_TIMER if phase_timer is None else phase_timer
+
+    def set_move_stats(self, move_stats: MoveStats or None) -> None:
+        '''Set the statistics counting the candidate hands considered each time a hand is chosen, see
+        instrumentation.MoveStats.
+
+        Args:
+            move_stats - A MoveStats object, or None to stop counting.
+        '''
+        self.move_stats = NULL_MOVE_STATS if move_stats is None else move_stats
+
     def set_hand(self, hand: list[Card], previous_hand: list[Card]=None, valid_hands: list[Card]=None) -> None:
         '''Set the selected cards as the player's card hand. If previous_hand is given, valid_hands
-        parameter is needed to set a hand of the same card category as the previous hand, if possible.
-        Otherwise no hand will be set. 
+        parameter is needed to set a hand that beats the previous hand, if possible. Otherwise no hand 
+        will be set. 
         
         Args:
             hand - A list of Card objects representing the players' hand. 
             previous_hand - A list of Card objects representing the hand last played. Default is None.
-            valid_hands - A collection of list of Card objects representing the availble hands the player
-                        has access to. Default is None.
+            valid_hands - A collection, or a generator, of list of Card objects representing the availble 
+                        hands the player has access to. Default is None.
         '''
         if previous_hand and valid_hands:
-            category = self.get_hand_category(previous_hand)
-            previous_hand_score = self.get_hand_score(previous_hand)
-
-            possible_hands = list()
-            for hand in (valid_hands):
-                if ((self.get_hand_category(hand)==category and self.get_hand_score(hand)>previous_hand_score) 
-                            or self.get_hand_category(hand)==CATEGORY.ROCKET or self.get_hand_category(hand)==CATEGORY.BOMB):
-                    possible_hands.append(hand)
-            
-            if len(possible_hands)>0:
-                self.set_hand(random.choice(possible_hands))
+            start = self.phase_timer.start()
+            previous_hand_class = self.get_hand_class(previous_hand)
+            # the hands are read before they are filtered, so counting them does not use up a generator.
+            if self.move_stats.is_enabled():
+                valid_hands = list(valid_hands)
+            possible_hands = (hand for hand in valid_hands 
+                              if rules.can_beat(self.get_hand_class(hand), previous_hand_class))
+            if self.move_stats.is_enabled():
+                possible_hands = list(possible_hands)
+                self.move_stats.record_turn(self._count_categories(valid_hands), len(possible_hands))
+
+            hand = self._choose_random_hand(possible_hands)
+            if hand is not None:
+                self.set_hand(hand)
+            self.phase_timer.stop(PHASE.FILTER, start)
         else:
             self.current_hand = hand
+            self.classified_hand = None
 
     def get_hand(self) -> list[Card] or None:
         '''Returns the players' hand. Default is None if no hand is set.'''
@@ -49,45 +250,71 @@ class CardHand:
         if not self.get_hand():
             return False
 
-        number_freq = self.get_card_number_frequency_map(self.current_hand)
-        match len(self.get_hand()):
-            case 1:
-                return rules.is_solo(number_freq)
-            case 2:
-                return (rules.is_pair(number_freq) or 
-                       rules.is_rocket(number_freq))
-            case 3: 
-                return rules.is_trio(number_freq)
-            case _:
-                return (rules.is_bomb(number_freq) or 
-                        rules.is_combination(number_freq) or 
-                        rules.is_chain(number_freq))
+        start = self.phase_timer.start()
+        is_valid = self.get_hand_class(self.get_hand()) is not rules.NOT_A_HAND
+        self.phase_timer.stop(PHASE.FILTER, start)
+        return is_valid
+
+    def get_hand_class(self, hand: list[Card]) -> tuple[int, int, int] or None:
+        '''Return a tuple containing the card category, the comparison rank and the number of cards
+        in the hand, or None if the hand is not a recognised category. The result for the players' 
+        current hand is kept until a new hand is set.
+
+        Args:
+            hand - A list of Card objects representing a card hand.
+        '''
+        if hand is self.classified_hand:
+            return self.hand_class
+
+        hand_class = rules.classify(self.get_rank_counts(hand))
+        if hand is self.current_hand:
+            self.classified_hand, self.hand_class = hand, hand_class
+
+        return hand_class
 
     def get_hand_score(self, hand: list[Card]) -> int:  
         '''Calculate the score of the player's current hand.
         
         Args:
             hand - A list of Card objects representing the players' hand.
+
+        Raises: RuntimeError when the hand category is not recognised. 
         '''
-        number_freq = self.get_card_number_frequency_map(hand)
-        category = rules.get_hand_category(number_freq)
+        hand_class = self.get_hand_class(hand)
+        if hand_class is rules.NOT_A_HAND:
+            msg = f"The card sequence {hand} is not a recognised category."
+            raise RuntimeError(msg)
+
+        self.hand_score = self._get_score(hand, hand_class)
+        return self.hand_score
+
+    def _get_score(self, hand: list[Card], hand_class: tuple[int, int, int]) -> int:
+        '''Return the score of a card hand that has already been classified.
+        
+        Args:
+            hand - A list of Card objects representing a card hand.
+            hand_class - A tuple containing the card category, the comparison rank and the number
+                        of cards in the hand, see get_hand_class().
+        '''
+        category, rank, length = hand_class
         match category:
             case CATEGORY.SOLO | CATEGORY.SOLO_CHAIN:
-                self.hand_score = sum([card.get_points() for card in hand])
+                return sum([card.get_points() for card in hand])
             case CATEGORY.PAIR | CATEGORY.PAIR_CHAIN:
-                self.hand_score = sum([card.get_points() for card in hand]) * 2
+                return sum([card.get_points() for card in hand]) * 2
             case CATEGORY.TRIO:
-                self.hand_score = sum([card.get_points() for card in hand]) * 3
+                return sum([card.get_points() for card in hand]) * 3
             case (CATEGORY.TRIO_CHAIN | CATEGORY.TRIO_WITH_SOLO | 
                     CATEGORY.TRIO_WITH_PAIR | CATEGORY.AIRPLANE_WITH_SOLO | 
                     CATEGORY.AIRPLANE_WITH_PAIR):
-                self.hand_score = sum([card.get_points() for card in hand if number_freq[card.get_number()]==3]) * 3
+                # only the trios count towards the score, which end at the comparison rank.
+                trios = length // CARDS_PER_TRIO[category]
+                trio_points = sum([CARD_POINTS_MAP[const.RANK_ORDER[trio_rank]] for trio_rank in range(rank-trios+1, rank+1)])
+                return trio_points * 3 * 3
             case CATEGORY.BOMB | CATEGORY.BOMB_WITH_SOLO | CATEGORY.BOMB_WITH_PAIR:
-                self.hand_score = sum([card.get_points() for card in hand]) * 5
+                return sum([card.get_points() for card in hand]) * 5
             case _:
-                self.hand_score = sum([card.get_points() for card in hand]) * 10
-
-        return self.hand_score
+                return sum([card.get_points() for card in hand]) * 10
 
     def get_card_number_frequency_map(self, hand: list[Card]) -> Counter[int:int]:
         '''Return a hash map mapping card numbers in the hand to the frequency the numbers
@@ -98,18 +325,31 @@ class CardHand:
         '''
         return Counter([card.get_number() for card in hand])
 
-    def set_random_hand(self, cards: list[Card], previous_hand: list[Card]=None) -> list[Card] or None:
-        '''Chooses a random hand given the players' cards. If the previous hand is given, a card of the same
-        category as the previous hand will be choosen, or no hand will be selected if there are no cards in the same
-        category.
+    def get_rank_counts(self, hand: list[Card]) -> tuple[int]:
+        '''Return a tuple of 15 integers representing the number of cards of each rank in the hand,
+        ordered from the lowest ranking card (three) to the highest ranking card (red joker).
+        
+        Args:
+            hand - A list of Card objects representing the players' hand. 
+        '''
+        return get_rank_counts(hand)
+
+    def set_random_hand(self, cards: list[Card] or CardSet or MoveIndex, previous_hand: list[Card]=None) -> list[Card] or None:
+        '''Chooses a random hand given the players' cards. If the previous hand is given, a hand that beats the
+        previous hand will be choosen, or no hand will be selected if there are no hands that beat it, see 
+        rules.can_beat(). Otherwise a single card is played with the probability PLAY_SINGLE_PROB, and any
+        other hand is chosen from the hands that are not solos, or a single card when there are none.
 
         Args:
-            card - A list of Card objects representing the players' cards.
+            card - A list of Card objects, a CardSet object or a MoveIndex object representing the players' cards.
             previous_hand - A set of Card objects representing the hand previously played. Default is None. 
 
         Returns: A list of Card objects representing the cards chosen by the function. 
         '''
-        if type(cards)==list and len(cards)==0:
+        if isinstance(cards, CardSet):
+            cards = cards.get_cards()
+
+        if (type(cards)==list or isinstance(cards, MoveIndex)) and len(cards)==0:
             msg = "The list of Card objects is empty. The cards parameter must be a list of Card objects with at least one object."
             raise ValueError(msg)
 
@@ -118,73 +358,99 @@ class CardHand:
             msg = f"The cards attribute is of type '{card_type}' when it should be a list of Card objects."
             raise TypeError(msg)
 
-        freq_map = self.get_card_number_frequency_map(cards)
-        valid_hands = list()
-        solo_hands = [[card] for card in cards]
-        pair_hands, trio_hands = list(), list()
-
+        start = self.phase_timer.start()
         if not previous_hand:
-            # possibly begin the new round with a single card. 
-            PLAY_SINGLE_PROB = 0.3
-            if len(cards)==1 or random.random()<PLAY_SINGLE_PROB:
-                self.set_hand(random.choice(solo_hands))
-                return self.get_hand()
-            
-        # add rocket.
-        if 14 in freq_map.keys() and 15 in freq_map.keys():
-            valid_hands.append(self._get_rocket_hand(cards))
-        
-        # add valid bomb hand and get all valid trio and pair hands.
-        for num, freq in freq_map.items():
-            if freq==4:
-                valid_hands.append(self._get_similar_cards(cards, card_number=num, total_cards=freq))
+            # possibly begin the new round with a single card, which is not drawn with the other hands.
+            hand = None
+            if len(cards)>1 and self.rng.random()>=PLAY_SINGLE_PROB:
+                hand = self._choose_random_hand(candidate for candidate in self._generate_candidates(cards) if len(candidate)>1)
+
+            if hand is None:
+                hand = [self.rng.choice(cards if type(cards)==list else cards.get_cards())]
+            self.set_hand(hand)
+        else:
+            # set a hand that beats the previous hand, if possible.
+            hand = self._choose_random_hand(self._generate_candidates(cards, previous_hand))
+            if hand is not None:
+                self.set_hand(hand)
 
-            if freq==3:
-                trio_hands.append(self._get_similar_cards(cards, card_number=num, total_cards=freq))
+        self.phase_timer.stop(PHASE.GENERATE, start)
+        return self.get_hand()
 
-            if freq==2:
-                pair_hands.append(self._get_similar_cards(cards, card_number=num, total_cards=freq))
-        
-        if pair_hands:
-            valid_hands.extend(pair_hands)
-        if trio_hands:
-            valid_hands.extend(trio_hands)
-
-            # add trio with solo and trio with pair combination hands.
-            valid_hands.extend(self._get_all_trio_with_combination_hands(solo_hands, trio_hands))
-            if pair_hands:
-                valid_hands.extend(self._get_all_trio_with_combination_hands(pair_hands, trio_hands))
-        
-        # find chain sequences.
-        trio_chain_hands = self._get_chain_sequences(trio_hands, min_hands_needed=2, previous_hand=previous_hand)
-        if trio_chain_hands:
-            valid_hands.extend(trio_chain_hands)
+    def generate_hands(self, cards: list[Card] or CardSet or MoveIndex, previous_hand: list[Card]=None) -> Iterator[list[Card]]:
+        '''Yield every card hand that can be played from the players' cards, including every chain
+        length and every combination of solo cards and pairs played with a trio, airplane or bomb. 
+        When the previous hand is given, only the hands that beat it are produced. The hands are 
+        produced one at a time, see generate_hand_rank_counts().
 
-        pair_chain_hands = self._get_chain_sequences(pair_hands, min_hands_needed=3, previous_hand=previous_hand)
-        if pair_chain_hands:
-            valid_hands.extend(pair_chain_hands)
+        Args:
+            cards - A list of Card objects, a CardSet object or a MoveIndex object representing the players' cards.
+            previous_hand - A list of Card objects representing the hand previously played. Default is None.
+        '''
+        previous_hand_class = self.get_hand_class(previous_hand) if previous_hand else rules.NOT_A_HAND
+        move_index = cards if isinstance(cards, MoveIndex) else MoveIndex(list(cards))
+        for hand_counts in generate_hand_rank_counts(move_index.get_rank_counts(), previous_hand_class):
+            yield [card for rank, count in enumerate(hand_counts) if count 
+                   for card in move_index.get_cards_by_rank(rank)[:count]]
 
-        solo_chain_hands = self._get_chain_sequences(solo_hands, min_hands_needed=5, previous_hand=previous_hand)
-        if solo_chain_hands:
-            valid_hands.extend(solo_chain_hands)
+    def _generate_candidates(self, cards: list[Card] or CardSet or MoveIndex, previous_hand: list[Card]=None) -> Iterator[list[Card]]:
+        '''Return the hands generated by generate_hands(). When the move statistics are enabled, the 
+        hands in each category are counted as they are produced and recorded as a turn once every 
+        hand has been read. Every generated hand beats the previous hand, so each one survives.
 
-        # find airplane with single and pair combinations.
-        airplane_hands = self._get_airplane_hands(trio_chain_hands, cards, pair_hands)
-        if airplane_hands:
-            valid_hands.extend(airplane_hands)
+        Args:
+            cards - A list of Card objects, a CardSet object or a MoveIndex object representing the players' cards.
+            previous_hand - A list of Card objects representing the hand previously played. Default is None.
+        '''
+        hands = self.generate_hands(cards, previous_hand)
+        if not self.move_stats.is_enabled():
+            return hands
 
-        
-        # choose random card to play
-        if previous_hand is not None:
-            # set hand with same category as the previous hand.
-            self.set_hand(None, previous_hand, valid_hands+solo_hands)
-        else:
-            if not valid_hands:
-                self.set_hand(random.choice(solo_hands))
-            else:
-                self.set_hand(random.choice(valid_hands))
+        return self._record_candidates(hands)
 
-        return self.get_hand()
+    def _record_candidates(self, hands: Iterator[list[Card]]) -> Iterator[list[Card]]:
+        '''Yield the hands, recording the number of hands in each category in the move statistics
+        after the last hand.
+
+        Args:
+            hands - An iterable of list of Card objects representing card hands.
+        '''
+        candidates = dict()
+        for hand in hands:
+            category = self.get_hand_class(hand)[0]
+            candidates[category] = candidates.get(category, 0) + 1
+            yield hand
+
+        self.move_stats.record_turn(candidates, sum(candidates.values()))
+
+    def _count_categories(self, hands: list[list[Card]]) -> dict[int, int]:
+        '''Return a dictionary mapping the card categories to the number of hands in the category.
+        Hands that are not a recognised category are not counted.
+
+        Args:
+            hands - A list of list of Card objects representing card hands.
+        '''
+        candidates = dict()
+        for hand in hands:
+            hand_class = self.get_hand_class(hand)
+            if hand_class is not rules.NOT_A_HAND:
+                candidates[hand_class[0]] = candidates.get(hand_class[0], 0) + 1
+
+        return candidates
+
+    def _choose_random_hand(self, hands: Iterator[list[Card]]) -> list[Card] or None:
+        '''Return a hand chosen uniformly at random from the hands, reading each hand once so the hands
+        can be produced by a generator. None is returned if there are no hands.
+
+        Args:
+            hands - An iterable of list of Card objects representing card hands.
+        '''
+        chosen_hand = None
+        for total, hand in enumerate(hands, start=1):
+            if self.rng.random()*total<1:
+                chosen_hand = hand
+
+        return chosen_hand
 
     def _get_rocket_hand(self, cards: list[Card]) -> list[Card]:
         '''Returns a list of Card objects containing the rocket card hand.
@@ -373,12 +639,15 @@ class CardHand:
         
         Args:
             hand - A list of Card objects that represents a card hand.
+
+        Raises: RuntimeError when the hand category is not recognised. 
         '''
-        number_freq = defaultdict(int)
-        for card in hand:
-            number_freq[card.get_number()] += 1
-        
-        return rules.get_hand_category(number_freq)  
+        hand_class = self.get_hand_class(hand)
+        if hand_class is rules.NOT_A_HAND:
+            msg = f"The card sequence {hand} is not a recognised category."
+            raise RuntimeError(msg)
+
+        return hand_class[0]
 
     def _get_all_pairs(self, cards: list[Card], freq_map: Counter[int:int]) -> list[list[Card]]:
         '''Returns a collection of lists of Card objects that represents all the available pair hands 
@@ -415,5 +684,7 @@ class CardHand:
     def reset(self):
         '''Clear the player's hand, removing all selected cards.'''
         self.current_hand = list()
+        self.classified_hand = None
+        self.hand_class = rules.NOT_A_HAND
         self.hand_score = 0
         
\ No newline at end of file
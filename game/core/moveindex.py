@@ -0,0 +1,93 @@
+import misc.constants as const
+from game.core.card import Card
+
+class MoveIndex:
+    def __init__(self, cards: list[Card]=None):
+        '''Construct a MoveIndex object. A MoveIndex object groups a player's cards by rank, so
+        the hands that can be played are generated without sorting or counting the cards each turn.
+        The index is patched as cards are added and removed, and only the ranks of those cards
+        are updated.
+
+        Args:
+            cards - A list of Card objects representing the players' cards. Default is None.
+        '''
+        self.set_cards(cards or list())
+
+    def set_cards(self, cards: list[Card]) -> None:
+        '''Replace the cards in the index.
+
+        Args:
+            cards - A list of Card objects representing the players' cards.
+        '''
+        self.cards_by_rank = [list() for _ in range(const.TOTAL_RANKS)]
+        self.rank_counts = (0,) * const.TOTAL_RANKS
+        self.total_cards = 0
+        self.add_cards(cards)
+
+    def add_cards(self, cards: list[Card]) -> None:
+        '''Add the cards to the index, after the cards of the same rank already in the index.
+
+        Args:
+            cards - A list of Card objects to add to the index.
+        '''
+        changed_ranks = set()
+        for card in cards:
+            rank = const.RANK_INDEX[card.get_number()]
+            self.cards_by_rank[rank].append(card)
+            changed_ranks.add(rank)
+
+        self._update_ranks(changed_ranks)
+
+    def remove_cards(self, hand: list[Card]) -> None:
+        '''Remove the cards from the index. Cards are matched by their number, so the cards of
+        each rank that were added first are removed first.
+
+        Args:
+            hand - A list of Card objects to remove from the index.
+        '''
+        removed_counts = dict()
+        for card in hand:
+            rank = const.RANK_INDEX[card.get_number()]
+            removed_counts[rank] = removed_counts.get(rank, 0) + 1
+
+        for rank, count in removed_counts.items():
+            del self.cards_by_rank[rank][:count]
+
+        self._update_ranks(removed_counts.keys())
+
+    def get_rank_counts(self) -> tuple[int]:
+        '''Return a tuple of 15 integers representing the number of cards of each rank in the index,
+        ordered from the lowest ranking card (three) to the highest ranking card (red joker).'''
+        return self.rank_counts
+
+    def get_cards_by_rank(self, rank: int) -> list[Card]:
+        '''Return a list of Card objects in the index with the provided rank.
+
+        Args:
+            rank - An integer representing the rank index of the cards, see const.RANK_INDEX.
+        '''
+        return self.cards_by_rank[rank]
+
+    def get_cards(self) -> list[Card]:
+        '''Return a list of Card objects in the index, ordered from the lowest to the highest
+        ranking card.'''
+        return [card for rank_cards in self.cards_by_rank for card in rank_cards]
+
+    def _update_ranks(self, ranks: set[int]) -> None:
+        '''Update the rank counts of the ranks that have changed.
+
+        Args:
+            ranks - A collection of integers representing the rank indexes that have changed.
+        '''
+        if not ranks:
+            return
+
+        rank_counts = list(self.rank_counts)
+        for rank in ranks:
+            self.total_cards += len(self.cards_by_rank[rank]) - rank_counts[rank]
+            rank_counts[rank] = len(self.cards_by_rank[rank])
+
+        self.rank_counts = tuple(rank_counts)
+
+    def __len__(self):
+        return self.total_cards
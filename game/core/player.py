@@ -1,16 +1,80 @@
 import random 
-from collections import defaultdict
+from typing import TYPE_CHECKING
 import game.rules as rules
+import misc.constants as const
 from game.core.card import Card 
+from game.core.cardset import CardSet
 from game.core.deck import CardDeck
 from game.core.hand import CardHand
+from game.core.moveindex import MoveIndex
+from game.instrumentation import NULL_TIMER, NULL_MOVE_STATS, MoveStats, PhaseTimer
+if TYPE_CHECKING:
+    from game.engine.state import GameState
 
 class Player:
-    def __init__(self):
-        '''Construct a Player class with the initial stake initialised.'''
+    def __init__(self, rng: random.Random=None):
+        '''Construct a Player class with the initial stake initialised.
+        
+        Args:
+            rng - A random number generator used for the players' bids and hands, such as a 
+                    random.Random object. Default is None, which uses the global random module.
+        '''
         self.set_stake_amount(60)
+        self.rng = random if rng is None else rng
+        self.phase_timer = NULL_TIMER
+        self.move_stats = NULL_MOVE_STATS
+        self.game_state, self.seat = None, None
         self.reset()
 
+    def set_rng(self, rng: random.Random or None) -> None:
+        '''Set the random number generator used for the players' bids and hands.
+
+        Args:
+            rng - A random number generator, or None to use the global random module.
+        '''
+        self.rng = random if rng is None else rng
+        self.hand.set_rng(self.rng)
+
+    def set_phase_timer(self, phase_timer: PhaseTimer or None) -> None:
+        '''Set the timer recording the time spent choosing the players' hands, see instrumentation.PhaseTimer.
+
+        Args:
+            phase_timer - A PhaseTimer object, or None to stop recording.
+        '''
+        self.phase_timer = NULL_TIMER if phase_timer is None else phase_timer
+        self.hand.set_phase_timer(self.phase_timer)
+
+    def set_move_stats(self, move_stats: MoveStats or None) -> None:
+        '''Set the statistics counting the candidate hands considered when the player chooses a hand, 
+        see instrumentation.MoveStats.
+
+        Args:
+            move_stats - A MoveStats object, or None to stop counting.
+        '''
+        self.move_stats = NULL_MOVE_STATS if move_stats is None else move_stats
+        self.hand.set_move_stats(self.move_stats)
+
+    def set_game_state(self, game_state: 'GameState' or None, seat: int=None) -> None:
+        '''Set the state of the round being played and the players' seat in it, see 
+        state.GameState. The state is kept up to date by the gameplay engine as each hand is played, 
+        so a player can look ahead from the position. The state holds every seat's cards, so a player
+        must only read what is public: its own cards, the number of cards held by each seat, the 
+        hands played and the hand on the table.
+
+        Args:
+            game_state - A GameState object, or None when no round is being played.
+            seat - An integer representing the players' seat in the state. Default is None.
+        '''
+        self.game_state, self.seat = game_state, seat
+
+    def get_game_state(self) -> 'GameState' or None:
+        '''Return the state of the round being played, or None if no state is set.'''
+        return self.game_state
+
+    def get_seat(self) -> int or None:
+        '''Return the players' seat in the state of the round, or None if no state is set.'''
+        return self.seat
+
     def play_hand(self, previous_hand: list[Card]=None) -> list[Card]:
         '''Returns a list of Card objects that represents the hand played by the player. 
         If the previous hand is chosen, the hand will either be the same category as the 
@@ -54,7 +118,7 @@ class Player:
     def get_random_bid_amount(self) -> int:
         '''Return a random bid amount. If the bid is valid but exceeds the 
         players' total stake, the total state is returned.'''
-        probabilty = random.random()
+        probabilty = self.rng.random()
         if probabilty>0.85:
             self.set_bid(3)
         elif probabilty>0.5:
@@ -82,26 +146,56 @@ class Player:
         '''
         self.stake = amount
 
-    def set_cards(self, cards: list[Card]) -> None:
+    def set_cards(self, cards: list[Card] or CardSet) -> None:
         '''Set the players' cards.
         
         Args:
-            cards - A list of Card objects that represent the players' cards.    
+            cards - A list of Card objects or a CardSet object that represent the players' cards.    
         '''
-        self.cards = cards
+        if isinstance(cards, CardSet):
+            self.cards = cards.get_cards()
+            self.card_set = cards
+        else:
+            self.cards = cards
+            self.card_set = None
+
+        self.move_index = None
 
-    def add_wildcards(self, wildcards: list[Card]) -> None:
+    def add_wildcards(self, wildcards: list[Card] or CardSet) -> None:
         '''Add the wildcards to the players' cards.
         
         Args:
-            cards - A list of Card objects that represent the players' cards.    
+            cards - A list of Card objects or a CardSet object that represent the players' cards.    
         '''
+        if isinstance(wildcards, CardSet):
+            wildcards = wildcards.get_cards()
+
         self.get_cards().extend(wildcards)
+        self.card_set = None
+        if self.move_index is not None:
+            self.move_index.add_cards(wildcards)
 
     def get_cards(self) -> list[Card]:
         '''Return the players' cards.'''
         return self.cards
 
+    def get_card_set(self) -> CardSet:
+        '''Return a CardSet object containing the players' cards. The card set is built
+        the first time it is requested after the players' cards change.'''
+        if self.card_set is None:
+            self.card_set = CardSet.from_cards(self.get_cards() or list())
+
+        return self.card_set
+
+    def get_move_index(self) -> MoveIndex:
+        '''Return a MoveIndex object grouping the players' cards by rank. The index is built the
+        first time it is requested after the players' cards are set, and is then updated as cards
+        are added and removed.'''
+        if self.move_index is None:
+            self.move_index = MoveIndex(self.get_cards() or list())
+
+        return self.move_index
+
     def has_passed_bidding(self) -> bool:
         '''Returns True if the players bid is zero, False otherwise.'''
         return self.get_bid_amount()==0
@@ -127,7 +221,7 @@ class Player:
             previous_hand - A list of Card objects that represents the last hand played. 
                             Default is None.
         '''
-        self.hand.set_random_hand(self.get_cards(), previous_hand)
+        self.hand.set_random_hand(self.get_move_index(), previous_hand)
 
     def remove_cards(self, hand: list[Card]) -> None:
         '''Removes the provided cards from the players' cards.
@@ -136,25 +230,30 @@ class Player:
             hand - A list of Card objects representing the cards to be removed from the players'
                     hand. 
         '''
-        card_values_freq_map = defaultdict(int)
+        rank_counts = [0] * const.TOTAL_RANKS
         for card in hand:
-            card_values_freq_map[card.get_number()] += 1
+            rank_counts[const.RANK_INDEX[card.get_number()]] += 1
 
         new_cards = list()
         for card in self.get_cards():
-            if card.get_number() in card_values_freq_map.keys():
-                if not card_values_freq_map[card.get_number()]:
-                    new_cards.append(card)
-                else:
-                    card_values_freq_map[card.get_number()] -= 1
+            rank = const.RANK_INDEX[card.get_number()]
+            if rank_counts[rank]:
+                rank_counts[rank] -= 1
             else:
                 new_cards.append(card)
 
-        self.set_cards(new_cards)
+        self.cards = new_cards
+        self.card_set = None
+        if self.move_index is not None:
+            self.move_index.remove_cards(hand)
 
     def reset(self):
         '''Resets the players' hand played, cards being held by the player,
         and their bid for the round.'''
-        self.hand = CardHand()
+        self.hand = CardHand(self.rng)
+        self.hand.set_phase_timer(self.phase_timer)
+        self.hand.set_move_stats(self.move_stats)
         self.cards = None
+        self.card_set = None
+        self.move_index = None
         self.bid = None
\ No newline at end of file
@@ -0,0 +1,73 @@
+import numpy as np
+
+# the number of random numbers drawn from the NumPy generator at a time.
+DEFAULT_BUFFER_SIZE = 4096
+
+class BufferedRandom:
+    def __init__(self, seed: int=None, buffer_size: int=DEFAULT_BUFFER_SIZE):
+        '''Construct a BufferedRandom object. A BufferedRandom object is a random number generator 
+        backed by a NumPy Generator, which draws random numbers in bulk and hands them out one at a 
+        time. It provides the random(), choice() and shuffle() methods of random.Random, so it can 
+        be passed to the deck, the players and the game in place of the global random module.
+
+        Args:
+            seed - An integer used to seed the generator. Default is None, which seeds the generator
+                    from the operating system.
+            buffer_size - An integer representing the number of random numbers drawn at a time. 
+                    Default is DEFAULT_BUFFER_SIZE.
+
+        Raises: ValueError when the buffer size is not a positive integer.
+        '''
+        if buffer_size<=0:
+            raise ValueError(f"The buffer size '{buffer_size}' must be a positive integer.")
+
+        self.buffer_size = buffer_size
+        self.seed(seed)
+
+    def seed(self, seed: int=None) -> None:
+        '''Reseed the generator, discarding the random numbers already drawn.
+
+        Args:
+            seed - An integer used to seed the generator. Default is None.
+        '''
+        self.generator = np.random.default_rng(seed)
+        self.buffer = list()
+        self.position = 0
+
+    def get_generator(self) -> np.random.Generator:
+        '''Return the NumPy Generator backing the random numbers, for bulk draws.'''
+        return self.generator
+
+    def random(self) -> float:
+        '''Return the next random float in the range [0.0, 1.0).'''
+        if self.position==len(self.buffer):
+            # tolist() converts the whole buffer to Python floats at once.
+            self.buffer = self.generator.random(self.buffer_size).tolist()
+            self.position = 0
+
+        number = self.buffer[self.position]
+        self.position += 1
+        return number
+
+    def choice(self, seq: list):
+        '''Return a random element from the non-empty sequence.
+
+        Args:
+            seq - A non-empty sequence.
+
+        Raises: IndexError when the sequence is empty.
+        '''
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence.")
+
+        return seq[int(self.random() * len(seq))]
+
+    def shuffle(self, seq: list) -> None:
+        '''Shuffle the list in place.
+
+        Args:
+            seq - A list to shuffle.
+        '''
+        for i in range(len(seq)-1, 0, -1):
+            j = int(self.random() * (i+1))
+            seq[i], seq[j] = seq[j], seq[i]
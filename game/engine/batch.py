@@ -0,0 +1,444 @@
+import itertools
+import numpy as np
+import game.rules as rules
+import misc.constants as const
+from misc.constants import CARD_CATEGORY as CATEGORY
+from game.core.card import CARDS, get_card
+
+# the rank index of each card in the deck, in the order of the shared Card objects.
+CARD_RANKS = np.array([const.RANK_INDEX[card.get_number()] for card in CARDS], dtype=np.int64)
+THREE_OF_HEARTS = CARDS.index(get_card(3, "hearts"))
+
+TOTAL_PLAYERS = 3
+CARDS_PER_PLAYER = 17
+INITIAL_STAKE = 60
+PLAY_SINGLE_PROB = 0.3
+# the previous hand given to HandCatalog.choose_random_hands() by a player leading without a single
+# card, which chooses from every hand but the solos.
+NO_SOLO_LEAD = -2
+
+# the playable hands are looked up for three ranks at a time.
+RANKS_PER_GROUP = 3
+
+# masks with the lowest n bits set, for n from 0 to 64.
+_LOW_BITS = np.array([(1 << n) - 1 for n in range(65)], dtype=np.uint64)
+# the number of set bits in each byte, used to count bits when NumPy is older than 2.0.
+_BYTE_BIT_COUNTS = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+class HandCatalog:
+    def __init__(self):
+        '''Construct a HandCatalog object. A HandCatalog object holds every recognised card hand
+        from rules.get_hand_table() as arrays, ordered by category, length and comparison rank, so
+        the hands that beat a hand are a contiguous range of the catalog. For each rank and card
+        count, the hands that can be played are stored as a bitmask with one bit per hand.'''
+        table = rules.get_hand_table()
+        hand_counts = np.array(list(table.keys()), dtype=np.int64)
+        hand_classes = np.array(list(table.values()), dtype=np.int64)
+        order = np.lexsort((hand_classes[:, 1], hand_classes[:, 2], hand_classes[:, 0]))
+
+        self.hand_counts = hand_counts[order]
+        self.categories, self.ranks, self.lengths = hand_classes[order].T.copy()
+        self.total_hands = len(order)
+        self.total_words = (self.total_hands + 63) // 64
+
+        self.solo_hands = np.array([self._get_hand_index(CATEGORY.SOLO, rank, 1)
+                                    for rank in range(const.TOTAL_RANKS)])
+        self.rocket_hand = self._get_hand_index(CATEGORY.ROCKET, rules.RED_JOKER_RANK, 2)
+        self.bomb_hands = np.flatnonzero(self.categories==CATEGORY.BOMB)
+        self._set_beating_masks()
+        self._set_playable_masks()
+
+        # cards without a bomb or two consecutive trios can only play the hands up to a trio with
+        # pair, or the rocket, so only the words holding those hands are searched.
+        common_hands = np.flatnonzero(self.categories<=CATEGORY.TRIO_WITH_PAIR)
+        self.common_words = np.unique(np.append(common_hands, self.rocket_hand) // 64)
+        self.common_playable_masks = self.playable_masks[:, :, self.common_words]
+        self.common_beating_masks = self.beating_masks[:, self.common_words]
+
+    def _get_hand_index(self, category: int, rank: int, length: int) -> int:
+        '''Return the position of the first hand in the catalog with the category, comparison rank and
+        length.
+
+        Args:
+            category - An integer representing the card category.
+            rank - An integer representing the comparison rank.
+            length - An integer representing the number of cards in the hand.
+        '''
+        return int(np.flatnonzero((self.categories==category) & (self.ranks==rank) & (self.lengths==length))[0])
+
+    def _set_beating_masks(self) -> None:
+        '''Store, for every hand in the catalog, a bitmask marking the hands that beat it: the hands
+        with the same category and length and a higher comparison rank, the bombs and the rocket.
+        The last row marks every hand, and is used when there is no previous hand. The row before it
+        marks every hand but the solos, see NO_SOLO_LEAD.'''
+        beat_start = np.zeros(self.total_hands, dtype=np.int64)
+        beat_end = np.zeros(self.total_hands, dtype=np.int64)
+        shape_start = 0
+        for index in range(1, self.total_hands+1):
+            if (index<self.total_hands and self.categories[index]==self.categories[shape_start] and
+                    self.lengths[index]==self.lengths[shape_start]):
+                continue
+
+            shape_ranks = self.ranks[shape_start:index]
+            beat_start[shape_start:index] = shape_start + np.searchsorted(shape_ranks, shape_ranks, side='right')
+            beat_end[shape_start:index] = index
+            shape_start = index
+
+        is_trumped = (self.categories!=CATEGORY.ROCKET)
+        bombs_beat = is_trumped & (self.categories!=CATEGORY.BOMB)
+        no_hands = np.zeros(self.total_hands, dtype=np.int64)
+        masks = self.get_range_masks(beat_start, beat_end)
+        masks |= self.get_range_masks(np.where(bombs_beat, self.bomb_hands[0], 0), 
+                                      np.where(bombs_beat, self.bomb_hands[-1]+1, no_hands))
+        masks |= self.get_range_masks(np.where(is_trumped, self.rocket_hand, 0), 
+                                      np.where(is_trumped, self.rocket_hand+1, no_hands))
+
+        every_hand = self.get_range_masks(np.array([0]), np.array([self.total_hands]))
+        # the solos are the first hands of the catalog.
+        no_solo = self.get_range_masks(np.array([len(self.solo_hands)]), np.array([self.total_hands]))
+        self.beating_masks = np.concatenate([masks, no_solo, every_hand])
+
+    def _set_playable_masks(self) -> None:
+        '''Store a bitmask for each group of three ranks and each combination of card counts in those
+        ranks, marking the hands that use at most that many cards of each rank.'''
+        padded_size = self.total_words * 64
+        total_groups = const.TOTAL_RANKS // RANKS_PER_GROUP
+        self.playable_masks = np.zeros((total_groups, 5**RANKS_PER_GROUP, self.total_words), dtype=np.uint64)
+        for group in range(total_groups):
+            ranks = range(group*RANKS_PER_GROUP, (group+1)*RANKS_PER_GROUP)
+            for counts in itertools.product(range(5), repeat=RANKS_PER_GROUP):
+                playable = np.zeros(padded_size, dtype=bool)
+                playable[:self.total_hands] = (self.hand_counts[:, ranks]<=counts).all(axis=1)
+                self.playable_masks[group, self._get_group_index(counts)] = np.packbits(playable, bitorder='little').view('<u8')
+
+    def _get_group_index(self, counts: np.ndarray) -> np.ndarray:
+        '''Return the index of the combination of card counts within a group of three ranks.
+
+        Args:
+            counts - An array whose last dimension holds the card counts of the three ranks.
+        '''
+        counts = np.asarray(counts)
+        return counts[..., 0]*25 + counts[..., 1]*5 + counts[..., 2]
+
+    def get_playable_masks(self, rank_counts: np.ndarray, playable_masks: np.ndarray=None) -> np.ndarray:
+        '''Return an array of bitmasks marking the hands that can be played from each set of cards.
+
+        Args:
+            rank_counts - An array of shape (games, 15) with the number of cards of each rank.
+            playable_masks - An array of bitmasks for each group of ranks and card counts. Default is 
+                        None, which uses the bitmasks of every hand in the catalog.
+        '''
+        if playable_masks is None:
+            playable_masks = self.playable_masks
+
+        group_counts = self._get_group_index(rank_counts.reshape(-1, const.TOTAL_RANKS // RANKS_PER_GROUP, RANKS_PER_GROUP))
+        masks = playable_masks[0, group_counts[:, 0]]
+        for group in range(1, group_counts.shape[1]):
+            masks &= playable_masks[group, group_counts[:, group]]
+
+        return masks
+
+    def choose_random_hands(self, rank_counts: np.ndarray, previous_hands: np.ndarray, 
+                            draws: np.ndarray) -> np.ndarray:
+        '''Return the position of a hand chosen uniformly at random from the hands that can be played
+        from each set of cards and beat the previous hand, or -1 when there is no such hand.
+
+        Args:
+            rank_counts - An array of shape (games, 15) with the number of cards of each rank.
+            previous_hands - An array of integers representing the position of the previous hand in
+                        the catalog, -1 when there is no previous hand, or NO_SOLO_LEAD to choose from
+                        every hand but the solos.
+            draws - An array of uniform random numbers in [0, 1), one for each set of cards.
+        '''
+        trio_ranks = rank_counts[:, :rules.HIGHEST_CHAIN_RANK+1]>=3
+        uncommon = ((rank_counts==4).any(axis=1) | (trio_ranks[:, :-1] & trio_ranks[:, 1:]).any(axis=1))
+
+        hands = np.empty(len(rank_counts), dtype=np.int64)
+        common = ~uncommon
+        masks = (self.get_playable_masks(rank_counts[common], self.common_playable_masks) & 
+                 self.common_beating_masks[previous_hands[common]])
+        hands[common] = choose_random_bits(masks, draws[common], self.common_words)
+
+        masks = self.get_playable_masks(rank_counts[uncommon]) & self.beating_masks[previous_hands[uncommon]]
+        hands[uncommon] = choose_random_bits(masks, draws[uncommon])
+        return hands
+
+    def get_range_masks(self, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+        '''Return an array of bitmasks marking the hands in each range of the catalog.
+
+        Args:
+            start - An array of integers representing the first hand in each range.
+            end - An array of integers representing the position after the last hand in each range.
+        '''
+        word_starts = np.arange(self.total_words, dtype=np.int64) * 64
+        low = np.clip(start[:, None] - word_starts, 0, 64)
+        high = np.clip(end[:, None] - word_starts, 0, 64)
+        return _LOW_BITS[high] & ~_LOW_BITS[low]
+
+_hand_catalog = None
+
+def get_hand_catalog() -> HandCatalog:
+    '''Return the HandCatalog object shared by every batch engine. The catalog is built the first
+    time it is requested.'''
+    global _hand_catalog
+    if _hand_catalog is None:
+        _hand_catalog = HandCatalog()
+
+    return _hand_catalog
+
+def count_bits(masks: np.ndarray) -> np.ndarray:
+    '''Return an array of the number of set bits in each 64-bit bitmask, with the shape of the
+    bitmasks. NumPy's bitwise_count() is used when it exists, from NumPy 2.0.
+
+    Args:
+        masks - An array of 64-bit bitmasks.
+    '''
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(masks)
+
+    return _count_bits_by_byte(masks)
+
+def _count_bits_by_byte(masks: np.ndarray) -> np.ndarray:
+    '''Return an array of the number of set bits in each 64-bit bitmask, adding up the set bits of
+    each of its bytes, see count_bits().
+
+    Args:
+        masks - An array of 64-bit bitmasks.
+    '''
+    masks = np.ascontiguousarray(masks, dtype=np.uint64)
+    byte_counts = _BYTE_BIT_COUNTS[masks.view(np.uint8)].reshape(masks.shape + (8,))
+    return byte_counts.sum(axis=-1, dtype=np.uint8)
+
+def choose_random_bits(masks: np.ndarray, draws: np.ndarray, words: np.ndarray=None) -> np.ndarray:
+    '''Return the position of a set bit chosen uniformly at random from each bitmask, or -1 when
+    the bitmask has no set bits.
+
+    Args:
+        masks - An array of shape (games, words) of 64-bit bitmasks.
+        draws - An array of uniform random numbers in [0, 1), one for each bitmask.
+        words - An array of integers representing the word each column of the bitmasks was taken
+                from. Default is None, where the columns are the words in order.
+    '''
+    if len(masks)==0:
+        return np.empty(0, dtype=np.int64)
+
+    bit_counts = count_bits(masks)
+    cumulative = np.cumsum(bit_counts, axis=1, dtype=np.int32)
+    totals = cumulative[:, -1]
+    choices = np.minimum((draws * totals).astype(np.int32), np.maximum(totals-1, 0))
+
+    rows = np.arange(len(masks))
+    columns = np.minimum((cumulative<=choices[:, None]).sum(axis=1), masks.shape[1]-1)
+    choices -= cumulative[rows, columns] - bit_counts[rows, columns]
+    bits = (masks[rows, columns][:, None] >> np.arange(64, dtype=np.uint64)).astype(np.uint8) & 1
+    positions = (np.cumsum(bits, axis=1, dtype=np.int32)>choices[:, None]).argmax(axis=1)
+
+    if words is not None:
+        columns = words[columns]
+    return np.where(totals>0, columns*64 + positions, -1)
+
+class BatchEngine:
+    def __init__(self, total_games: int, seed: int=None):
+        '''Construct a BatchEngine object. A BatchEngine object simulates many games of landlord at
+        once, with the cards, bids and stakes of every game held in arrays. Each call to play()
+        advances every game by a round, using the same bidding and random play policies as
+        Player.get_random_bid_amount() and CardHand.set_random_hand().
+
+        Args:
+            total_games - An integer representing the number of games to simulate.
+            seed - An integer used to seed the random number generator. Default is None.
+        '''
+        self.total_games = total_games
+        self.catalog = get_hand_catalog()
+        self.rng = np.random.default_rng(seed)
+        self.stakes = np.full((total_games, TOTAL_PLAYERS), INITIAL_STAKE, dtype=np.int64)
+        self.reset()
+
+    def play(self) -> np.ndarray:
+        '''Play a round of landlord in every game that has not ended. Returns an array of booleans
+        marking the games where a round was played, which excludes games where every player
+        passed during bidding.'''
+        games = np.flatnonzero(~self.has_game_ended())
+        self.reset()
+        wildcards = self.deal_cards_to_players(games)
+        games = self._execute_bidding(games)
+        self.give_landlord_wildcards(games, wildcards[games])
+        self.play_round(games)
+        self.update_players_stake(games)
+
+        played = np.zeros(self.total_games, dtype=bool)
+        played[games] = True
+        return played
+
+    def deal_cards_to_players(self, games: np.ndarray) -> np.ndarray:
+        '''Shuffle a deck for each game and deal 17 cards to each player. Returns an array of shape
+        (total games, 3) containing the wildcards of each game dealt, where each card is the index 
+        of the card in the shared deck of cards.
+
+        Args:
+            games - An array of integers representing the games to deal.
+        '''
+        decks = self.rng.permuted(np.tile(np.arange(len(CARDS)), (len(games), 1)), axis=1)
+        dealt = CARD_RANKS[decks[:, :TOTAL_PLAYERS*CARDS_PER_PLAYER]].reshape(len(games), TOTAL_PLAYERS, -1)
+        self.rank_counts[games] = (dealt[..., None]==np.arange(const.TOTAL_RANKS)).sum(axis=2)
+
+        holders = np.argmax(decks==THREE_OF_HEARTS, axis=1) // CARDS_PER_PLAYER
+        self.first_bidders[games] = np.where(holders<TOTAL_PLAYERS, holders, -1)
+
+        wildcards = np.full((self.total_games, len(CARDS)-TOTAL_PLAYERS*CARDS_PER_PLAYER), -1, dtype=np.int64)
+        wildcards[games] = decks[:, TOTAL_PLAYERS*CARDS_PER_PLAYER:]
+        return wildcards
+
+    def _execute_bidding(self, games: np.ndarray) -> np.ndarray:
+        '''Simulate the bidding between the players in each game, setting the landlord and round
+        stake. Returns an array of integers representing the games where a player won the bidding.
+
+        Args:
+            games - An array of integers representing the games to bid in.
+        '''
+        first_bidders = self.first_bidders[games]
+        orders = np.tile(np.arange(TOTAL_PLAYERS), (len(games), 1))
+        for first_bidder in range(TOTAL_PLAYERS):
+            others = [player for player in range(TOTAL_PLAYERS) if player!=first_bidder]
+            orders[first_bidders==first_bidder] = [first_bidder] + others
+
+        draws = self.rng.random((len(games), TOTAL_PLAYERS))
+        amounts = np.select([draws>0.85, draws>0.5, draws>0.2], [3, 2, 1], default=0)
+        max_bids = np.zeros(len(games), dtype=np.int64)
+        landlords = np.full(len(games), -1, dtype=np.int64)
+        bidding = np.ones(len(games), dtype=bool)
+        passed = np.ones(len(games), dtype=bool)
+        for position in range(TOTAL_PLAYERS):
+            players = orders[:, position]
+            bids = np.minimum(amounts[:, position], self.stakes[games, players])
+            passed &= ~bidding | (bids==0)
+            higher = bidding & (bids>max_bids)
+            max_bids[higher] = bids[higher]
+            landlords[higher] = players[higher]
+            bidding &= bids!=3
+
+        self.landlords[games] = landlords
+        self.round_stakes[games] = max_bids
+        return games[~passed]
+
+    def give_landlord_wildcards(self, games: np.ndarray, wildcards: np.ndarray) -> None:
+        '''Add the wildcards to the landlord's cards in each game.
+
+        Args:
+            games - An array of integers representing the games.
+            wildcards - An array of shape (games, 3) containing the deck index of each wildcard.
+        '''
+        for card in range(wildcards.shape[1]):
+            np.add.at(self.rank_counts, (games, self.landlords[games], CARD_RANKS[wildcards[:, card]]), 1)
+
+    def play_round(self, games: np.ndarray) -> None:
+        '''Play a round of landlord in each game, with the landlord playing first. Every player
+        plays a random hand that beats the previous hand, or passes, until a player has no cards.
+
+        Args:
+            games - An array of integers representing the games to play.
+        '''
+        catalog = self.catalog
+        landlords = self.landlords[games]
+        orders = np.tile(np.arange(TOTAL_PLAYERS), (len(games), 1))
+        for landlord in range(TOTAL_PLAYERS):
+            peasants = [player for player in range(TOTAL_PLAYERS) if player!=landlord]
+            orders[landlords==landlord] = [landlord, peasants[1], peasants[0]]
+
+        turns = np.zeros(len(games), dtype=np.int64)
+        previous_hands = np.full(len(games), -1, dtype=np.int64)
+        previous_players = np.full(len(games), -1, dtype=np.int64)
+        stakes = self.round_stakes[games].copy()
+        playing = np.ones(len(games), dtype=bool)
+        while playing.any():
+            active = np.flatnonzero(playing)
+            players = orders[active, turns[active]]
+            rank_counts = self.rank_counts[games[active], players]
+
+            # both players passed, so the player starts a new round.
+            previous = np.where(previous_players[active]==players, -1, previous_hands[active])
+            leading = previous<0
+
+            # possibly begin the new round with a single card, which is not drawn with the other hands.
+            total_cards = rank_counts.sum(axis=1)
+            single = leading & ((total_cards==1) | (self.rng.random(len(active))<PLAY_SINGLE_PROB))
+            hands = np.empty(len(active), dtype=np.int64)
+            choosing = ~single
+            hands[choosing] = catalog.choose_random_hands(rank_counts[choosing], 
+                                                          np.where(leading, NO_SOLO_LEAD, previous)[choosing], 
+                                                          self.rng.random(choosing.sum()))
+
+            # a leading player without any other hand plays a single card.
+            single |= leading & (hands<0)
+            if single.any():
+                card_positions = (self.rng.random(single.sum()) * total_cards[single]).astype(np.int64)
+                cumulative = np.cumsum(rank_counts[single], axis=1)
+                ranks = (cumulative<=card_positions[:, None]).sum(axis=1)
+                hands[single] = catalog.solo_hands[ranks]
+
+            played = hands>=0
+            active, players, hands = active[played], players[played], hands[played]
+            doubled = ((previous_players[active]==players) |
+                       (catalog.categories[hands]==CATEGORY.BOMB) | (catalog.categories[hands]==CATEGORY.ROCKET))
+            doubled &= stakes[active]<const.MAX_STAKE_LIMIT
+            stakes[active[doubled]] *= 2
+
+            previous_hands[active], previous_players[active] = hands, players
+            self.rank_counts[games[active], players] -= catalog.hand_counts[hands]
+            won = self.rank_counts[games[active], players].sum(axis=1)==0
+            playing[active[won]] = False
+            turns[playing] = (turns[playing]+1) % TOTAL_PLAYERS
+
+        self.winners[games] = previous_players
+        self.round_stakes[games] = stakes
+
+    def update_players_stake(self, games: np.ndarray) -> None:
+        '''Update the stake of the players in each game with the round stake. If the landlord wins,
+        each peasant pays the landlord the round stake, or their remaining stake. If a peasant wins,
+        the landlord pays each peasant the round stake, or half of their remaining stake.
+
+        Args:
+            games - An array of integers representing the games that played a round.
+        '''
+        landlords, winners, round_stakes = self.landlords[games], self.winners[games], self.round_stakes[games]
+        landlord_won = winners==landlords
+        landlord_stakes = self.stakes[games, landlords]
+        landlord_pay = np.where(landlord_stakes<round_stakes, landlord_stakes // 2, round_stakes)
+        for player in range(TOTAL_PLAYERS):
+            is_peasant = landlords!=player
+            peasant_stakes = self.stakes[games, player]
+            peasant_pay = np.minimum(peasant_stakes, round_stakes)
+            change = np.where(landlord_won, -peasant_pay, landlord_pay)
+            change = np.where(is_peasant, change, 0)
+            self.stakes[games, player] += change
+            self.stakes[games, landlords] -= change
+
+    def has_game_ended(self) -> np.ndarray:
+        '''Returns an array of booleans marking the games where a player has no more stake to bid.'''
+        return (self.stakes<=0).any(axis=1)
+
+    def get_stakes(self) -> np.ndarray:
+        '''Returns an array of shape (games, 3) containing each players' total stake.'''
+        return self.stakes
+
+    def get_landlords(self) -> np.ndarray:
+        '''Returns an array of integers representing the landlord of the last round of each game,
+        or -1 when no round was played.'''
+        return self.landlords
+
+    def get_winners(self) -> np.ndarray:
+        '''Returns an array of integers representing the winner of the last round of each game,
+        or -1 when no round was played.'''
+        return self.winners
+
+    def get_round_stakes(self) -> np.ndarray:
+        '''Returns an array of integers representing the stake won in the last round of each game.'''
+        return self.round_stakes
+
+    def reset(self):
+        '''Resets the round in every game, clearing the players' cards, landlords and winners.'''
+        self.rank_counts = np.zeros((self.total_games, TOTAL_PLAYERS, const.TOTAL_RANKS), dtype=np.int64)
+        self.first_bidders = np.full(self.total_games, -1, dtype=np.int64)
+        self.landlords = np.full(self.total_games, -1, dtype=np.int64)
+        self.winners = np.full(self.total_games, -1, dtype=np.int64)
+        self.round_stakes = np.zeros(self.total_games, dtype=np.int64)
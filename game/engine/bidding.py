@@ -1,15 +1,21 @@
+from game.core.card import get_card
 from game.core.player import Player
+from game.instrumentation import PHASE, NULL_TIMER, PhaseTimer
+
+THREE_OF_HEARTS = get_card(3, "hearts")
 
 class BiddingEngine:
     def __init__(self):
         '''Construct a BiddingEngine object. The bidding engine handles the bidding
         between players in a round of landlord.'''
+        self.phase_timer = NULL_TIMER
         self.reset()
     
     def execute_bidding_round(self) -> (int, Player):
         '''Simulates a round of bidding in a game of landlord. An interger
         representing the maximum bid and a Player object representing the winning
         bidder is returned.'''
+        start = self.phase_timer.start()
         max_bid, winning_bidder = 0, None
         for player in self._get_bidding_order():
             if player.get_bid_amount() is None:
@@ -22,6 +28,7 @@ class BiddingEngine:
             if player.get_bid_amount()==3:
                 break
 
+        self.phase_timer.stop(PHASE.BID, start)
         return max_bid, winning_bidder
 
     def _get_bidding_order(self) -> list[Player]:
@@ -30,10 +37,8 @@ class BiddingEngine:
         Otherwise, the list of players in the game is returned.'''
         first_bidder = None
         for player in self.get_players():
-            for card in player.get_cards():
-                if card.get_number()==3 and card.get_suit()=="hearts":
-                    first_bidder = player
-                    break 
+            if THREE_OF_HEARTS in player.get_card_set():
+                first_bidder = player
         
         if first_bidder:
             order = [first_bidder]
@@ -45,6 +50,14 @@ class BiddingEngine:
         else:
             return self.get_players()
     
+    def set_phase_timer(self, phase_timer: PhaseTimer or None) -> None:
+        '''Set the timer recording the time spent bidding, see instrumentation.PhaseTimer.
+
+        Args:
+            phase_timer - A PhaseTimer object, or None to stop recording.
+        '''
+        self.phase_timer = NULL_TIMER if phase_timer is None else phase_timer
+
     def set_players(self, players: list[Player]):
         '''Sets the players playing the game of landlord.
         
@@ -0,0 +1,243 @@
+import game.rules as rules
+import misc.constants as const
+from game.core.card import Card
+from game.core.hand import generate_hand_rank_counts, get_rank_counts
+
+TOTAL_SEATS = 3
+# each seat's cards are packed into an integer with 3 bits for the number of cards of each rank, so a
+# hand is removed from the cards by subtraction.
+BITS_PER_RANK = 3
+SEAT_BITS = BITS_PER_RANK * const.TOTAL_RANKS
+# the number of positions kept in the transposition table before it is cleared.
+DEFAULT_TABLE_SIZE = 1 << 20
+
+def pack_rank_counts(rank_counts: tuple[int]) -> int:
+    '''Return the rank counts packed into an integer, with BITS_PER_RANK bits for each rank.
+
+    Args:
+        rank_counts - A tuple of 15 integers representing the number of cards of each rank.
+    '''
+    packed = 0
+    for rank, count in enumerate(rank_counts):
+        packed |= count << (rank * BITS_PER_RANK)
+
+    return packed
+
+def unpack_rank_counts(packed: int) -> tuple[int]:
+    '''Return the rank counts packed into the integer, see pack_rank_counts().
+
+    Args:
+        packed - An integer representing packed rank counts.
+    '''
+    mask = (1 << BITS_PER_RANK) - 1
+    return tuple((packed >> (rank * BITS_PER_RANK)) & mask for rank in range(const.TOTAL_RANKS))
+
+def _get_class_code(hand_class: tuple[int, int, int] or None) -> int:
+    '''Return an integer representing the hand class, or 0 when no hand has been played.
+
+    Args:
+        hand_class - A tuple containing the card category, the comparison rank and the number of cards
+                    in a hand, see rules.classify(), or NOT_A_HAND.
+    '''
+    if hand_class is rules.NOT_A_HAND:
+        return 0
+
+    category, rank, length = hand_class
+    return ((category + 1) << 10) | (rank << 5) | length
+
+class EndgameSolver:
+    def __init__(self, table_size: int=DEFAULT_TABLE_SIZE):
+        '''Construct an EndgameSolver object. An EndgameSolver object finds the outcome of a round of
+        landlord from any position when every player plays perfectly, with the landlord playing against
+        the two peasants as a team. The solver is an alpha-beta search, scoring a win for the landlord
+        as 1 and a loss as -1, so a position is cut off as soon as the player to move finds a winning
+        move. Solved positions are kept in a transposition table keyed on an integer packing the
+        position, and the legal moves of each seat are generated once per set of cards.
+
+        Args:
+            table_size - An integer representing the number of positions kept in the transposition
+                    table. The table is cleared when it is full. Default is DEFAULT_TABLE_SIZE.
+        '''
+        self.table_size = table_size
+        self.table = dict()
+        self.moves = dict()
+        self.hands = dict()
+        self.nodes = 0
+        self.landlord = 0
+
+    def solve(self, hands: list[list[Card]], landlord: int, turn: int, previous_hand: list[Card]=None,
+              previous_player: int=None) -> bool:
+        '''Return True if the landlord wins the round from the position with perfect play, False if
+        the peasants win.
+
+        Args:
+            hands - A list containing three lists of Card objects, representing each seat's remaining
+                    cards in the order the seats play, so the seat after seat i is seat (i+1) % 3.
+            landlord - An integer representing the landlord's seat.
+            turn - An integer representing the seat to play next.
+            previous_hand - A list of Card objects representing the hand on the table, or None when
+                    the seat to play leads. Default is None.
+            previous_player - An integer representing the seat that played the previous hand. Default
+                    is None.
+
+        Raises: ValueError when the position is not a position of a round in progress.
+        '''
+        seats, previous_class = self._set_position(hands, landlord, turn, previous_hand, previous_player)
+        return self._search(seats, turn, previous_class, previous_player)
+
+    def get_best_move(self, hands: list[list[Card]], landlord: int, turn: int, previous_hand: list[Card]=None,
+                      previous_player: int=None) -> tuple[tuple[int] or None, bool]:
+        '''Return the move the seat to play should make and whether the landlord then wins. The move is
+        a winning move for the seat's team if there is one. See solve() for the arguments.
+
+        Returns: A tuple containing the rank counts of the hand to play, or None to pass, in the first
+                index, and a boolean that is True if the landlord wins, in the second index.
+
+        Raises: ValueError when the position is not a position of a round in progress.
+        '''
+        seats, previous_class = self._set_position(hands, landlord, turn, previous_hand, previous_player)
+        if turn==previous_player:
+            previous_class, previous_player = rules.NOT_A_HAND, None
+
+        landlord_to_move, cards = turn==self.landlord, seats[turn]
+        best_move = None
+        for move, hand_class in self._get_moves(cards, previous_class):
+            seats[turn] = cards - move
+            landlord_wins = landlord_to_move if seats[turn]==0 else \
+                self._search(seats, (turn+1) % TOTAL_SEATS, hand_class, turn)
+            seats[turn] = cards
+            if best_move is None:
+                best_move, best_result = move, landlord_wins
+            if landlord_wins==landlord_to_move:
+                return unpack_rank_counts(move), landlord_wins
+
+        if previous_class is not rules.NOT_A_HAND:
+            landlord_wins = self._search(seats, (turn+1) % TOTAL_SEATS, previous_class, previous_player)
+            if best_move is None or landlord_wins==landlord_to_move:
+                return None, landlord_wins
+
+        return unpack_rank_counts(best_move), best_result
+
+    def _set_position(self, hands: list[list[Card]], landlord: int, turn: int, previous_hand: list[Card] or None,
+                      previous_player: int or None) -> tuple[list[int], tuple[int, int, int] or None]:
+        '''Check the position and set the landlord, returning the packed cards of each seat and the
+        class of the previous hand. See solve() for the arguments.
+
+        Raises: ValueError when the position is not a position of a round in progress.
+        '''
+        if len(hands)!=TOTAL_SEATS or not all(hands):
+            raise ValueError("The position must contain three seats that each hold at least one card.")
+
+        if landlord not in range(TOTAL_SEATS) or turn not in range(TOTAL_SEATS):
+            raise ValueError(f"The landlord '{landlord}' and the turn '{turn}' must be seats 0, 1 or 2.")
+
+        previous_class = rules.NOT_A_HAND
+        if previous_hand:
+            previous_class = rules.classify(get_rank_counts(previous_hand))
+            if previous_class is rules.NOT_A_HAND or previous_player not in range(TOTAL_SEATS):
+                raise ValueError("The previous hand must be a card hand played by seat 0, 1 or 2.")
+
+        if landlord!=self.landlord:
+            self.clear()
+            self.landlord = landlord
+
+        return [pack_rank_counts(get_rank_counts(cards)) for cards in hands], previous_class
+
+    def _search(self, seats: list[int], turn: int, previous_class: tuple[int, int, int] or None,
+                previous_player: int or None) -> bool:
+        '''Return True if the landlord wins from the position with perfect play, False otherwise.
+
+        Args:
+            seats - A list of three integers representing the packed cards of each seat, see
+                    pack_rank_counts(). The list is restored before the function returns.
+            turn - An integer representing the seat to play next.
+            previous_class - A tuple containing the class of the hand on the table, or NOT_A_HAND.
+            previous_player - An integer representing the seat that played the hand on the table, or None.
+        '''
+        # the seat leads once both other seats pass.
+        if turn==previous_player:
+            previous_class, previous_player = rules.NOT_A_HAND, None
+
+        key = (seats[0] | (seats[1] << SEAT_BITS) | (seats[2] << (2 * SEAT_BITS))
+               | (turn << (3 * SEAT_BITS)) | ((0 if previous_player is None else previous_player + 1) << (3 * SEAT_BITS + 2))
+               | (_get_class_code(previous_class) << (3 * SEAT_BITS + 4)))
+        landlord_wins = self.table.get(key)
+        if landlord_wins is not None:
+            return landlord_wins
+
+        self.nodes += 1
+        landlord_to_move, cards = turn==self.landlord, seats[turn]
+        next_turn = (turn+1) % TOTAL_SEATS
+        moves = self._get_moves(cards, previous_class)
+        # the seat wins when it plays its last cards, or plays a hand no opponent can beat and then 
+        # leads its remaining cards as a single hand.
+        opponents = [seat for seat in range(TOTAL_SEATS) if (seat==self.landlord)!=landlord_to_move]
+        wins = any(cards==move or (self._is_hand(cards - move) and 
+                                   not any(self._get_moves(seats[seat], hand_class) for seat in opponents))
+                   for move, hand_class in moves)
+
+        can_pass = previous_class is not rules.NOT_A_HAND
+        if not wins:
+            for move, hand_class in moves:
+                seats[turn] = cards - move
+                wins = self._search(seats, next_turn, hand_class, turn)==landlord_to_move
+                seats[turn] = cards
+                if wins:
+                    break
+
+        if not wins and can_pass:
+            wins = self._search(seats, next_turn, previous_class, previous_player)==landlord_to_move
+
+        landlord_wins = wins==landlord_to_move
+        if len(self.table)>=self.table_size:
+            self.table.clear()
+            self.moves.clear()
+
+        self.table[key] = landlord_wins
+        return landlord_wins
+
+    def _get_moves(self, cards: int, previous_class: tuple[int, int, int] or None) -> list[tuple[int, tuple]]:
+        '''Return a list of tuples containing the packed rank counts and the class of each hand that can
+        be played from the cards, with the hands of the most cards first.
+
+        Args:
+            cards - An integer representing the packed cards of a seat.
+            previous_class - A tuple containing the class of the hand on the table, or NOT_A_HAND.
+        '''
+        key = (cards, previous_class)
+        moves = self.moves.get(key)
+        if moves is None:
+            hands = generate_hand_rank_counts(unpack_rank_counts(cards), previous_class)
+            moves = sorted(((pack_rank_counts(hand), rules.classify(hand)) for hand in hands),
+                           key=lambda move: (-move[1][2], move[1][1]))
+            self.moves[key] = moves
+
+        return moves
+
+    def _is_hand(self, cards: int) -> bool:
+        '''Return True if the cards can be played as a single hand, False otherwise. Only the hands in
+        the hand table are counted, as they are the hands generated as moves.
+
+        Args:
+            cards - An integer representing packed cards, see pack_rank_counts().
+        '''
+        is_hand = self.hands.get(cards)
+        if is_hand is None:
+            is_hand = self.hands[cards] = unpack_rank_counts(cards) in rules.get_hand_table()
+
+        return is_hand
+
+    def get_nodes(self) -> int:
+        '''Return the number of positions searched since the solver was cleared.'''
+        return self.nodes
+
+    def get_table_size(self) -> int:
+        '''Return the number of positions in the transposition table.'''
+        return len(self.table)
+
+    def clear(self) -> None:
+        '''Clear the transposition table, the generated moves and the number of positions searched.'''
+        self.table.clear()
+        self.moves.clear()
+        self.hands.clear()
+        self.nodes = 0
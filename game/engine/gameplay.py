@@ -1,27 +1,47 @@
-from collections import defaultdict
 import game.rules as rules
 from game.core.player import Player
+from game.core.card import Card
+from game.engine.state import GameState, get_rank_counts
 import misc.constants as const
+from game.events import EVENT, NULL_SINK, EventSink
+from game.instrumentation import PHASE, NULL_TIMER, NULL_MOVE_STATS, MoveStats, PhaseTimer
 
 class GameplayEngine:
     def __init__(self):
         '''Construct a GameplayEngine object.'''
+        self.phase_timer = NULL_TIMER
+        self.move_stats = NULL_MOVE_STATS
+        self.event_sink = NULL_SINK
+        self.state = None
         self.reset() 
 
-    def play_round(self, order: list[Player], stake: int) -> (Player, int): 
+    def play_round(self, order: list[Player], stake: int, wildcards: list[Card]=None) -> (Player, int): 
         '''Plays a round of Landlord and returns the round winner and winning stake. 
         
         Args: 
             order - A list of Player objects representing the order of play, with the landlord
                     playing first, starting the round.
             stake - An integer representing the initial stake at the beginning of the round. 
+            wildcards - A list of Card objects representing the wildcards given to the landlord, which
+                    every player has seen. Default is None.
         
         Returns: A tuple containing a player object in the first index that represents the winning player,
                 and an integer in the second index representing the total stake won from the round. 
         '''
+        start = self.phase_timer.start()
+        self.move_stats.reset()
+        for player in order:
+            player.set_move_stats(self.move_stats)
+
+        # the state's seats are in the order the players play, starting with the landlord.
+        self.state = GameState([player.get_cards() for player in reversed(order)], stake=stake, wildcards=wildcards)
+        for seat, player in enumerate(reversed(order)):
+            player.set_game_state(self.state, seat)
+
         previous_hand, previous_player_to_play_hand = None, None
         ptr = -1
         while len(order[ptr].get_cards())!=0:
+            turn_start = self.phase_timer.start()
             player = order[ptr]
             
             # check if both players skipped. 
@@ -33,17 +53,21 @@ class GameplayEngine:
             else:
                 player.set_random_hand()
             
+            self.event_sink.emit(EVENT.TURN, hand=player.get_hand())
             if player.get_hand():
                 if (self.double_round_stake(player, previous_player_to_play_hand) and
                             self.is_round_stake_below_limit(stake)):
                     stake *= 2
                 
                 previous_hand, previous_player_to_play_hand = player.get_hand(), player 
+                self.apply_move(player.get_hand())
                 player.play_hand()
                 player.hand.reset()
             else:
                 # player skips
-                pass
+                self.apply_move(None)
+
+            self.phase_timer.stop(PHASE.TURN, turn_start)
 
             # check is player has won
             if len(player.get_cards())==0:
@@ -52,8 +76,73 @@ class GameplayEngine:
             # choose next player
             ptr = (ptr-1)%3
         
+        self.phase_timer.stop(PHASE.PLAY, start)
         return previous_player_to_play_hand, stake
     
+    def get_state(self) -> GameState or None:
+        '''Return a GameState object holding the position of the round being played, or the final
+        position of the last round played, or None before the first round. The state's seats are in
+        the order the players play, so the landlord is seat 0, see state.GameState.'''
+        return self.state
+
+    def apply_move(self, hand: list[Card] or None) -> None:
+        '''Play the hand, or pass when the hand is None or empty, for the seat to play in the state of
+        the round, updating the cards, the turn, the hand on the table and the stake. The players' 
+        cards are not changed, so a search can look ahead from the position and undo each move with
+        undo_move(), without copying the players, see state.GameState.apply_move().
+
+        Args:
+            hand - A list of Card objects representing the hand played, or None to pass.
+
+        Raises: ValueError when no round has been played, or the move can not be made.
+        '''
+        if self.state is None:
+            raise ValueError("A round must be played before a move can be made.")
+
+        self.state.apply_move(get_rank_counts(hand) if hand else None)
+
+    def undo_move(self) -> None:
+        '''Undo the last move made by apply_move(), see state.GameState.undo_move().
+
+        Raises: ValueError when there is no move to undo.
+        '''
+        if self.state is None:
+            raise ValueError("There is no move to undo.")
+
+        self.state.undo_move()
+
+    def set_phase_timer(self, phase_timer: PhaseTimer or None) -> None:
+        '''Set the timer recording the time spent playing rounds, see instrumentation.PhaseTimer.
+
+        Args:
+            phase_timer - A PhaseTimer object, or None to stop recording.
+        '''
+        self.phase_timer = NULL_TIMER if phase_timer is None else phase_timer
+
+    def set_event_sink(self, event_sink: EventSink or None) -> None:
+        '''Set the sink receiving a turn event for each turn of a round, holding the hand played, or an
+        empty hand when the player passes, see events.EventSink.
+
+        Args:
+            event_sink - An EventSink object, or None to discard the events.
+        '''
+        self.event_sink = NULL_SINK if event_sink is None else event_sink
+
+    def set_move_stats(self, move_stats: MoveStats or None) -> None:
+        '''Set the statistics counting the candidate hands considered by the players. The statistics
+        are cleared at the start of each round, and hold the turns of the last round played, see 
+        get_move_stats().
+
+        Args:
+            move_stats - A MoveStats object, or None to stop counting.
+        '''
+        self.move_stats = NULL_MOVE_STATS if move_stats is None else move_stats
+
+    def get_move_stats(self) -> MoveStats:
+        '''Return the statistics of the candidate hands considered by the players in the last round.
+        Use MoveStats.merge() to add up the statistics of many rounds.'''
+        return self.move_stats
+
     def get_play_order(self, landlord: Player, peasants: list[Player]) -> list[Player]:
         '''Returns a list of Player objects representing the play order of the round of landlord.
         
@@ -70,11 +159,12 @@ class GameplayEngine:
             player - A Player object representing the current player who is playing a hand.
             previous_player - A Player object representing the previous player to play a hand. 
         '''
-        card_number_freq = defaultdict(int)
-        for card in player.get_hand():
-            card_number_freq[card.get_number()] += 1
+        if player==previous_player:
+            return True
 
-        return player==previous_player or rules.is_bomb(card_number_freq) or rules.is_rocket(card_number_freq)
+        hand_class = player.hand.get_hand_class(player.get_hand())
+        return (hand_class is not rules.NOT_A_HAND and 
+            (hand_class[0]==const.CARD_CATEGORY.BOMB or hand_class[0]==const.CARD_CATEGORY.ROCKET))
     
     def is_round_stake_below_limit(self, stake):
         return stake < const.MAX_STAKE_LIMIT
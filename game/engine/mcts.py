@@ -0,0 +1,518 @@
+import math
+import multiprocessing
+import os
+import random
+import time
+import game.rules as rules
+import misc.constants as const
+from game.core.card import Card
+from game.core.hand import generate_hand_rank_counts
+from game.core.player import Player
+from game.engine.endgame import BITS_PER_RANK, pack_rank_counts, unpack_rank_counts
+from game.engine.state import GameState
+from game.instrumentation import PHASE
+
+TOTAL_SEATS = 3
+# the landlord is the first seat of a round, see state.GameState.
+LANDLORD_SEAT = 0
+DEFAULT_PLAYOUTS = 1000
+# the exploration constant of the upper confidence bound used to choose a move in the tree.
+DEFAULT_EXPLORATION = 0.7
+# the number of generated move lists kept before they are cleared.
+DEFAULT_CACHE_SIZE = 1 << 17
+# the probability of leading with a single card in a playout, see CardHand.set_random_hand().
+PLAY_SINGLE_PROB = 0.3
+# the number of cards of each rank in a full deck.
+DECK_RANK_COUNTS = tuple([4] * 13 + [1, 1])
+# the packed rank counts of one card of each rank, see endgame.pack_rank_counts().
+RANK_UNITS = tuple(1 << (rank * BITS_PER_RANK) for rank in range(const.TOTAL_RANKS))
+# the packed rank counts and the class of the solo of each rank.
+SOLO_MOVES = tuple((RANK_UNITS[rank], rules.classify(tuple(int(index==rank) for index in range(const.TOTAL_RANKS))))
+                   for rank in range(const.TOTAL_RANKS))
+# the move key of a pass.
+PASS = 0
+# the hand class cached with the moves a leading seat chooses from in a playout, which are every hand
+# but the solos, see MCTSSearch._get_leading_moves().
+LEADING_CLASS = -1
+
+def get_position(state: GameState) -> tuple:
+    '''Return the position seen by the seat to play, holding only what the seat knows: its own cards,
+    the cards it has not seen, the number of cards held by each seat, the hand on the table and the
+    wildcards the landlord still holds. The wildcards are shown to every seat, so a peasant knows the
+    landlord holds them until a card of their rank is played by the landlord. The position is a tuple
+    of integers, so it is small to store or send to another process.
+
+    Args:
+        state - A GameState object holding the round being played.
+
+    Returns: A tuple containing the seat to play, its packed cards, the packed cards it has not seen,
+            a tuple of the number of cards held by each seat, the packed hand on the table, or 0
+            when the seat leads, the seat that played the hand on the table, or None, and the packed
+            unseen cards known to be held by the landlord, see endgame.pack_rank_counts().
+    '''
+    turn = state.get_turn()
+    unseen = list(DECK_RANK_COUNTS)
+    for rank, count in enumerate(state.get_rank_counts(turn)):
+        unseen[rank] -= count
+
+    wildcards = [0] * const.TOTAL_RANKS
+    if turn!=LANDLORD_SEAT and state.get_wildcards() is not None:
+        wildcards = list(state.get_wildcards())
+
+    for move in state.get_history():
+        if move[0] is not None:
+            for rank, count in enumerate(move[0]):
+                unseen[rank] -= count
+                # the second item of a move is the seat that made it.
+                if move[1]==LANDLORD_SEAT:
+                    wildcards[rank] = max(0, wildcards[rank] - count)
+
+    previous_hand = state.get_previous_hand()
+    return (turn, pack_rank_counts(state.get_rank_counts(turn)), pack_rank_counts(unseen),
+            tuple(state.get_total_cards(seat) for seat in range(TOTAL_SEATS)),
+            0 if previous_hand is None else pack_rank_counts(previous_hand), state.get_previous_player(),
+            pack_rank_counts(wildcards))
+
+class MCTSNode:
+    __slots__ = ('landlord_moved', 'children', 'visits', 'wins', 'available')
+
+    def __init__(self, landlord_moved: bool):
+        '''Construct an MCTSNode object, holding the statistics of a move in the search tree.
+
+        Args:
+            landlord_moved - A boolean that is True if the landlord made the move, False if a peasant did.
+        '''
+        self.landlord_moved = landlord_moved
+        self.children = dict()
+        self.visits = 0
+        self.wins = 0
+        self.available = 1
+
+class MCTSSearch:
+    def __init__(self, rng: random.Random=None, exploration: float=DEFAULT_EXPLORATION,
+                 cache_size: int=DEFAULT_CACHE_SIZE):
+        '''Construct an MCTSSearch object. An MCTSSearch object chooses a move with an information set
+        Monte Carlo tree search. The seat to play does not know the other seats' cards, so each
+        playout deals the cards it has not seen to the other seats at random, keeping the number of
+        cards each seat holds and giving the landlord the wildcards it still holds. The playout then
+        descends one tree shared by every deal, choosing the moves that can be made in the deal by
+        their upper confidence bound, and plays the rest of the round with the random policy of
+        Player, scoring a win for the team of the seat that made each move. The move played the most
+        is chosen.
+
+        The search never builds Card objects. Each seat's cards are an integer packing the number of
+        cards of each rank, so a hand is played by subtraction, and the moves generated for a set of
+        cards and a hand on the table are cached.
+
+        Args:
+            rng - A random number generator, such as a random.Random object. Default is None, which
+                    uses the global random module.
+            exploration - A float representing the exploration constant of the upper confidence
+                    bound. Default is DEFAULT_EXPLORATION.
+            cache_size - An integer representing the number of move lists cached before the cache
+                    is cleared. Default is DEFAULT_CACHE_SIZE.
+        '''
+        self.rng = random if rng is None else rng
+        self.exploration = exploration
+        self.cache_size = cache_size
+        self.moves = dict()
+        self.playouts = 0
+
+    def set_rng(self, rng: random.Random or None) -> None:
+        '''Set the random number generator used to deal the unseen cards and choose the moves.
+
+        Args:
+            rng - A random number generator, or None to use the global random module.
+        '''
+        self.rng = random if rng is None else rng
+
+    def search(self, position: tuple, playouts: int=DEFAULT_PLAYOUTS, time_limit: float=None) -> dict:
+        '''Search the position and return the number of times each move of the seat to play was
+        chosen. The search stops after the number of playouts, or once the time limit has passed.
+
+        Args:
+            position - A tuple holding the position seen by the seat to play, see get_position().
+            playouts - An integer representing the most playouts made. Default is DEFAULT_PLAYOUTS.
+            time_limit - A float representing the most seconds spent searching. Default is None,
+                    where only the number of playouts is limited.
+
+        Returns: A dictionary mapping the packed rank counts of each move, or PASS, to the number of
+                times it was chosen.
+
+        Raises: ValueError when the unseen cards are not the cards held by the other seats, or the
+                wildcards are not unseen cards the landlord can hold.
+        '''
+        turn, cards, unseen, totals, previous_hand, previous_player, wildcards = position
+        unseen_ranks = [rank for rank, count in enumerate(unpack_rank_counts(unseen)) for _ in range(count)]
+        others = [seat for seat in range(TOTAL_SEATS) if seat!=turn]
+        if len(unseen_ranks)!=sum(totals[seat] for seat in others):
+            raise ValueError("The unseen cards must be the cards held by the other seats.")
+
+        # the landlord is given the wildcards it still holds, and the rest of the unseen cards are
+        # dealt at random.
+        wildcard_ranks = [rank for rank, count in enumerate(unpack_rank_counts(wildcards)) for _ in range(count)]
+        for rank in wildcard_ranks:
+            if turn==LANDLORD_SEAT or rank not in unseen_ranks or len(wildcard_ranks)>totals[LANDLORD_SEAT]:
+                raise ValueError("The wildcards must be unseen cards held by the landlord.")
+            unseen_ranks.remove(rank)
+
+        known = [wildcards if seat==LANDLORD_SEAT else 0 for seat in others]
+        split = totals[others[0]] - (len(wildcard_ranks) if others[0]==LANDLORD_SEAT else 0)
+
+        previous_class = rules.classify(unpack_rank_counts(previous_hand)) if previous_hand else rules.NOT_A_HAND
+        root = MCTSNode(turn!=LANDLORD_SEAT)
+        end_time = None if time_limit is None else time.perf_counter() + time_limit
+        for _ in range(playouts):
+            self.rng.shuffle(unseen_ranks)
+            seats = [cards] * TOTAL_SEATS
+            seats[others[0]] = known[0] + sum(RANK_UNITS[rank] for rank in unseen_ranks[:split])
+            seats[others[1]] = known[1] + sum(RANK_UNITS[rank] for rank in unseen_ranks[split:])
+            self._iterate(root, seats, turn, previous_class, previous_player)
+            if end_time is not None and time.perf_counter()>=end_time:
+                break
+
+        return {move: child.visits for move, child in root.children.items()}
+
+    def get_best_move(self, position: tuple, playouts: int=DEFAULT_PLAYOUTS,
+                      time_limit: float=None) -> tuple[int] or None:
+        '''Return the rank counts of the move chosen the most by the search, or None to pass. When the
+        seat to play has one move, it is returned without a search. See search() for the arguments.
+
+        Raises: ValueError when the unseen cards are not the cards held by the other seats.
+        '''
+        _, cards, _, _, previous_hand, _, _ = position
+        if not previous_hand:
+            moves = self._get_moves(cards, rules.NOT_A_HAND)
+            if len(moves)==1:
+                return unpack_rank_counts(moves[0][0])
+        elif not self._get_moves(cards, rules.classify(unpack_rank_counts(previous_hand))):
+            return None
+
+        return get_most_visited_move(self.search(position, playouts, time_limit))
+
+    def _iterate(self, root: MCTSNode, seats: list[int], turn: int, previous_class: tuple[int, int, int] or None,
+                 previous_player: int or None) -> None:
+        '''Make one playout from the root, adding a node for the first move not yet in the tree, and
+        update the statistics of each node on the way.
+
+        Args:
+            root - An MCTSNode object holding the moves of the seat to play.
+            seats - A list of three integers representing the packed cards of each seat.
+            turn - An integer representing the seat to play.
+            previous_class - A tuple containing the class of the hand on the table, or NOT_A_HAND.
+            previous_player - An integer representing the seat that played the hand on the table, or None.
+        '''
+        node, path = root, [root]
+        landlord_wins = None
+        while landlord_wins is None:
+            # the seat leads once both other seats pass.
+            if turn==previous_player:
+                previous_class, previous_player = rules.NOT_A_HAND, None
+
+            moves = self._get_moves(seats[turn], previous_class)
+            if previous_class is not rules.NOT_A_HAND:
+                moves = moves + [(PASS, previous_class)]
+
+            children = node.children
+            untried = [move for move in moves if move[0] not in children]
+            if untried:
+                move, hand_class = self.rng.choice(untried)
+                for other_move, _ in moves:
+                    if other_move in children:
+                        children[other_move].available += 1
+                child = children[move] = MCTSNode(turn==LANDLORD_SEAT)
+            else:
+                child, best_score = None, -1.0
+                for other_move, other_class in moves:
+                    other_child = children[other_move]
+                    other_child.available += 1
+                    score = (other_child.wins / other_child.visits +
+                             self.exploration * math.sqrt(math.log(other_child.available) / other_child.visits))
+                    if score>best_score:
+                        child, best_score, move, hand_class = other_child, score, other_move, other_class
+
+            path.append(child)
+            if move!=PASS:
+                seats[turn] -= move
+                if not seats[turn]:
+                    landlord_wins = turn==LANDLORD_SEAT
+                    break
+                previous_class, previous_player = hand_class, turn
+
+            turn = (turn+1) % TOTAL_SEATS
+            node = child
+            if untried:
+                landlord_wins = self._playout(seats, turn, previous_class, previous_player)
+
+        for node in path:
+            node.visits += 1
+            if node.landlord_moved==landlord_wins:
+                node.wins += 1
+
+        self.playouts += 1
+
+    def _playout(self, seats: list[int], turn: int, previous_class: tuple[int, int, int] or None,
+                 previous_player: int or None) -> bool:
+        '''Play the rest of the round with the random policy of Player and return True if the
+        landlord wins, False otherwise. A leading seat plays a single card with the probability
+        PLAY_SINGLE_PROB, or its last card, and any hand but a solo otherwise, or a single card when it
+        has no other hand. A following seat plays any hand
+        that beats the hand on the table, and passes when it has none, see CardHand.set_random_hand().
+        See _iterate() for the arguments.
+        '''
+        rng = self.rng
+        while True:
+            if turn==previous_player:
+                previous_class, previous_player = rules.NOT_A_HAND, None
+
+            cards = seats[turn]
+            if previous_class is rules.NOT_A_HAND:
+                moves = None
+                if cards not in RANK_UNITS and rng.random()>=PLAY_SINGLE_PROB:
+                    moves = self._get_leading_moves(cards)
+
+                if moves:
+                    move, hand_class = rng.choice(moves)
+                else:
+                    card_ranks = [rank for rank, count in enumerate(unpack_rank_counts(cards)) for _ in range(count)]
+                    move, hand_class = SOLO_MOVES[rng.choice(card_ranks)]
+            else:
+                moves = self._get_moves(cards, previous_class)
+                if not moves:
+                    turn = (turn+1) % TOTAL_SEATS
+                    continue
+                move, hand_class = rng.choice(moves)
+
+            seats[turn] = cards - move
+            if not seats[turn]:
+                return turn==LANDLORD_SEAT
+
+            previous_class, previous_player = hand_class, turn
+            turn = (turn+1) % TOTAL_SEATS
+
+    def _get_moves(self, cards: int, previous_class: tuple[int, int, int] or None) -> list[tuple[int, tuple]]:
+        '''Return a list of tuples containing the packed rank counts and the class of each hand that can
+        be played from the cards.
+
+        Args:
+            cards - An integer representing the packed cards of a seat.
+            previous_class - A tuple containing the class of the hand on the table, or NOT_A_HAND.
+        '''
+        key = (cards, previous_class)
+        moves = self.moves.get(key)
+        if moves is None:
+            if len(self.moves)>=self.cache_size:
+                self.moves.clear()
+
+            hands = generate_hand_rank_counts(unpack_rank_counts(cards), previous_class)
+            moves = self.moves[key] = [(pack_rank_counts(hand), rules.classify(hand)) for hand in hands]
+
+        return moves
+
+    def _get_leading_moves(self, cards: int) -> list[tuple[int, tuple]]:
+        '''Return the moves a leading seat chooses from in a playout, when it does not play a single
+        card: every hand that can be played from the cards but the solos, see _get_moves().
+
+        Args:
+            cards - An integer representing the packed cards of a seat.
+        '''
+        key = (cards, LEADING_CLASS)
+        moves = self.moves.get(key)
+        if moves is None:
+            moves = [move for move in self._get_moves(cards, rules.NOT_A_HAND) if move[1][0]!=const.CARD_CATEGORY.SOLO]
+            self.moves[key] = moves
+
+        return moves
+
+    def get_playouts(self) -> int:
+        '''Return the number of playouts made since the search was cleared.'''
+        return self.playouts
+
+    def clear(self) -> None:
+        '''Clear the cached moves and the number of playouts made.'''
+        self.moves.clear()
+        self.playouts = 0
+
+    def close(self) -> None:
+        '''Release the processes held by the search. A search in the current process holds none.'''
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+# the search of a worker process, kept between tasks so its cached moves are reused.
+_worker_search = None
+
+def _init_search_worker(exploration: float, cache_size: int) -> None:
+    '''Create the search of a worker process, see ParallelMCTSSearch.
+
+    Args:
+        exploration - A float representing the exploration constant, see MCTSSearch().
+        cache_size - An integer representing the number of move lists cached, see MCTSSearch().
+    '''
+    global _worker_search
+    _worker_search = MCTSSearch(exploration=exploration, cache_size=cache_size)
+
+def _search_task(task: tuple) -> tuple[dict, int]:
+    '''Search a position in a worker process with an independent tree, and return the number of
+    times each move was chosen and the number of playouts made.
+
+    Args:
+        task - A tuple containing the position, the most playouts made, the time the search must 
+                stop by, as seconds since the epoch, or None, and the seed of the search.
+    '''
+    position, playouts, end_time, seed = task
+    _worker_search.set_rng(random.Random(seed))
+    time_limit = None if end_time is None else max(0.0, end_time - time.time())
+    start_playouts = _worker_search.get_playouts()
+    visits = _worker_search.search(position, playouts, time_limit)
+    return visits, _worker_search.get_playouts() - start_playouts
+
+class ParallelMCTSSearch(MCTSSearch):
+    def __init__(self, processes: int=None, rng: random.Random=None, exploration: float=DEFAULT_EXPLORATION,
+                 cache_size: int=DEFAULT_CACHE_SIZE):
+        '''Construct a ParallelMCTSSearch object. A ParallelMCTSSearch object splits the playouts of
+        each search across a pool of processes. Each process grows an independent tree from the
+        position, and the number of times each move was chosen is summed over the trees. The pool is
+        started by the first search and kept until the search is closed, so the processes and their
+        cached moves are reused by every decision. Only the position, a tuple of integers, and the
+        counts of the moves are sent between the processes, see get_position().
+
+        The searches are seeded from the random number generator, so a search with a limited number
+        of playouts does not depend on the order the processes finish in.
+
+        Args:
+            processes - An integer representing the number of worker processes. Default is None, which
+                        uses one process per CPU. The search runs in the current process when 1.
+            rng - A random number generator, see MCTSSearch(). Default is None.
+            exploration - A float representing the exploration constant, see MCTSSearch(). Default is
+                    DEFAULT_EXPLORATION.
+            cache_size - An integer representing the number of move lists cached by each process, see
+                    MCTSSearch(). Default is DEFAULT_CACHE_SIZE.
+        '''
+        super().__init__(rng, exploration, cache_size)
+        self.processes = processes or os.cpu_count()
+        self.pool = None
+
+    def search(self, position: tuple, playouts: int=DEFAULT_PLAYOUTS, time_limit: float=None) -> dict:
+        '''Search the position across the worker processes and return the number of times each move
+        of the seat to play was chosen, summed over the trees. The playouts are shared equally by the
+        processes, and every process stops once the time limit has passed. See MCTSSearch.search()
+        for the arguments.
+
+        Raises: ValueError when the unseen cards are not the cards held by the other seats.
+        '''
+        if self.processes==1:
+            return super().search(position, playouts, time_limit)
+
+        if self.pool is None:
+            self.pool = multiprocessing.Pool(self.processes, _init_search_worker, (self.exploration, self.cache_size))
+
+        end_time = None if time_limit is None else time.time() + time_limit
+        # the seeds only use random(), so any random number generator of a Player can be used.
+        tasks = [(position, playouts // self.processes + (worker < playouts % self.processes), end_time, 
+                  int(self.rng.random() * 2**64)) for worker in range(min(self.processes, playouts))]
+        visits = dict()
+        for worker_visits, worker_playouts in self.pool.map(_search_task, tasks, chunksize=1):
+            self.playouts += worker_playouts
+            for move, count in worker_visits.items():
+                visits[move] = visits.get(move, 0) + count
+
+        return visits
+
+    def get_processes(self) -> int:
+        '''Return the number of worker processes.'''
+        return self.processes
+
+    def close(self) -> None:
+        '''Stop the worker processes. The next search starts a new pool.'''
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+def get_most_visited_move(visits: dict) -> tuple[int] or None:
+    '''Return the rank counts of the move chosen the most, or None to pass. Ties are broken by the
+    lowest packed rank counts, so the choice does not depend on the order of the moves.
+
+    Args:
+        visits - A dictionary mapping the packed rank counts of each move, or PASS, to the number of
+                times it was chosen, see MCTSSearch.search().
+
+    Raises: ValueError when no move was chosen.
+    '''
+    if not visits:
+        raise ValueError("The search must make at least one playout.")
+
+    move = max(visits, key=lambda move: (visits[move], -move))
+    return None if move==PASS else unpack_rank_counts(move)
+
+class MCTSPlayer(Player):
+    def __init__(self, rng: random.Random=None, playouts: int=DEFAULT_PLAYOUTS, time_limit: float=None,
+                 processes: int=1):
+        '''Construct an MCTSPlayer object. An MCTSPlayer object chooses each hand with a Monte Carlo
+        tree search from the state of the round, see MCTSSearch, and bids like a Player. When no
+        state is set, the player chooses hands at random like a Player.
+
+        Args:
+            rng - A random number generator used for the players' bids, hands and searches, such as
+                    a random.Random object. Default is None, which uses the global random module.
+            playouts - An integer representing the most playouts made for each hand. Default is
+                    DEFAULT_PLAYOUTS.
+            time_limit - A float representing the most seconds spent choosing each hand. Default is
+                    None, where only the number of playouts is limited.
+            processes - An integer representing the number of processes sharing each search, see
+                    ParallelMCTSSearch. Default is 1, where the search runs in the current process.
+        '''
+        super().__init__(rng)
+        self.playouts = playouts
+        self.time_limit = time_limit
+        self.search = MCTSSearch(self.rng) if processes==1 else ParallelMCTSSearch(processes, self.rng)
+
+    def set_rng(self, rng: random.Random or None) -> None:
+        '''Set the random number generator used for the players' bids, hands and searches.
+
+        Args:
+            rng - A random number generator, or None to use the global random module.
+        '''
+        super().set_rng(rng)
+        self.search.set_rng(self.rng)
+
+    def set_random_hand(self, previous_hand: list[Card]=None) -> None:
+        '''Set the hand chosen by the search, or no hand to pass, see Player.set_random_hand().
+
+        Args:
+            previous_hand - A list of Card objects that represents the last hand played.
+                            Default is None.
+        '''
+        state = self.get_game_state()
+        if state is None or state.get_turn()!=self.get_seat() or state.is_round_over():
+            super().set_random_hand(previous_hand)
+            return
+
+        start = self.phase_timer.start()
+        move = self.search.get_best_move(get_position(state), self.playouts, self.time_limit)
+        self.phase_timer.stop(PHASE.SEARCH, start)
+        if move is None:
+            self.hand.set_hand(None)
+            return
+
+        rank_counts, hand = list(move), list()
+        for card in self.get_cards():
+            rank = const.RANK_INDEX[card.get_number()]
+            if rank_counts[rank]:
+                rank_counts[rank] -= 1
+                hand.append(card)
+
+        self.hand.set_hand(hand)
+
+    def get_search(self) -> MCTSSearch:
+        '''Return the MCTSSearch object choosing the players' hands.'''
+        return self.search
+
+    def close(self) -> None:
+        '''Stop the processes searching for the players' hands, see ParallelMCTSSearch.close().'''
+        self.search.close()
@@ -0,0 +1,295 @@
+import random
+import game.rules as rules
+import misc.constants as const
+from game.core.card import Card
+from game.core.cardset import CardSet
+from game.core.hand import generate_hand_rank_counts, get_rank_counts
+
+TOTAL_SEATS = 3
+# the most cards of a rank, so each card of a rank held by a seat has its own key.
+MAX_RANK_COUNT = 4
+# the seed of the Zobrist keys, which is fixed so a position has the same hash in every process.
+ZOBRIST_SEED = 0x4c414e44
+
+def _get_zobrist_keys(rng: random.Random) -> list[list[int]]:
+    '''Return a 2-dimensional list of random 64-bit integers, with a key for each card of each rank.
+    The keys are stored as prefixes: the value at [rank][n] is the exclusive or of the keys of the
+    first n cards of the rank, so the keys of any number of cards of a rank are found in one step.
+
+    Args:
+        rng - A random.Random object used to create the keys.
+    '''
+    prefixes = list()
+    for _ in range(const.TOTAL_RANKS):
+        prefix = [0]
+        for _ in range(MAX_RANK_COUNT):
+            prefix.append(prefix[-1] ^ rng.getrandbits(64))
+        prefixes.append(prefix)
+
+    return prefixes
+
+_rng = random.Random(ZOBRIST_SEED)
+# the keys of the cards of each rank held by each seat, and in the hand on the table.
+SEAT_KEYS = [_get_zobrist_keys(_rng) for _ in range(TOTAL_SEATS)]
+TABLE_KEYS = _get_zobrist_keys(_rng)
+# the key of the seat to play, and of the number of seats that passed since the hand on the table.
+TURN_KEYS = [_rng.getrandbits(64) for _ in range(TOTAL_SEATS)]
+PASS_KEYS = [_rng.getrandbits(64) for _ in range(TOTAL_SEATS)]
+del _rng
+
+def _get_cards_hash(rank_counts: tuple[int] or list[int], keys: list[list[int]]) -> int:
+    '''Return the exclusive or of the key of each card in the rank counts.
+
+    Args:
+        rank_counts - A tuple of 15 integers representing the number of cards of each rank.
+        keys - A 2-dimensional list of the keys of the cards of each rank, see _get_zobrist_keys().
+    '''
+    cards_hash = 0
+    for rank_keys, count in zip(keys, rank_counts):
+        cards_hash ^= rank_keys[count]
+
+    return cards_hash
+
+# maps the rank counts of each hand played to the keys of the hand on the table.
+_table_hashes = dict()
+
+def _get_table_hash(hand: tuple[int]) -> int:
+    '''Return the exclusive or of the key of each card in the hand on the table.
+
+    Args:
+        hand - A tuple of 15 integers representing the number of cards of each rank in the hand.
+    '''
+    table_hash = _table_hashes.get(hand)
+    if table_hash is None:
+        table_hash = _table_hashes[hand] = _get_cards_hash(hand, TABLE_KEYS)
+
+    return table_hash
+
+class GameState:
+    def __init__(self, hands: list[list[Card] or CardSet], turn: int=0, stake: int=1, 
+                 wildcards: list[Card] or CardSet=None):
+        '''Construct a GameState object. A GameState object holds a position in a round of landlord:
+        the number of cards of each rank held by each seat, the seat to play, the hand on the table
+        and the number of seats that passed since it was played. The seats are in the order they
+        play, so the seat after seat i is seat (i+1) % 3, and the landlord is seat 0 at the start of
+        a round. The suits of the cards do not change the play of a round, so they are not kept.
+
+        The position has a Zobrist hash, the exclusive or of a random key for each card held by each
+        seat, each card on the table, the seat to play and the number of passes. The hash is updated
+        as each hand is played or passed, so it can key a transposition table or detect a repeated
+        position at a constant cost per move.
+
+        The state also keeps the round stake, which is doubled by the rules of GameplayEngine, and a 
+        stack of the moves applied with apply_move(), so a search can play a line of moves and undo 
+        them without copying the state. The stake does not change the play of a round, so it is not 
+        part of the hash.
+
+        Args:
+            hands - A list containing three lists of Card objects or CardSet objects, representing the
+                    cards held by each seat.
+            turn - An integer representing the seat to play. Default is 0.
+            stake - An integer representing the round stake. Default is 1.
+            wildcards - A list of Card objects or a CardSet object representing the wildcards given
+                    to the landlord, which every seat has seen. Default is None.
+
+        Raises: ValueError when there are not three seats, or the turn is not a seat.
+        '''
+        if len(hands)!=TOTAL_SEATS or turn not in range(TOTAL_SEATS):
+            raise ValueError(f"The state must contain three seats, and the turn '{turn}' must be seat 0, 1 or 2.")
+
+        self.hands = [list(get_rank_counts(cards)) for cards in hands]
+        self.turn = turn
+        self.previous_hand = None
+        self.previous_player = None
+        self.passes = 0
+        self.last_player = None
+        self.stake = stake
+        self.wildcards = None if wildcards is None else get_rank_counts(wildcards)
+        self.history = list()
+        self.hash = self.compute_hash()
+
+    def compute_hash(self) -> int:
+        '''Return the Zobrist hash of the position, computed from every card. The hash kept by the
+        state, see get_hash(), is always equal to it.'''
+        position_hash = TURN_KEYS[self.turn] ^ PASS_KEYS[self.passes]
+        for seat, rank_counts in enumerate(self.hands):
+            position_hash ^= _get_cards_hash(rank_counts, SEAT_KEYS[seat])
+
+        if self.previous_hand is not None:
+            position_hash ^= _get_table_hash(self.previous_hand)
+
+        return position_hash
+
+    def play_hand(self, hand: list[Card] or CardSet) -> None:
+        '''Play the hand from the cards of the seat to play, and pass the turn to the next seat.
+
+        Args:
+            hand - A list of Card objects or a CardSet object representing the hand played.
+
+        Raises: ValueError when the hand is empty, or the seat to play does not hold its cards.
+        '''
+        self.play_rank_counts(get_rank_counts(hand))
+
+    def play_rank_counts(self, hand: tuple[int]) -> None:
+        '''Play the hand from the cards of the seat to play, and pass the turn to the next seat.
+
+        Args:
+            hand - A tuple of 15 integers representing the number of cards of each rank in the hand.
+
+        Raises: ValueError when the hand is empty, or the seat to play does not hold its cards.
+        '''
+        hand = tuple(hand)
+        rank_counts = self.hands[self.turn]
+        if not any(hand) or any(played>held for played, held in zip(hand, rank_counts)):
+            raise ValueError(f"Seat {self.turn} does not hold the cards in the hand {hand}.")
+
+        position_hash = self.hash ^ PASS_KEYS[self.passes] ^ PASS_KEYS[0] ^ _get_table_hash(hand)
+        if self.previous_hand is not None:
+            position_hash ^= _get_table_hash(self.previous_hand)
+
+        # the stake doubles when a seat plays after both other seats passed its hand, or plays a bomb 
+        # or the rocket, see GameplayEngine.double_round_stake().
+        hand_class = rules.classify(hand)
+        if ((self.turn==self.last_player or (hand_class is not rules.NOT_A_HAND and 
+                hand_class[0] in (const.CARD_CATEGORY.BOMB, const.CARD_CATEGORY.ROCKET)))
+                and self.stake<const.MAX_STAKE_LIMIT):
+            self.stake *= 2
+
+        # the played cards are the last cards of each rank held by the seat.
+        seat_keys = SEAT_KEYS[self.turn]
+        for rank, count in enumerate(hand):
+            if count:
+                held = rank_counts[rank]
+                position_hash ^= seat_keys[rank][held] ^ seat_keys[rank][held-count]
+                rank_counts[rank] = held - count
+
+        self.hash = position_hash
+        self.previous_hand, self.previous_player, self.passes = hand, self.turn, 0
+        self.last_player = self.turn
+        self._next_turn()
+
+    def pass_turn(self) -> None:
+        '''Pass the turn to the next seat without playing a hand. Once both other seats pass, the hand
+        on the table is cleared and the seat that played it leads.
+
+        Raises: ValueError when the seat to play leads, as a leading seat must play a hand.
+        '''
+        if self.previous_hand is None:
+            raise ValueError(f"Seat {self.turn} leads, so it can not pass.")
+
+        position_hash = self.hash ^ PASS_KEYS[self.passes]
+        self.passes += 1
+        if self.passes==TOTAL_SEATS-1:
+            position_hash ^= _get_table_hash(self.previous_hand)
+            self.previous_hand, self.previous_player, self.passes = None, None, 0
+
+        self.hash = position_hash ^ PASS_KEYS[self.passes]
+        self._next_turn()
+
+    def apply_move(self, hand: tuple[int] or None) -> None:
+        '''Play the hand, or pass when the hand is None, for the seat to play, and keep the move so it
+        can be undone by undo_move().
+
+        Args:
+            hand - A tuple of 15 integers representing the number of cards of each rank in the hand, 
+                    or None to pass.
+
+        Raises: ValueError when the round is over or the move can not be made, see play_rank_counts()
+                and pass_turn().
+        '''
+        if self.is_round_over():
+            raise ValueError("The round is over, so no more moves can be made.")
+
+        move = (hand, self.turn, self.previous_hand, self.previous_player, self.passes, self.last_player, 
+                self.stake, self.hash)
+        if hand is None:
+            self.pass_turn()
+        else:
+            self.play_rank_counts(hand)
+
+        self.history.append(move)
+
+    def undo_move(self) -> None:
+        '''Undo the last move made by apply_move(), restoring the seat's cards, the turn, the hand on 
+        the table, the number of passes, the stake and the hash.
+
+        Raises: ValueError when there is no move to undo.
+        '''
+        if not self.history:
+            raise ValueError("There is no move to undo.")
+
+        (hand, self.turn, self.previous_hand, self.previous_player, self.passes, self.last_player, 
+         self.stake, self.hash) = self.history.pop()
+        if hand is not None:
+            rank_counts = self.hands[self.turn]
+            for rank, count in enumerate(hand):
+                rank_counts[rank] += count
+
+    def get_legal_moves(self) -> list[tuple[int] or None]:
+        '''Return a list of the moves the seat to play can make: the rank counts of each hand it can 
+        play, followed by None when it can pass.'''
+        if self.previous_hand is None:
+            return list(generate_hand_rank_counts(tuple(self.hands[self.turn])))
+
+        moves = list(generate_hand_rank_counts(tuple(self.hands[self.turn]), rules.classify(self.previous_hand)))
+        moves.append(None)
+        return moves
+
+    def get_history(self) -> list[tuple]:
+        '''Return the stack of moves made by apply_move() that can be undone, with the last move at 
+        the end.'''
+        return self.history
+
+    def _next_turn(self) -> None:
+        '''Move the turn to the next seat, updating the hash.'''
+        next_turn = (self.turn+1) % TOTAL_SEATS
+        self.hash ^= TURN_KEYS[self.turn] ^ TURN_KEYS[next_turn]
+        self.turn = next_turn
+
+    def get_hash(self) -> int:
+        '''Return the 64-bit Zobrist hash of the position.'''
+        return self.hash
+
+    def get_turn(self) -> int:
+        '''Return the seat to play.'''
+        return self.turn
+
+    def get_rank_counts(self, seat: int) -> tuple[int]:
+        '''Return a tuple of 15 integers representing the number of cards of each rank held by the seat.
+
+        Args:
+            seat - An integer representing the seat.
+        '''
+        return tuple(self.hands[seat])
+
+    def get_total_cards(self, seat: int) -> int:
+        '''Return the number of cards held by the seat.
+
+        Args:
+            seat - An integer representing the seat.
+        '''
+        return sum(self.hands[seat])
+
+    def get_previous_hand(self) -> tuple[int] or None:
+        '''Return the rank counts of the hand on the table, or None when the seat to play leads.'''
+        return self.previous_hand
+
+    def get_previous_player(self) -> int or None:
+        '''Return the seat that played the hand on the table, or None when the seat to play leads.'''
+        return self.previous_player
+
+    def get_stake(self) -> int:
+        '''Return the round stake.'''
+        return self.stake
+
+    def get_wildcards(self) -> tuple[int] or None:
+        '''Return the rank counts of the wildcards given to the landlord, or None when they are not known.'''
+        return self.wildcards
+
+    def get_passes(self) -> int:
+        '''Return the number of seats that passed since the hand on the table was played.'''
+        return self.passes
+
+    def is_round_over(self) -> bool:
+        '''Return True if a seat has played all of its cards, False otherwise.'''
+        return not all(any(rank_counts) for rank_counts in self.hands)
@@ -0,0 +1,160 @@
+import abc
+import collections
+import json
+import sys
+from typing import TextIO
+from game.core.cardset import CardSet
+
+class EVENT:
+    DEAL = "deal"
+    BID = "bid"
+    TURN = "turn"
+    PLAY = "play"
+    SETTLE = "settle"
+
+DEFAULT_CAPACITY = 1024
+DEFAULT_BUFFER_SIZE = 256
+
+def _encode_value(value):
+    '''Return a value that can be written as JSON in place of a Card or CardSet object.
+
+    Args:
+        value - A Card object, a CardSet object or a Player object in an event.
+    '''
+    if isinstance(value, CardSet):
+        return value.get_cards()
+
+    return str(value)
+
+class EventSink(abc.ABC):
+    def is_enabled(self) -> bool:
+        '''Return True if the events are being kept, False otherwise.'''
+        return True
+
+    @abc.abstractmethod
+    def emit(self, event: str, **data) -> None:
+        '''Receive an event from the game.
+
+        Args:
+            event - A string representing the type of event, see EVENT.
+            data - The values describing the event, such as the cards dealt or the round stake.
+        '''
+        pass
+
+    def flush(self) -> None:
+        '''Write any buffered events.'''
+        pass
+
+    def close(self) -> None:
+        '''Write any buffered events and release the sink.'''
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class NullEventSink(EventSink):
+    '''An EventSink that discards every event, used by headless games.'''
+    def is_enabled(self) -> bool:
+        return False
+
+    def emit(self, event: str, **data) -> None:
+        pass
+
+# the shared sink used by the game until an EventSink is set.
+NULL_SINK = NullEventSink()
+
+class RingBufferSink(EventSink):
+    def __init__(self, capacity: int=DEFAULT_CAPACITY):
+        '''Construct a RingBufferSink object. A RingBufferSink object keeps the most recent events in
+        memory, discarding the oldest event once the buffer is full.
+
+        Args:
+            capacity - An integer representing the number of events kept. Default is DEFAULT_CAPACITY.
+
+        Raises: ValueError when the capacity is not a positive integer.
+        '''
+        if capacity<=0:
+            raise ValueError(f"The capacity '{capacity}' must be a positive integer.")
+
+        self.events = collections.deque(maxlen=capacity)
+
+    def emit(self, event: str, **data) -> None:
+        '''Keep the event in the buffer, see EventSink.emit().'''
+        data["event"] = event
+        self.events.append(data)
+
+    def get_events(self) -> list[dict]:
+        '''Return a list of dictionaries representing the events in the buffer, from the oldest to the
+        newest. Each dictionary contains the type of event under the 'event' key, and its values.'''
+        return list(self.events)
+
+    def clear(self) -> None:
+        '''Remove every event from the buffer.'''
+        self.events.clear()
+
+class BufferedFileSink(EventSink):
+    def __init__(self, path: str, buffer_size: int=DEFAULT_BUFFER_SIZE):
+        '''Construct a BufferedFileSink object. A BufferedFileSink object writes the events to a file
+        as JSON lines. The events are held in memory and written together once the buffer is full,
+        so the game does not wait on the file every event.
+
+        Args:
+            path - A string representing the path of the file.
+            buffer_size - An integer representing the number of events held before they are written.
+                    Default is DEFAULT_BUFFER_SIZE.
+
+        Raises: ValueError when the buffer size is not a positive integer.
+        '''
+        if buffer_size<=0:
+            raise ValueError(f"The buffer size '{buffer_size}' must be a positive integer.")
+
+        self.buffer_size = buffer_size
+        self.buffer = list()
+        self.file = open(path, "w")
+
+    def emit(self, event: str, **data) -> None:
+        '''Hold the event, writing the buffered events when the buffer is full, see EventSink.emit().'''
+        data["event"] = event
+        self.buffer.append(data)
+        if len(self.buffer)>=self.buffer_size:
+            self.flush()
+
+    def flush(self) -> None:
+        '''Write the buffered events to the file.'''
+        if not self.buffer:
+            return
+
+        self.file.write("".join(json.dumps(data, default=_encode_value) + "\n" for data in self.buffer))
+        self.file.flush()
+        self.buffer.clear()
+
+    def close(self) -> None:
+        '''Write the buffered events and close the file.'''
+        if self.file.closed:
+            return
+
+        self.flush()
+        self.file.close()
+
+class ConsoleSink(EventSink):
+    def __init__(self, stream: TextIO=None, events: tuple[str]=None):
+        '''Construct a ConsoleSink object. A ConsoleSink object prints each event as a line of text.
+
+        Args:
+            stream - A text stream the events are printed to. Default is None, which prints to stdout.
+            events - A tuple of strings representing the types of event printed, see EVENT. Default is
+                    None, which prints every event.
+        '''
+        self.stream = stream
+        self.events = events
+
+    def emit(self, event: str, **data) -> None:
+        '''Print the event, see EventSink.emit().'''
+        if self.events is not None and event not in self.events:
+            return
+
+        values = ", ".join(f"{name}={value}" for name, value in data.items())
+        print(f"{event}: {values}", file=self.stream or sys.stdout)
@@ -0,0 +1,300 @@
+import json
+import os
+import threading
+import time
+from misc.constants import CARD_CATEGORY as CATEGORY
+
+class PHASE:
+    ROUND = "round"
+    DEAL = "deal"
+    BID = "bid"
+    GENERATE = "generate"
+    FILTER = "filter"
+    SEARCH = "search"
+    PLAY = "play"
+    SETTLE = "settle"
+    TURN = "turn"
+
+# maps each card category to its name, such as 'solo_chain'.
+CATEGORY_NAMES = {value:name.lower() for name, value in vars(CATEGORY).items() if name.isupper()}
+
+# the phases of a round of landlord, in the order they happen. The round phase contains every other 
+# phase, the play phase contains each player's turn, and each turn contains the generate and filter phases,
+# or the search phase of a player searching for its hand.
+PHASES = (PHASE.ROUND, PHASE.DEAL, PHASE.BID, PHASE.PLAY, PHASE.TURN, PHASE.GENERATE, PHASE.FILTER, PHASE.SEARCH,
+          PHASE.SETTLE)
+
+class PhaseTimer:
+    def __init__(self):
+        '''Construct a PhaseTimer object. A PhaseTimer object records the wall time and the number of
+        calls of each phase of a game of landlord. A phase is timed by calling start() when the phase
+        begins and stop() with the returned value when it ends.'''
+        self.reset()
+
+    def is_enabled(self) -> bool:
+        '''Return True if the phases are being recorded, False otherwise.'''
+        return True
+
+    def start(self) -> int:
+        '''Return the start time of a phase, in nanoseconds.'''
+        return time.perf_counter_ns()
+
+    def stop(self, phase: str, start: int) -> None:
+        '''Record a call of the phase that began at the start time.
+
+        Args:
+            phase - A string representing the phase, see PHASE.
+            start - An integer representing the start time of the phase, see start().
+        '''
+        self.total_ns[phase] = self.total_ns.get(phase, 0) + time.perf_counter_ns() - start
+        self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def get_calls(self, phase: str) -> int:
+        '''Return the number of calls of the phase.
+
+        Args:
+            phase - A string representing the phase, see PHASE.
+        '''
+        return self.calls.get(phase, 0)
+
+    def get_total_time(self, phase: str) -> float:
+        '''Return the total wall time of the phase, in seconds.
+
+        Args:
+            phase - A string representing the phase, see PHASE.
+        '''
+        return self.total_ns.get(phase, 0) / 1e9
+
+    def get_summary(self) -> dict:
+        '''Return a dictionary mapping each phase to its number of calls, its total wall time and its
+        mean wall time per call, in seconds. The dictionary can be written as JSON.'''
+        phases = list(PHASES) + [phase for phase in self.calls if phase not in PHASES]
+        return {phase:{"calls":self.get_calls(phase),
+                       "total_seconds":self.get_total_time(phase),
+                       "mean_seconds":self.get_total_time(phase) / max(self.get_calls(phase), 1)}
+                for phase in phases}
+
+    def to_json(self) -> str:
+        '''Return the summary of the phases as a JSON string, see get_summary().'''
+        return json.dumps(self.get_summary(), indent=2)
+
+    def format_table(self) -> str:
+        '''Return the summary of the phases as a table, with the mean time per call in microseconds.'''
+        rows = [f"{'phase':<10}{'calls':>10}{'total (s)':>12}{'mean (us)':>12}"]
+        for phase, summary in self.get_summary().items():
+            rows.append(f"{phase:<10}{summary['calls']:>10}{summary['total_seconds']:>12.4f}"
+                        f"{summary['mean_seconds'] * 1e6:>12.1f}")
+
+        return "\n".join(rows)
+
+    def reset(self) -> None:
+        '''Clear the recorded phases.'''
+        self.calls = dict()
+        self.total_ns = dict()
+
+class NullPhaseTimer(PhaseTimer):
+    '''A PhaseTimer that records nothing, used when the instrumentation is disabled.'''
+    def is_enabled(self) -> bool:
+        return False
+
+    def start(self) -> int:
+        return 0
+
+    def stop(self, phase: str, start: int) -> None:
+        pass
+
+# the shared timer used by the game objects until a PhaseTimer is set.
+NULL_TIMER = NullPhaseTimer()
+
+class ChromeTracer(PhaseTimer):
+    def __init__(self, path: str):
+        '''Construct a ChromeTracer object. A ChromeTracer object is a PhaseTimer that also writes each
+        phase to a file as a Chrome trace event, which can be viewed as a timeline in Perfetto or
+        chrome://tracing. The events are written as each phase ends, and the file is completed by 
+        close().
+
+        Args:
+            path - A string representing the path of the trace file.
+        '''
+        super().__init__()
+        self.file = open(path, "w")
+        self.origin_ns = time.perf_counter_ns()
+        self.pid, self.tid = os.getpid(), threading.get_ident()
+        self.file.write("[\n")
+        self._write_event({"name":"process_name", "ph":"M", "pid":self.pid, "tid":self.tid, 
+                           "args":{"name":"landlord"}})
+
+    def stop(self, phase: str, start: int) -> None:
+        '''Record a call of the phase that began at the start time, and write it to the trace file.
+
+        Args:
+            phase - A string representing the phase, see PHASE.
+            start - An integer representing the start time of the phase, see start().
+        '''
+        end = time.perf_counter_ns()
+        super().stop(phase, start)
+        if self.file.closed:
+            return
+
+        # trace event times are in microseconds.
+        self._write_event({"name":phase, "ph":"X", "ts":(start - self.origin_ns) / 1000, 
+                           "dur":(end - start) / 1000, "pid":self.pid, "tid":self.tid})
+
+    def _write_event(self, event: dict) -> None:
+        '''Write a trace event to the trace file.
+
+        Args:
+            event - A dictionary representing the trace event.
+        '''
+        self.file.write(json.dumps(event, separators=(",", ":")) + ",\n")
+
+    def close(self) -> None:
+        '''Complete and close the trace file. Phases ending after the file is closed are recorded 
+        but not written.'''
+        if self.file.closed:
+            return
+
+        self.file.write(json.dumps({"name":"trace_end", "ph":"i", "ts":(time.perf_counter_ns() - self.origin_ns) / 1000,
+                                    "pid":self.pid, "tid":self.tid, "s":"g"}) + "\n]\n")
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def get_histogram_bucket(size: int) -> int:
+    '''Return the histogram bucket of the size, the largest power of two not above the size, or 0 when
+    the size is 0.
+
+    Args:
+        size - A non-negative integer.
+    '''
+    return 1 << (size.bit_length() - 1) if size else 0
+
+class MoveStats:
+    def __init__(self):
+        '''Construct a MoveStats object. A MoveStats object counts the candidate hands considered on each
+        turn where a player chooses a hand: the hands generated in each card category, and the hands 
+        that beat the previous hand. Histograms of the number of candidates per turn, grouped into 
+        power of two buckets, show the turns where the number of hands blows up.'''
+        self.reset()
+
+    def is_enabled(self) -> bool:
+        '''Return True if the turns are being recorded, False otherwise.'''
+        return True
+
+    def record_turn(self, candidates: dict[int, int], survivors: int) -> None:
+        '''Record the candidate hands considered on a turn.
+
+        Args:
+            candidates - A dictionary mapping the card categories to the number of hands generated in 
+                    the category on the turn.
+            survivors - An integer representing the number of candidate hands that could be played.
+        '''
+        total_candidates = sum(candidates.values())
+        self.turns += 1
+        self.total_candidates += total_candidates
+        self.total_survivors += survivors
+        self.largest_turn = max(self.largest_turn, total_candidates)
+        bucket = get_histogram_bucket(total_candidates)
+        self.turn_histogram[bucket] = self.turn_histogram.get(bucket, 0) + 1
+        for category, count in candidates.items():
+            self.category_candidates[category] = self.category_candidates.get(category, 0) + count
+            histogram = self.category_histograms.setdefault(category, dict())
+            bucket = get_histogram_bucket(count)
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+
+    def merge(self, move_stats: 'MoveStats') -> None:
+        '''Add the turns recorded by another MoveStats object, such as the stats of a round.
+
+        Args:
+            move_stats - A MoveStats object.
+        '''
+        self.turns += move_stats.turns
+        self.total_candidates += move_stats.total_candidates
+        self.total_survivors += move_stats.total_survivors
+        self.largest_turn = max(self.largest_turn, move_stats.largest_turn)
+        for bucket, count in move_stats.turn_histogram.items():
+            self.turn_histogram[bucket] = self.turn_histogram.get(bucket, 0) + count
+
+        for category, count in move_stats.category_candidates.items():
+            self.category_candidates[category] = self.category_candidates.get(category, 0) + count
+
+        for category, other_histogram in move_stats.category_histograms.items():
+            histogram = self.category_histograms.setdefault(category, dict())
+            for bucket, count in other_histogram.items():
+                histogram[bucket] = histogram.get(bucket, 0) + count
+
+    def get_turns(self) -> int:
+        '''Return the number of turns recorded.'''
+        return self.turns
+
+    def get_total_candidates(self) -> int:
+        '''Return the number of candidate hands generated over every turn.'''
+        return self.total_candidates
+
+    def get_total_survivors(self) -> int:
+        '''Return the number of candidate hands that could be played over every turn.'''
+        return self.total_survivors
+
+    def get_largest_turn(self) -> int:
+        '''Return the largest number of candidate hands generated on a turn.'''
+        return self.largest_turn
+
+    def get_category_candidates(self) -> dict[int, int]:
+        '''Return a dictionary mapping the card categories to the number of hands generated in the 
+        category over every turn.'''
+        return self.category_candidates
+
+    def get_turn_histogram(self) -> dict[int, int]:
+        '''Return a dictionary mapping the histogram buckets, see get_histogram_bucket(), to the number
+        of turns where the number of candidate hands falls in the bucket.'''
+        return self.turn_histogram
+
+    def get_category_histograms(self) -> dict[int, dict[int, int]]:
+        '''Return a dictionary mapping the card categories to the histogram of the number of hands 
+        generated in the category on each turn where the category was generated.'''
+        return self.category_histograms
+
+    def get_summary(self) -> dict:
+        '''Return a summary of the recorded turns that can be written as JSON, with the card categories
+        given by name.'''
+        return {"turns":self.turns,
+                "candidates":self.total_candidates,
+                "survivors":self.total_survivors,
+                "largest_turn":self.largest_turn,
+                "turn_histogram":dict(sorted(self.turn_histogram.items())),
+                "category_candidates":{CATEGORY_NAMES[category]:count 
+                                       for category, count in sorted(self.category_candidates.items())},
+                "category_histograms":{CATEGORY_NAMES[category]:dict(sorted(histogram.items())) 
+                                       for category, histogram in sorted(self.category_histograms.items())}}
+
+    def to_json(self) -> str:
+        '''Return the summary of the recorded turns as a JSON string, see get_summary().'''
+        return json.dumps(self.get_summary(), indent=2)
+
+    def reset(self) -> None:
+        '''Clear the recorded turns.'''
+        self.turns = 0
+        self.total_candidates = 0
+        self.total_survivors = 0
+        self.largest_turn = 0
+        self.turn_histogram = dict()
+        self.category_candidates = dict()
+        self.category_histograms = dict()
+
+class NullMoveStats(MoveStats):
+    '''A MoveStats that records nothing, used when the statistics are disabled.'''
+    def is_enabled(self) -> bool:
+        return False
+
+    def record_turn(self, candidates: dict[int, int], survivors: int) -> None:
+        pass
+
+    def merge(self, move_stats: MoveStats) -> None:
+        pass
+
+# the shared statistics used by the game objects until a MoveStats object is set.
+NULL_MOVE_STATS = NullMoveStats()
@@ -0,0 +1,175 @@
+import random
+from collections.abc import Iterable, Iterator
+import game.rules as rules
+import misc.constants as const
+from example import LandlordGame
+from game.core.card import Card
+from game.core.player import Player
+from game.events import EVENT, EventSink
+from game.instrumentation import PHASE, PhaseTimer
+from game.interface.tournament import play_game
+from game.records import GameRecord, GameRecorder
+
+TOTAL_PLAYERS = 3
+
+class ReplayPlayer(Player):
+    def __init__(self):
+        '''Construct a ReplayPlayer object. A ReplayPlayer object makes the decisions recorded in a
+        GameRecord instead of random ones: it bids the recorded bid and plays the recorded hand on
+        each turn, without generating the hands it could play.'''
+        self.recorded_bid, self.moves = None, iter(())
+        super().__init__()
+
+    def set_recorded_round(self, bid: int or None, moves: Iterator[tuple[int] or None]) -> None:
+        '''Set the decisions the player makes in the next round.
+
+        Args:
+            bid - An integer representing the players' bid, or None if the player did not bid.
+            moves - An iterator over the rank counts of the hand played on each turn of the round, or
+                    None when the player passed, see GameRecord.get_moves(). The iterator is shared by
+                    the players, who take the next move on their turn.
+        '''
+        self.recorded_bid, self.moves = bid, moves
+
+    def get_random_bid_amount(self) -> int:
+        '''Return the recorded bid, see Player.get_random_bid_amount().
+
+        Raises: ValueError when the player did not bid in the recorded round.
+        '''
+        if self.recorded_bid is None:
+            raise ValueError("The player bids in the replay, but did not bid in the recorded round.")
+
+        self.set_bid(self.recorded_bid)
+        return self.get_bid_amount()
+
+    def set_random_hand(self, previous_hand: list[Card]=None) -> None:
+        '''Set the hand played on the next recorded turn, or no hand when the player passed, see
+        Player.set_random_hand().
+
+        Args:
+            previous_hand - A list of Card objects that represents the last hand played.
+                            Default is None.
+
+        Raises: ValueError when the recorded round has no more turns, or the recorded hand can not be
+                played from the players' cards.
+        '''
+        move = next(self.moves, False)
+        if move is False:
+            raise ValueError("The replay continues after the last turn of the recorded round.")
+
+        if move is None:
+            self.hand.set_hand(None)
+            return
+
+        rank_counts, hand = list(move), list()
+        for card in self.get_cards():
+            rank = const.RANK_INDEX[card.get_number()]
+            if rank_counts[rank]:
+                rank_counts[rank] -= 1
+                hand.append(card)
+
+        if any(rank_counts):
+            raise ValueError(f"The player does not hold the recorded hand {move}.")
+
+        previous_hand_class = self.hand.get_hand_class(previous_hand) if previous_hand else None
+        if not rules.can_beat(rules.classify(move), previous_hand_class):
+            raise ValueError(f"The recorded hand {move} does not beat the previous hand.")
+
+        self.hand.set_hand(hand)
+
+class ReplayGame(LandlordGame):
+    def __init__(self, records: Iterable[GameRecord], stakes: list[int]=None, phase_timer: PhaseTimer=None,
+                 event_sink: EventSink=None):
+        '''Construct a ReplayGame object. A ReplayGame object plays recorded rounds of landlord again,
+        dealing the recorded cards and driving the bidding and gameplay engines with the recorded
+        decisions. The stakes are settled by the current rules, so an archive of records can be
+        re-scored by replaying it into a records.GameRecordWriter. The records may hold several games:
+        the players' stakes are reset to the recorded stakes at the first round of each game, and are
+        carried from round to round within a game.
+
+        Args:
+            records - An iterable of GameRecord objects, such as a records.GameRecordReader object.
+            stakes - A list of three integers representing the players' stakes before the first
+                    recorded game. Default is None, where the stakes recorded before the game are used.
+            phase_timer - A PhaseTimer object recording the time spent in each phase of the game.
+                    Default is None, see SimulationInterface.
+            event_sink - An EventSink object receiving the events of the game. Default is None, see
+                    SimulationInterface.
+        '''
+        super().__init__([ReplayPlayer() for _ in range(TOTAL_PLAYERS)], None, phase_timer, event_sink)
+        self.records = iter(records)
+        self.record = None
+        self.stakes = stakes
+
+    @classmethod
+    def from_seed(cls, seed: int, max_rounds: int=None, rng_type: type=random.Random,
+                  phase_timer: PhaseTimer=None, event_sink: EventSink=None) -> 'ReplayGame':
+        '''Return a ReplayGame object replaying the game played with the seed, see
+        tournament.play_game(). The game is played once to record its decisions.
+
+        Args:
+            seed - An integer representing the seed the game was played with.
+            max_rounds - An integer representing the maximum number of rounds played. Default is None,
+                    where rounds are played until the game ends.
+            rng_type - The class of the random number generator the game was played with. Default is
+                    random.Random.
+            phase_timer - A PhaseTimer object, see ReplayGame(). Default is None.
+            event_sink - An EventSink object, see ReplayGame(). Default is None.
+        '''
+        recorder = GameRecorder()
+        play_game(0, seed, max_rounds=max_rounds, rng_type=rng_type, event_sink=recorder)
+        return cls(recorder.get_records(), phase_timer=phase_timer, event_sink=event_sink)
+
+    def play(self) -> bool:
+        '''Replay the next recorded round. True is returned if a round was replayed, False when the
+        records have been replayed.
+
+        Raises: ValueError when the recorded decisions can not be replayed, such as a recorded hand
+                that does not beat the previous hand under the current rules, or the replayed game
+                ends before its last recorded round.
+        '''
+        record = next(self.records, None)
+        if record is None:
+            return False
+
+        if self.record is None or record.get_round_number()==0:
+            # a new game starts from the stakes recorded before its first replayed round.
+            stakes = record.get_start_stakes() if self.stakes is None else self.stakes
+            for player, stake in zip(self.players, stakes):
+                player.set_stake_amount(stake)
+            self.rounds_played, self.stakes = record.get_round_number(), None
+        elif record.get_round_number()!=self.rounds_played or self.has_game_ended():
+            raise ValueError(f"The replayed game has ended or played {self.rounds_played} rounds, so round "
+                             f"{record.get_round_number()} of the recorded game can not be replayed.")
+
+        self.record = record
+
+        moves = iter(self.record.get_moves())
+        for player, bid in zip(self.players, self.record.get_bids()):
+            player.set_recorded_round(bid, moves)
+
+        if not super().play():
+            raise ValueError("Every player passed during the bidding of the recorded round.")
+
+        if next(moves, False) is not False:
+            raise ValueError("The replayed round ended before the last turn of the recorded round.")
+
+        return True
+
+    def get_record(self) -> GameRecord or None:
+        '''Return the GameRecord object of the round last replayed, or None before the first round.'''
+        return self.record
+
+    def deal_cards_to_players(self) -> list[Card]:
+        '''Deal the recorded cards to the players, see SimulationInterface.deal_cards_to_players().'''
+        start = self.phase_timer.start()
+        *hands, wildcards = self.record.get_deal()
+        for player, cards in zip(self.players, hands):
+            player.set_cards(cards)
+
+        if self.event_sink.is_enabled():
+            self.event_sink.emit(EVENT.DEAL, hands=[list(cards) for cards in hands], wildcards=list(wildcards),
+                                 round=self.rounds_played, stakes=[player.get_stake_amount() for player in self.players])
+
+        self.phase_timer.stop(PHASE.DEAL, start)
+        return wildcards
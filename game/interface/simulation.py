@@ -1,24 +1,69 @@
 import abc
+import random
 from game.engine.bidding import BiddingEngine
 from game.engine.gameplay import GameplayEngine
 from game.core.card import Card
 from game.core.deck import CardDeck
 from game.core.player import Player
+from game.events import EVENT, NULL_SINK, EventSink
+from game.instrumentation import PHASE, NULL_TIMER, PhaseTimer
 
 class SimulationInterface:
-    def __init__(self, players):
+    def __init__(self, players, rng: random.Random=None, phase_timer: PhaseTimer=None, event_sink: EventSink=None):
         '''Construct a Landlord Game object.
         
         Args:
             players - A list of Player objects that represent the players
                     in the game.
+            rng - A random number generator shared by the deck and the players, such as a
+                    random.Random object. Default is None, where the deck uses the global random
+                    module and the players keep their own generators.
+            phase_timer - A PhaseTimer object recording the time spent in each phase of the game,
+                    see set_phase_timer(). Default is None, where nothing is recorded.
+            event_sink - An EventSink object receiving the deal, bid, play and settle events of 
+                    the game, see set_event_sink(). Default is None, where the events are discarded.
         '''
         self.players = players
         self.bidding_engine = BiddingEngine()
-        self.deck = CardDeck()
+        self.deck = CardDeck(rng)
         self.gameplay_engine = GameplayEngine()
+        if rng is not None:
+            for player in self.players:
+                player.set_rng(rng)
+
+        self.rounds_played = 0
+        self.set_phase_timer(phase_timer)
+        self.set_event_sink(event_sink)
         self.reset()
 
+    def set_phase_timer(self, phase_timer: PhaseTimer or None) -> None:
+        '''Set the timer recording the time spent dealing, bidding, generating and filtering hands, 
+        playing and settling the stakes, see instrumentation.PhaseTimer. The timer is shared by the
+        engines and the players.
+
+        Args:
+            phase_timer - A PhaseTimer object, or None to stop recording.
+        '''
+        self.phase_timer = NULL_TIMER if phase_timer is None else phase_timer
+        self.bidding_engine.set_phase_timer(self.phase_timer)
+        self.gameplay_engine.set_phase_timer(self.phase_timer)
+        for player in self.players:
+            player.set_phase_timer(self.phase_timer)
+
+    def set_event_sink(self, event_sink: EventSink or None) -> None:
+        '''Set the sink receiving the events of the game, see events.EventSink. The sink is shared with
+        the gameplay engine, which emits the turns of each round.
+
+        Args:
+            event_sink - An EventSink object, or None to discard the events.
+        '''
+        self.event_sink = NULL_SINK if event_sink is None else event_sink
+        self.gameplay_engine.set_event_sink(self.event_sink)
+
+    def get_event_sink(self) -> EventSink:
+        '''Return the sink receiving the events of the game.'''
+        return self.event_sink
+
     @abc.abstractmethod
     def play(self) -> bool:
         '''Play a round of Landlord. True is returned if a round can be
@@ -32,6 +77,8 @@ class SimulationInterface:
         game_players = [p1, p2, p3]
         self.stake, self.landlord = self.bidding_engine.execute_bidding_round()
         self.peasants = [player for player in game_players if player!=self.get_landlord()]
+        self.event_sink.emit(EVENT.BID, bids=[player.get_bid_amount() for player in game_players], stake=self.stake,
+                             landlord=game_players.index(self.landlord) if self.landlord is not None else None)
         
         return not self.all_players_passed_during_bidding()
 
@@ -51,6 +98,10 @@ class SimulationInterface:
         '''Returns three Player objects.'''
         return self.players[0], self.players[1], self.players[2]
 
+    def get_rounds_played(self) -> int:
+        '''Returns an integer representing the number of rounds settled in the game.'''
+        return self.rounds_played
+
     def give_landlord_wildcards(self, wildcards: list[Card]):
         '''Adds the wildcards to the landlord players' cards.
         
@@ -75,6 +126,7 @@ class SimulationInterface:
     def deal_cards_to_players(self) -> list[Card]:
         '''Deals the deck of cards to the players in the game. Returns a list of Card objects
         that represents the remaining wildcards after the cards have been dealt to players.'''
+        start = self.phase_timer.start()
         self.deck.shuffle()
         p1, p2, p3 = self.get_players()
         c1, c2, c3, wildcards = self.deck.deal()
@@ -82,7 +134,12 @@ class SimulationInterface:
         p1.set_cards(c1)
         p2.set_cards(c2)
         p3.set_cards(c3)
+        if self.event_sink.is_enabled():
+            # the players' cards change during the round, so the event is given copies.
+            self.event_sink.emit(EVENT.DEAL, hands=[list(cards) for cards in [c1, c2, c3]], wildcards=list(wildcards),
+                                 round=self.rounds_played, stakes=[player.get_stake_amount() for player in self.players])
 
+        self.phase_timer.stop(PHASE.DEAL, start)
         return wildcards
 
     def update_players_stake(self, winner: Player, total_stake: int) -> None:
@@ -95,6 +152,7 @@ class SimulationInterface:
             total_stake - An integer representing the stake the winner player has won and the amount
                         the losing player(s) must pay.
         '''
+        start = self.phase_timer.start()
         if winner==self.get_landlord():
             for peasant in self.get_peasants():
                 if peasant.get_stake_amount()<total_stake:
@@ -113,6 +171,10 @@ class SimulationInterface:
                 self.get_landlord().set_stake_amount(self.get_landlord().get_stake_amount() - landlord_pay)
                 peasant.set_stake_amount(peasant.get_stake_amount() + landlord_pay)
 
+        self.rounds_played += 1
+        self.event_sink.emit(EVENT.SETTLE, stakes=[player.get_stake_amount() for player in self.get_players()])
+        self.phase_timer.stop(PHASE.SETTLE, start)
+
     def reset(self):
         '''Resets the round in a game of landlord.'''
         self.landlord = None 
@@ -0,0 +1,161 @@
+import hashlib
+import multiprocessing
+import os
+import random
+from collections.abc import Iterator
+from example import LandlordGame
+from game.core.player import Player
+from game.events import EventSink
+
+TOTAL_PLAYERS = 3
+
+def derive_game_seed(master_seed: int, game_number: int) -> int:
+    '''Return the seed of a game in a tournament. The seed only depends on the master seed and the
+    game number, so a game can be replayed on its own, in any process.
+
+    Args:
+        master_seed - An integer representing the seed of the tournament.
+        game_number - An integer representing the position of the game in the tournament.
+    '''
+    digest = hashlib.blake2b(f"{master_seed}:{game_number}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+class GameResult:
+    def __init__(self, game_number: int, seed: int, total_rounds: int, stakes: list[int], rounds_won: list[int]):
+        '''Construct a GameResult object. A GameResult object holds the outcome of a game of landlord
+        played in a tournament.
+
+        Args:
+            game_number - An integer representing the position of the game in the tournament.
+            seed - An integer representing the seed the game was played with.
+            total_rounds - An integer representing the number of rounds played.
+            stakes - A list of integers representing each players' stake at the end of the game.
+            rounds_won - A list of integers representing the number of rounds each player won.
+        '''
+        self.game_number = game_number
+        self.seed = seed
+        self.total_rounds = total_rounds
+        self.stakes = stakes
+        self.rounds_won = rounds_won
+
+    def get_game_number(self) -> int:
+        '''Return the position of the game in the tournament.'''
+        return self.game_number
+
+    def get_seed(self) -> int:
+        '''Return the seed the game was played with.'''
+        return self.seed
+
+    def get_total_rounds(self) -> int:
+        '''Return the number of rounds played in the game.'''
+        return self.total_rounds
+
+    def get_stakes(self) -> list[int]:
+        '''Return a list of integers representing each players' stake at the end of the game.'''
+        return self.stakes
+
+    def get_rounds_won(self) -> list[int]:
+        '''Return a list of integers representing the number of rounds each player won.'''
+        return self.rounds_won
+
+    def get_winners(self) -> list[int]:
+        '''Return a list of integers representing the players with the highest stake at the end of
+        the game.'''
+        highest_stake = max(self.stakes)
+        return [player for player, stake in enumerate(self.stakes) if stake==highest_stake]
+
+def play_game(game_number: int, seed: int, player_type: type=Player, max_rounds: int=None, 
+              rng_type: type=random.Random, event_sink: EventSink=None) -> GameResult:
+    '''Play a game of landlord until a player has no more stake, and return the result. The deck and 
+    the players share a random number generator created from the provided seed, so the game does not 
+    depend on the global random module.
+
+    Args:
+        game_number - An integer representing the position of the game in the tournament.
+        seed - An integer representing the seed the game is played with.
+        player_type - The Player class, or subclass, used to create the players. Default is Player.
+        max_rounds - An integer representing the maximum number of rounds to play. Default is None,
+                    where rounds are played until the game ends.
+        rng_type - The class of the random number generator, created with the seed as its only 
+                    argument, such as random.Random or rng.BufferedRandom. Default is random.Random.
+        event_sink - An EventSink object receiving the events of the game, such as a 
+                    records.GameRecorder object. Default is None, where the events are discarded.
+    '''
+    game = LandlordGame([player_type() for _ in range(TOTAL_PLAYERS)], rng_type(seed), event_sink=event_sink)
+    players = game.get_players()
+    total_rounds, rounds_won = 0, [0] * TOTAL_PLAYERS
+    while not game.has_game_ended() and (max_rounds is None or total_rounds<max_rounds):
+        stakes = [player.get_stake_amount() for player in players]
+        if not game.play():
+            continue
+
+        total_rounds += 1
+        for i, player in enumerate(players):
+            if player.get_stake_amount()>stakes[i]:
+                rounds_won[i] += 1
+
+    return GameResult(game_number, seed, total_rounds, [player.get_stake_amount() for player in players], rounds_won)
+
+def _play_game_task(task: tuple) -> GameResult:
+    '''Play a game of landlord in a worker process, see play_game().
+
+    Args:
+        task - A tuple containing the arguments of play_game().
+    '''
+    return play_game(*task)
+
+class TournamentRunner:
+    def __init__(self, total_games: int, master_seed: int=0, processes: int=None,
+                 player_type: type=Player, max_rounds: int=None, rng_type: type=random.Random):
+        '''Construct a TournamentRunner object. A TournamentRunner object plays many games of landlord
+        across a pool of processes. Each game is seeded from the master seed and its game number, so
+        the results do not depend on the number of processes or the order the games finish in.
+
+        Args:
+            total_games - An integer representing the number of games to play.
+            master_seed - An integer representing the seed of the tournament. Default is 0.
+            processes - An integer representing the number of worker processes. Default is None, which
+                        uses one process per CPU. The games are played in the current process when 1.
+            player_type - The Player class, or subclass, used to create the players. Default is Player.
+            max_rounds - An integer representing the maximum number of rounds in each game. Default is
+                        None, where rounds are played until each game ends.
+            rng_type - The class of the random number generator of each game, see play_game(). 
+                        Default is random.Random.
+        '''
+        self.total_games = total_games
+        self.master_seed = master_seed
+        self.processes = processes
+        self.player_type = player_type
+        self.max_rounds = max_rounds
+        self.rng_type = rng_type
+
+    def run(self) -> Iterator[GameResult]:
+        '''Yield the result of each game as soon as it finishes. The results are not in game order
+        when more than one process is used.'''
+        tasks = ((game_number, derive_game_seed(self.master_seed, game_number), self.player_type, 
+                  self.max_rounds, self.rng_type) for game_number in range(self.total_games))
+
+        if self.processes==1:
+            yield from map(_play_game_task, tasks)
+            return
+
+        processes = self.processes or os.cpu_count()
+        # several chunks per process keeps the workers busy while the slowest games finish.
+        chunk_size = max(1, self.total_games // (processes * 8))
+        with multiprocessing.Pool(processes) as pool:
+            yield from pool.imap_unordered(_play_game_task, tasks, chunksize=chunk_size)
+
+    def play(self) -> dict:
+        '''Play every game in the tournament and return a summary of the results, containing the
+        number of games and rounds played, and the rounds and games won by each player.'''
+        summary = {"games": 0, "rounds": 0, "rounds_won": [0] * TOTAL_PLAYERS, "games_won": [0] * TOTAL_PLAYERS}
+        for result in self.run():
+            summary["games"] += 1
+            summary["rounds"] += result.get_total_rounds()
+            for player in range(TOTAL_PLAYERS):
+                summary["rounds_won"][player] += result.get_rounds_won()[player]
+
+            for player in result.get_winners():
+                summary["games_won"][player] += 1
+
+        return summary
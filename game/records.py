@@ -0,0 +1,382 @@
+import struct
+from collections.abc import Iterator
+import game.rules as rules
+import misc.constants as const
+from game.core.card import Card
+from game.core.hand import get_rank_counts
+from game.core.deck import DEAL_BYTES, encode_deal, decode_deal
+from game.events import EVENT, EventSink
+
+# the first bytes of a record file, followed by the format version.
+MAGIC = b"LLGR"
+VERSION = 3
+FILE_HEADER = MAGIC + bytes([VERSION])
+
+TOTAL_PLAYERS = 3
+NO_BID = 4
+# the fixed header of a record: the number of bytes after the length, the deal and the bids. The header
+# is followed by the number of rounds played before the round in its game, the players' stakes before
+# the round, the round stake, the players' stakes after the round, the number of turns and the move of
+# each turn, each written as varints.
+RECORD_HEADER = struct.Struct(f"<H{DEAL_BYTES}sB")
+PASS = 0
+
+def _encode_move(move: tuple[int] or None, buffer: bytearray) -> None:
+    '''Append the move to the buffer: a bitmask of the ranks in the hand, followed by the number of cards
+    of each of those ranks, less one, in two bits per rank from the lowest rank. A pass is the bitmask 0
+    alone. The move is encoded from its rank counts, so the code does not depend on the hand table.
+
+    Args:
+        move - A tuple of 15 integers representing the number of cards of each rank in the hand, or
+                None for a pass.
+        buffer - A bytearray the move is appended to.
+
+    Raises: ValueError when the move is not a recognised card hand.
+    '''
+    if move is None:
+        _encode_varint(PASS, buffer)
+        return
+
+    if rules.classify(move) is rules.NOT_A_HAND:
+        raise ValueError(f"The move {move} is not a recognised card hand.")
+
+    ranks, counts, shift = 0, 0, 0
+    for rank, count in enumerate(move):
+        if count:
+            ranks |= 1 << rank
+            counts |= (count-1) << shift
+            shift += 2
+
+    _encode_varint(ranks, buffer)
+    _encode_varint(counts, buffer)
+
+def _decode_moves(data: bytes, total: int, position: int) -> tuple[list[tuple[int] or None], int]:
+    '''Return the moves encoded in the data, see _encode_move(), and the position after the last move.
+
+    Args:
+        data - A bytes object containing the encoded moves.
+        total - An integer representing the number of encoded moves.
+        position - An integer representing the position of the first move.
+
+    Raises: ValueError when the data does not contain the moves, or a move is not a recognised card hand.
+    '''
+    moves = list()
+    for _ in range(total):
+        (ranks,), position = _decode_varints(data, 1, position)
+        if ranks==PASS:
+            moves.append(None)
+            continue
+
+        (counts,), position = _decode_varints(data, 1, position)
+        move = [0] * const.TOTAL_RANKS
+        for rank in range(const.TOTAL_RANKS):
+            if ranks >> rank & 1:
+                move[rank] = (counts & 3) + 1
+                counts >>= 2
+
+        move = tuple(move)
+        if ranks>>const.TOTAL_RANKS or counts or rules.classify(move) is rules.NOT_A_HAND:
+            raise ValueError("The record contains a move that is not a recognised card hand.")
+        moves.append(move)
+
+    return moves, position
+
+def _encode_varint(number: int, buffer: bytearray) -> None:
+    '''Append the number to the buffer, 7 bits per byte with the high bit set on every byte but the last.
+
+    Args:
+        number - A non-negative integer.
+        buffer - A bytearray the number is appended to.
+    '''
+    while number>=0x80:
+        buffer.append((number & 0x7f) | 0x80)
+        number >>= 7
+
+    buffer.append(number)
+
+def _to_zigzag(number: int) -> int:
+    '''Return the number mapped to a non-negative integer, so small negative numbers stay small:
+    0, -1, 1, -2, 2 become 0, 1, 2, 3, 4.
+
+    Args:
+        number - An integer.
+    '''
+    return number * 2 if number>=0 else -number * 2 - 1
+
+def _from_zigzag(number: int) -> int:
+    '''Return the integer mapped to the non-negative number, see _to_zigzag().
+
+    Args:
+        number - A non-negative integer.
+    '''
+    return number // 2 if number % 2==0 else -(number + 1) // 2
+
+def _decode_varints(data: bytes, total: int, position: int=0) -> tuple[list[int], int]:
+    '''Return the numbers encoded in the data, see _encode_varint(), and the position after the last
+    number.
+
+    Args:
+        data - A bytes object containing the encoded numbers.
+        total - An integer representing the number of encoded numbers.
+        position - An integer representing the position of the first number. Default is 0.
+
+    Raises: ValueError when the data does not contain the numbers.
+    '''
+    numbers = list()
+    for _ in range(total):
+        number, shift = 0, 0
+        while True:
+            if position>=len(data):
+                raise ValueError("The record ends part way through a number.")
+
+            byte = data[position]
+            position += 1
+            number |= (byte & 0x7f) << shift
+            shift += 7
+            if byte<0x80:
+                break
+
+        numbers.append(number)
+
+    return numbers, position
+
+class GameRecord:
+    def __init__(self, round_number: int, start_stakes: list[int], deal_rank: int, bids: list[int or None], 
+                 round_stake: int, stakes: list[int], moves: list[tuple[int] or None]):
+        '''Construct a GameRecord object. A GameRecord object holds a round of landlord: its place in the
+        game, the players' stakes before the round, the deal, the players' bids, the hands played on each
+        turn and the outcome of the round.
+
+        Args:
+            round_number - An integer representing the number of rounds played before the round in its
+                    game, so the first round of a game is round 0.
+            start_stakes - A list of three integers representing the players' stakes before the round.
+            deal_rank - An integer representing the deal, see deck.encode_deal().
+            bids - A list of three integers, or None for the players that did not bid, representing the
+                    players' bids.
+            round_stake - An integer representing the stake won in the round.
+            stakes - A list of three integers representing the players' stakes after the round.
+            moves - A list containing the rank counts of the hand played on each turn, or None when the
+                    player passed, starting with the landlord.
+        '''
+        self.round_number = round_number
+        self.start_stakes = start_stakes
+        self.deal_rank = deal_rank
+        self.bids = bids
+        self.round_stake = round_stake
+        self.stakes = stakes
+        self.moves = moves
+
+    def get_round_number(self) -> int:
+        '''Return the number of rounds played before the round in its game.'''
+        return self.round_number
+
+    def get_start_stakes(self) -> list[int]:
+        '''Return a list of integers representing the players' stakes before the round.'''
+        return self.start_stakes
+
+    def get_deal_rank(self) -> int:
+        '''Return the integer representing the deal, see deck.encode_deal().'''
+        return self.deal_rank
+
+    def get_deal(self) -> tuple[list[Card], list[Card], list[Card], list[Card]]:
+        '''Return four lists containing Card objects, where the first three lists contain the players'
+        cards, and the final list contains the wildcards.'''
+        return decode_deal(self.deal_rank)
+
+    def get_bids(self) -> list[int or None]:
+        '''Return a list of the players' bids, with None for the players that did not bid.'''
+        return self.bids
+
+    def get_round_stake(self) -> int:
+        '''Return the stake won in the round.'''
+        return self.round_stake
+
+    def get_stakes(self) -> list[int]:
+        '''Return a list of integers representing the players' stakes after the round.'''
+        return self.stakes
+
+    def get_moves(self) -> list[tuple[int] or None]:
+        '''Return a list containing the rank counts of the hand played on each turn, or None when the
+        player passed, starting with the landlord.'''
+        return self.moves
+
+    def to_bytes(self) -> bytes:
+        '''Return the record as bytes: the fixed header followed by the round number, the stakes, the
+        number of turns and the move of each turn, see _encode_move().
+
+        Raises: ValueError when a move is not a recognised card hand, or a value does not fit the record.
+        '''
+        body = bytearray()
+        # a landlord can end a round owing more than their stake, so the stakes are zigzag encoded.
+        for number in (self.round_number, *map(_to_zigzag, self.start_stakes), self.round_stake, 
+                       *map(_to_zigzag, self.stakes), len(self.moves)):
+            _encode_varint(number, body)
+
+        for move in self.moves:
+            _encode_move(move, body)
+
+        bids = 0
+        for bid in reversed(self.bids):
+            bids = bids * (NO_BID+1) + (NO_BID if bid is None else bid)
+
+        try:
+            header = RECORD_HEADER.pack(RECORD_HEADER.size - 2 + len(body),
+                                        self.deal_rank.to_bytes(DEAL_BYTES, "little"), bids)
+        except (struct.error, OverflowError) as error:
+            raise ValueError(f"The record does not fit the record format: {error}.")
+
+        return header + body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'GameRecord':
+        '''Return the GameRecord object stored in the data, see to_bytes().
+
+        Args:
+            data - A bytes object containing a single record.
+
+        Raises: ValueError when the data is not a record.
+        '''
+        if len(data)<RECORD_HEADER.size:
+            raise ValueError("The record is shorter than the record header.")
+
+        length, deal, bids = RECORD_HEADER.unpack_from(data)
+        if length!=len(data)-2:
+            raise ValueError(f"The record length {length} does not match the {len(data)-2} bytes given.")
+
+        player_bids = list()
+        for _ in range(TOTAL_PLAYERS):
+            bid = bids % (NO_BID+1)
+            player_bids.append(None if bid==NO_BID else bid)
+            bids //= NO_BID+1
+
+        numbers, position = _decode_varints(data, 3 + 2*TOTAL_PLAYERS, RECORD_HEADER.size)
+        round_number, start_stakes = numbers[0], numbers[1:1+TOTAL_PLAYERS]
+        round_stake, stakes, total_moves = numbers[1+TOTAL_PLAYERS], numbers[2+TOTAL_PLAYERS:-1], numbers[-1]
+        moves, position = _decode_moves(data, total_moves, position)
+        if position!=len(data):
+            raise ValueError(f"The record contains {len(data)-position} bytes after its last move.")
+        return cls(round_number, list(map(_from_zigzag, start_stakes)), int.from_bytes(deal, "little"), player_bids, 
+                   round_stake, list(map(_from_zigzag, stakes)), moves)
+
+    def __eq__(self, other):
+        return isinstance(other, GameRecord) and self.to_bytes()==other.to_bytes()
+
+    def __repr__(self):
+        return (f"GameRecord(round_number={self.round_number}, start_stakes={self.start_stakes}, "
+                f"deal_rank={self.deal_rank}, bids={self.bids}, round_stake={self.round_stake}, "
+                f"stakes={self.stakes}, moves={len(self.moves)})")
+
+class GameRecorder(EventSink):
+    def __init__(self):
+        '''Construct a GameRecorder object. A GameRecorder object is an EventSink that turns the events
+        of each round into a GameRecord, and keeps the records in memory.'''
+        self.records = list()
+        self.total_records = 0
+        self._clear_round()
+
+    def emit(self, event: str, **data) -> None:
+        '''Add the event to the current round, and write the round once its stakes are settled, see
+        EventSink.emit().'''
+        if event==EVENT.DEAL:
+            self._clear_round()
+            self.round_number, self.start_stakes = data["round"], data["stakes"]
+            self.deal_rank = encode_deal(*data["hands"], data["wildcards"])
+        elif event==EVENT.BID:
+            self.bids = data["bids"]
+        elif event==EVENT.TURN:
+            hand = data["hand"]
+            self.moves.append(get_rank_counts(hand) if hand else None)
+        elif event==EVENT.PLAY:
+            self.round_stake = data["stake"]
+        elif event==EVENT.SETTLE and self.deal_rank is not None:
+            self.write(GameRecord(self.round_number, self.start_stakes, self.deal_rank, self.bids, self.round_stake, 
+                                  data["stakes"], self.moves))
+            self.total_records += 1
+            self._clear_round()
+
+    def write(self, record: GameRecord) -> None:
+        '''Keep the record of a round.
+
+        Args:
+            record - A GameRecord object.
+        '''
+        self.records.append(record)
+
+    def get_records(self) -> list[GameRecord]:
+        '''Return a list of GameRecord objects representing the rounds recorded, in the order played.'''
+        return self.records
+
+    def get_total_records(self) -> int:
+        '''Return the number of records written by the recorder.'''
+        return self.total_records
+
+    def _clear_round(self) -> None:
+        '''Clear the events of the current round.'''
+        self.round_number, self.start_stakes = 0, None
+        self.deal_rank, self.bids, self.round_stake, self.moves = None, None, 0, list()
+
+class GameRecordWriter(GameRecorder):
+    def __init__(self, path: str):
+        '''Construct a GameRecordWriter object. A GameRecordWriter object is a GameRecorder that appends
+        each record to a record file instead of keeping it in memory. The file header is written when
+        the file is empty, and existing records are kept.
+
+        Args:
+            path - A string representing the path of the record file.
+
+        Raises: ValueError when the file exists and is not a record file.
+        '''
+        super().__init__()
+        self.file = open(path, "ab")
+        if self.file.tell()==0:
+            self.file.write(FILE_HEADER)
+        else:
+            with open(path, "rb") as file:
+                if file.read(len(FILE_HEADER))!=FILE_HEADER:
+                    self.file.close()
+                    raise ValueError(f"The file '{path}' is not a record file.")
+
+    def write(self, record: GameRecord) -> None:
+        '''Append the record to the record file.
+
+        Args:
+            record - A GameRecord object.
+        '''
+        self.file.write(record.to_bytes())
+
+    def flush(self) -> None:
+        '''Write the buffered records to the record file.'''
+        self.file.flush()
+
+    def close(self) -> None:
+        '''Write the buffered records and close the record file.'''
+        if not self.file.closed:
+            self.file.close()
+
+class GameRecordReader:
+    def __init__(self, path: str):
+        '''Construct a GameRecordReader object. A GameRecordReader object reads the records in a record
+        file one at a time, so the file is never held in memory.
+
+        Args:
+            path - A string representing the path of the record file.
+        '''
+        self.path = path
+
+    def __iter__(self) -> Iterator[GameRecord]:
+        '''Yield each record in the file, see GameRecord.from_bytes().
+
+        Raises: ValueError when the file is not a record file or ends part way through a record.
+        '''
+        with open(self.path, "rb") as file:
+            if file.read(len(FILE_HEADER))!=FILE_HEADER:
+                raise ValueError(f"The file '{self.path}' is not a record file.")
+
+            while length_bytes := file.read(2):
+                length = int.from_bytes(length_bytes, "little")
+                data = file.read(length)
+                if len(length_bytes)<2 or len(data)<length:
+                    raise ValueError(f"The file '{self.path}' ends part way through a record.")
+
+                yield GameRecord.from_bytes(length_bytes + data)
@@ -1,3 +1,4 @@
+import itertools
 import misc.constants as const
 
 ''' Valid Card Hands Methods '''
@@ -8,36 +9,27 @@ def is_solo(number_freq: dict[int:int]) -> bool:
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return len(number_freq.keys())==1 and sum(number_freq.values())==1
+    return _get_category(number_freq)==const.CARD_CATEGORY.SOLO
 
 def is_solo_chain(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played is a solo chain hand, False otherwise.
 
-    Args:  
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    if contains_invalid_sequences(number_freq):
-        return False
-
-    # check chain length not exceeded
-    max_chain_length = 12
-    cards_in_hand = sum(number_freq.values())
-    if cards_in_hand<5 or cards_in_hand>max_chain_length:
-        return False
-
-    freq = convert_ace_card_to_highest_number(number_freq)
-
-    return is_chain_in_sequence(freq, cards_in_hand, 1)
+    return _get_category(number_freq)==const.CARD_CATEGORY.SOLO_CHAIN
 
 def is_pair(number_freq: dict[int:int]) -> bool:
-    '''Return True if the hand being played is a pair hand, False otherwise.
+    '''Return True if the hand being played is a pair hand, False otherwise. The rocket
+    hand is also a pair hand.
 
     Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return sum(number_freq.values())==2 and (is_rocket(number_freq) or len(number_freq.keys())==1)
+    category = _get_category(number_freq)
+    return category==const.CARD_CATEGORY.PAIR or category==const.CARD_CATEGORY.ROCKET
 
 def is_pair_chain(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played is a pair chain hand, False otherwise.
@@ -46,108 +38,62 @@ def is_pair_chain(number_freq: dict[int:int]) -> bool:
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    if contains_invalid_sequences(number_freq):
-        return False
-
-    # check chain length.
-    max_chain_length = 20
-    cards_in_hand = sum(number_freq.values())
-    if cards_in_hand<6 or cards_in_hand>max_chain_length or cards_in_hand%2==1:
-        return False
-
-    freq = convert_ace_card_to_highest_number(number_freq)
-
-    return is_chain_in_sequence(freq, cards_in_hand, 2)
+    return _get_category(number_freq)==const.CARD_CATEGORY.PAIR_CHAIN
 
 def is_trio(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played is a trio hand, False otherwise.
 
-    Args:  
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return len(number_freq.keys())==1 and sum(number_freq.values())==3
+    return _get_category(number_freq)==const.CARD_CATEGORY.TRIO
 
 def is_trio_chain(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played is a trio chain hand, False otherwise. 
     Note: A trio chain is also known as an airplane hand. 
 
-    Args:  
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    if contains_invalid_sequences(number_freq):
-        return False
-
-    # check chain length.
-    max_chain_length = 18
-    cards_in_hand = sum(number_freq.values())
-    if cards_in_hand<6 or cards_in_hand>max_chain_length or cards_in_hand%3!=0:
-        return False
-
-    freq = convert_ace_card_to_highest_number(number_freq)
+    return _get_category(number_freq)==const.CARD_CATEGORY.TRIO_CHAIN
 
-    return is_chain_in_sequence(freq, cards_in_hand, 3)
-
-def is_trio_with_solo(number_freq: dict[int: int]) -> bool:
+def is_trio_with_solo(number_freq: dict[int:int]) -> bool:
     '''Returns True if the hand is a trio with solo card hand, False otherwise.
-    
-    Args:
+
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return sum(number_freq.values())==4 and contains_solo_hand(number_freq) and contains_trio_hand(number_freq)
+    return _get_category(number_freq)==const.CARD_CATEGORY.TRIO_WITH_SOLO
 
-def is_trio_with_pair(number_freq: dict[int: int]) -> bool:
+def is_trio_with_pair(number_freq: dict[int:int]) -> bool:
     '''Returns True if the hand is a trio with pair card hand, False otherwise.
-    
-    Args:
+
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return sum(number_freq.values())==5 and contains_pair_hand(number_freq) and contains_trio_hand(number_freq) 
+    return _get_category(number_freq)==const.CARD_CATEGORY.TRIO_WITH_PAIR
 
-def is_airplane_with_solo(number_freq: dict[int: int]) -> bool:
+def is_airplane_with_solo(number_freq: dict[int:int]) -> bool:
     '''Returns True if the hand is an airplane with solo card hand, False otherwise.
-    
-    Args:
+
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    if contains_solo_hand(number_freq) and contains_trio_chain_hand(number_freq):
-        solos_needed = 0
-        for val in number_freq.values():
-            if val==3:
-                solos_needed += 1
-            elif val==1:
-                solos_needed -= 1
-            else:
-                return False 
-        
-        return solos_needed==0
-    else:
-        return  False
+    return _get_category(number_freq)==const.CARD_CATEGORY.AIRPLANE_WITH_SOLO
 
-def is_airplane_with_pair(number_freq: dict[int: int]) -> bool:
+def is_airplane_with_pair(number_freq: dict[int:int]) -> bool:
     '''Returns True if the hand is an airplane with pair card hand, False otherwise.
-    
-    Args:
+
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    if contains_pair_hand(number_freq) and contains_trio_chain_hand(number_freq):
-        pairs_needed = 0
-        for val in number_freq.values():
-            if val==3:
-                pairs_needed += 1
-            elif val==2:
-                pairs_needed -= 1
-            else:
-                return False 
-        
-        return pairs_needed==0
-    else:
-        return  False
+    return _get_category(number_freq)==const.CARD_CATEGORY.AIRPLANE_WITH_PAIR
 
 def is_bomb(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played is a bomb hand, False otherwise.
@@ -156,51 +102,26 @@ def is_bomb(number_freq: dict[int:int]) -> bool:
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return len(number_freq.keys())==1 and sum(number_freq.values())==4
+    return _get_category(number_freq)==const.CARD_CATEGORY.BOMB
 
-def is_bomb_with_dual_solo(number_freq: dict[int: int]) -> bool:
+def is_bomb_with_dual_solo(number_freq: dict[int:int]) -> bool:
     '''Returns True if the hand is a bomb with dual solo card hand, False otherwise.
-    
-    Args:
+
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    is_bomb = False 
-    solo_cards_needed = 0
-    jokers = 0
-    for key, val in number_freq.items():
-        if val==1:
-            solo_cards_needed -= 1
-            if key==14 or key==15:
-                jokers += 1
-        elif val==4:
-            is_bomb = True
-            solo_cards_needed += 2
-        else:
-            return False 
-    
-    return is_bomb and solo_cards_needed==0 and jokers<2
+    return _get_category(number_freq)==const.CARD_CATEGORY.BOMB_WITH_SOLO
 
-def is_bomb_with_dual_pair(number_freq: dict[int: int]) -> bool:
+def is_bomb_with_dual_pair(number_freq: dict[int:int]) -> bool:
     '''Returns True if the hand is a bomb with dual pair card hand, False otherwise.
-    
-    Args:
+
+    Args: 
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    is_bomb = False 
-    pair_cards_needed = 0
-    for key, val in number_freq.items():
-        if val==2:
-            pair_cards_needed -= 1
-        elif val==4:
-            is_bomb = True
-            pair_cards_needed += 2
-        else:
-            return False 
-    
-    return is_bomb and pair_cards_needed==0
-    
+    return _get_category(number_freq)==const.CARD_CATEGORY.BOMB_WITH_PAIR
+
 def is_rocket(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played is a rocket hand, False otherwise.
 
@@ -208,7 +129,7 @@ def is_rocket(number_freq: dict[int:int]) -> bool:
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return len(number_freq.keys())==2 and 14 in number_freq.keys() and 15 in number_freq.keys()
+    return _get_category(number_freq)==const.CARD_CATEGORY.ROCKET
 
 def contains_solo_hand(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played contains a solo hand, False otherwise.
@@ -260,8 +181,9 @@ def is_chain(number_freq: dict[int:int]) -> bool:
         number_freq - A hash map that maps the card number to the number of 
                     times it appears in the hand.
     '''
-    return (is_solo_chain(number_freq) or is_pair_chain(number_freq) or
-        is_trio_chain(number_freq))
+    category = _get_category(number_freq)
+    return (category==const.CARD_CATEGORY.SOLO_CHAIN or category==const.CARD_CATEGORY.PAIR_CHAIN or
+        category==const.CARD_CATEGORY.TRIO_CHAIN)
 
 def is_combination(number_freq: dict[int:int]) -> bool:
     '''Return True if the hand being played is a combination hand, False otherwise.
@@ -272,52 +194,6 @@ def is_combination(number_freq: dict[int:int]) -> bool:
     '''
     return contains_solo_hand(number_freq) or contains_pair_hand(number_freq)
 
-def convert_ace_card_to_highest_number(number_freq: dict[int:int]) -> bool:
-    '''Return a hash map with the ace card number converted to a new number
-    using an offset value. 
-
-    Args:
-        number_freq - A hash map that maps the card number to the number of 
-                times it appears in the hand.
-    '''
-    offset = 13
-    freq_map = number_freq.copy()
-    if 1 in freq_map.keys():
-        freq_map[1+offset] = freq_map[1]
-        del freq_map[1]
-
-    return freq_map
-
-def is_chain_in_sequence(number_freq: dict[int:int], cards_in_hand: int, card_freq: int) -> bool:
-    '''Return True if the card chain is in sequence, False otherwise.
-    
-    Args:
-        number_freq - A hash map that maps the card number to the number of 
-                times it appears in the hand.
-        cards_in_hand - An integer representing the number of cards in the 
-                        players' hand.
-        card_freq - An integer representing the expected number of times a
-                    card appears in the hand. For instance, it is expected to
-                    have 2 cards with the same card number when it is a pair.
-    '''
-    max_card_number = max(number_freq.keys())
-    min_card_number = max_card_number-int(cards_in_hand/card_freq)+1
-    for i in range(min_card_number, max_card_number+1):
-        if i not in number_freq.keys() or number_freq[i]!=card_freq:
-            return False
-
-    return True
-
-def contains_invalid_sequences(number_freq: dict[int:int]) -> bool:
-    '''Return True if the hand contains an invalid chain sequence, False otherwise.
-    
-    Args:
-        freq_map - A hash map that maps the card number to the number of 
-                times it appears in the hand.
-    '''
-    return (14 in number_freq.keys() or 15 in number_freq.keys() or 2 in number_freq.keys() or 
-        (1 in number_freq.keys() and not 13 in number_freq.keys()))
-
 def each_trio_has_matching_non_trio_hand(number_freq: dict[int:int], is_solo) -> bool:
     '''Return True if each trio in the sequence has a non-trio hand for each
     trio, False otherwise.
@@ -380,34 +256,223 @@ def get_hand_category(number_freq: dict[int: int]) -> int:
 
     Raises: RuntimeError when the hand category is not recognised. 
     '''
-    if is_solo(number_freq):
-        return const.CARD_CATEGORY.SOLO
-    elif is_solo_chain(number_freq):
-        return const.CARD_CATEGORY.SOLO_CHAIN
-    elif is_pair(number_freq) and not is_rocket(number_freq):
-        return const.CARD_CATEGORY.PAIR
-    elif is_pair_chain(number_freq):
-        return const.CARD_CATEGORY.PAIR_CHAIN
-    elif is_trio(number_freq):
-        return const.CARD_CATEGORY.TRIO
-    elif is_trio_chain(number_freq):
-        return const.CARD_CATEGORY.TRIO_CHAIN
-    elif is_trio_with_solo(number_freq):
-        return const.CARD_CATEGORY.TRIO_WITH_SOLO
-    elif is_trio_with_pair(number_freq):
-        return const.CARD_CATEGORY.TRIO_WITH_PAIR
-    elif is_airplane_with_solo(number_freq):
-        return const.CARD_CATEGORY.AIRPLANE_WITH_SOLO
-    elif is_airplane_with_pair(number_freq):
-        return const.CARD_CATEGORY.AIRPLANE_WITH_PAIR
-    elif is_bomb(number_freq):
-        return const.CARD_CATEGORY.BOMB
-    elif is_bomb_with_dual_solo(number_freq):
-        return const.CARD_CATEGORY.BOMB_WITH_SOLO
-    elif is_bomb_with_dual_pair(number_freq):
-        return const.CARD_CATEGORY.BOMB_WITH_PAIR
-    elif is_rocket(number_freq):
-        return const.CARD_CATEGORY.ROCKET
-    else:
+    category = _get_category(number_freq)
+    if category is None:
         msg = f"The card sequence {[key for key, val in number_freq.items() for _ in range(val) ]} is not a recognised category."
-        raise RuntimeError(msg)      
+        raise RuntimeError(msg)
+
+    return category
+
+def _get_category(number_freq: dict[int:int]) -> int or None:
+    '''Returns an integer representing the card category of the hand, or None if the hand
+    is not a recognised category.
+
+    Args:
+        number_freq - A hash map that maps the card number to the number of 
+                    times it appears in the hand.
+    '''
+    hand_class = classify(get_rank_counts(number_freq))
+    if hand_class is NOT_A_HAND:
+        return None
+
+    return hand_class[0]
+
+''' Hand Category Lookup Table '''
+# rank indexes of the cards that cannot be part of a chain (two and the jokers).
+HIGHEST_CHAIN_RANK = const.RANK_INDEX[1]
+TWO_RANK = const.RANK_INDEX[2]
+BLACK_JOKER_RANK = const.RANK_INDEX[14]
+RED_JOKER_RANK = const.RANK_INDEX[15]
+
+# the largest hand a player can hold is the landlords' 20 cards.
+MAX_HAND_SIZE = 20
+
+# returned by classify() when the rank counts are not a recognised card hand.
+NOT_A_HAND = None
+
+_hand_table = None
+
+def get_rank_counts(number_freq: dict[int:int]) -> tuple[int]:
+    '''Return a tuple of 15 integers representing the number of cards of each rank in the hand,
+    ordered from the lowest ranking card (three) to the highest ranking card (red joker).
+
+    Args:
+        number_freq - A hash map that maps the card number to the number of 
+                    times it appears in the hand.
+    '''
+    rank_counts = [0] * const.TOTAL_RANKS
+    for key, val in number_freq.items():
+        rank_counts[const.RANK_INDEX[key]] += val
+
+    return tuple(rank_counts)
+
+def classify(rank_counts: tuple[int]) -> tuple[int, int, int] or None:
+    '''Return a tuple containing the card category, the comparison rank and the number of cards
+    in the hand, or NOT_A_HAND if the hand is not a recognised category. The comparison rank is 
+    the rank index of the card that decides which of two hands in the same category is higher, 
+    such as the highest card of a chain or the trio of a trio with solo hand.
+
+    Args:
+        rank_counts - A tuple of 15 integers representing the number of cards of each rank in the
+                    hand, see get_rank_counts().
+    '''
+    hand_class = get_hand_table().get(tuple(rank_counts), NOT_A_HAND)
+    if hand_class is NOT_A_HAND and rank_counts.count(4)>1:
+        return _classify_bombs_with_kickers(rank_counts)
+
+    return hand_class
+
+def _classify_bombs_with_kickers(rank_counts: tuple[int]) -> tuple[int, int, int] or None:
+    '''Return a tuple containing the card category, the comparison rank and the number of cards of a
+    hand with several bombs and two distinct solo cards, or two distinct pairs, for each bomb, or 
+    NOT_A_HAND if the hand is not a bomb with solo or bomb with pair hand. The comparison rank is the 
+    highest bomb. These hands are recognised when played, but are left out of the hand table as there
+    are too many of them.
+
+    Args:
+        rank_counts - A tuple of 15 integers representing the number of cards of each rank in the
+                    hand, see get_rank_counts().
+    '''
+    bombs = [rank for rank, count in enumerate(rank_counts) if count==4]
+    kickers = [count for count in rank_counts if count!=0 and count!=4]
+    if len(kickers)!=2*len(bombs):
+        return NOT_A_HAND
+
+    if all([count==1 for count in kickers]):
+        if rank_counts[BLACK_JOKER_RANK]>0 and rank_counts[RED_JOKER_RANK]>0:
+            return NOT_A_HAND
+        return (const.CARD_CATEGORY.BOMB_WITH_SOLO, bombs[-1], sum(rank_counts))
+
+    if all([count==2 for count in kickers]):
+        return (const.CARD_CATEGORY.BOMB_WITH_PAIR, bombs[-1], sum(rank_counts))
+
+    return NOT_A_HAND
+
+def can_beat(hand_class: tuple[int, int, int] or None, previous_hand_class: tuple[int, int, int] or None) -> bool:
+    '''Return whether a hand can be played after the previous hand. A hand beats the previous hand
+    when it has the same category and number of cards and a higher comparison rank. A bomb beats any
+    hand except a higher bomb and the rocket, and the rocket beats every hand. 
+
+    Args:
+        hand_class - A tuple containing the card category, the comparison rank and the number of cards
+                    in the hand, see classify().
+        previous_hand_class - A tuple containing the card category, the comparison rank and the number
+                    of cards in the previous hand, or NOT_A_HAND when no hand has been played.
+
+    Returns: True if the hand can be played after the previous hand, False otherwise.
+    '''
+    if hand_class is NOT_A_HAND:
+        return False
+
+    if previous_hand_class is NOT_A_HAND:
+        return True
+
+    category, rank, length = hand_class
+    previous_category, previous_rank, previous_length = previous_hand_class
+    if previous_category==const.CARD_CATEGORY.ROCKET:
+        return False
+
+    if category==const.CARD_CATEGORY.ROCKET:
+        return True
+
+    if category==const.CARD_CATEGORY.BOMB and previous_category!=const.CARD_CATEGORY.BOMB:
+        return True
+
+    return category==previous_category and length==previous_length and rank>previous_rank
+
+def get_hand_table() -> dict[tuple[int]:tuple[int, int, int]]:
+    '''Return a hash table that maps the rank counts of every recognised card hand to a tuple
+    containing the card category, the comparison rank and the number of cards in the hand. The 
+    table is built the first time it is requested.'''
+    global _hand_table
+    if _hand_table is None:
+        _hand_table = _build_hand_table()
+
+    return _hand_table
+
+def _build_hand_table() -> dict[tuple[int]:tuple[int, int, int]]:
+    '''Return a hash table that maps the rank counts of every recognised card hand, with at
+    most 20 cards, to a tuple containing the card category, the comparison rank and the number 
+    of cards in the hand. The bomb with solo and bomb with pair hands holding more than one bomb
+    are recognised by classify() without the table.'''
+    table = dict()
+
+    def add_hand(category, rank, counts):
+        table[tuple(counts)] = (category, rank, sum(counts))
+
+    def counts_of(ranks_and_counts):
+        counts = [0] * const.TOTAL_RANKS
+        for rank, count in ranks_and_counts:
+            counts[rank] += count
+        return counts
+
+    card_ranks = range(TWO_RANK+1)
+    all_ranks = range(const.TOTAL_RANKS)
+    jokers = {BLACK_JOKER_RANK, RED_JOKER_RANK}
+
+    for rank in all_ranks:
+        add_hand(const.CARD_CATEGORY.SOLO, rank, counts_of([(rank, 1)]))
+
+    for rank in card_ranks:
+        add_hand(const.CARD_CATEGORY.PAIR, rank, counts_of([(rank, 2)]))
+        add_hand(const.CARD_CATEGORY.TRIO, rank, counts_of([(rank, 3)]))
+        add_hand(const.CARD_CATEGORY.BOMB, rank, counts_of([(rank, 4)]))
+
+    add_hand(const.CARD_CATEGORY.ROCKET, RED_JOKER_RANK, 
+        counts_of([(BLACK_JOKER_RANK, 1), (RED_JOKER_RANK, 1)]))
+
+    # chains: solo chains of 5 to 12 cards, pair chains of 3 to 10 pairs and 
+    # trio chains of 2 to 6 trios, using the cards from three to ace.
+    for category, count, min_length, max_length in [(const.CARD_CATEGORY.SOLO_CHAIN, 1, 5, 12),
+                                                    (const.CARD_CATEGORY.PAIR_CHAIN, 2, 3, 10),
+                                                    (const.CARD_CATEGORY.TRIO_CHAIN, 3, 2, 6)]:
+        for length in range(min_length, max_length+1):
+            for high in range(length-1, HIGHEST_CHAIN_RANK+1):
+                chain = [(rank, count) for rank in range(high-length+1, high+1)]
+                add_hand(category, high, counts_of(chain))
+
+    # trio with a solo card or a pair. The rocket is accepted as the pair.
+    for trio in card_ranks:
+        for solo in all_ranks:
+            if solo!=trio:
+                add_hand(const.CARD_CATEGORY.TRIO_WITH_SOLO, trio, counts_of([(trio, 3), (solo, 1)]))
+
+        for pair in card_ranks:
+            if pair!=trio:
+                add_hand(const.CARD_CATEGORY.TRIO_WITH_PAIR, trio, counts_of([(trio, 3), (pair, 2)]))
+
+        add_hand(const.CARD_CATEGORY.TRIO_WITH_PAIR, trio, 
+            counts_of([(trio, 3), (BLACK_JOKER_RANK, 1), (RED_JOKER_RANK, 1)]))
+
+    # airplanes: a trio chain with one distinct solo card, or one pair, for each trio. 
+    for length in range(2, 7):
+        for high in range(length-1, HIGHEST_CHAIN_RANK+1):
+            chain = list(range(high-length+1, high+1))
+            trios = [(rank, 3) for rank in chain]
+            if len(chain)*4<=MAX_HAND_SIZE:
+                solos = [rank for rank in all_ranks if rank not in chain]
+                for kickers in itertools.combinations(solos, length):
+                    if not jokers.issubset(kickers):
+                        add_hand(const.CARD_CATEGORY.AIRPLANE_WITH_SOLO, high, 
+                            counts_of(trios + [(rank, 1) for rank in kickers]))
+
+            if len(chain)*5<=MAX_HAND_SIZE:
+                pairs = [rank for rank in card_ranks if rank not in chain]
+                for kickers in itertools.combinations(pairs, length):
+                    add_hand(const.CARD_CATEGORY.AIRPLANE_WITH_PAIR, high, 
+                        counts_of(trios + [(rank, 2) for rank in kickers]))
+
+    # bomb with two distinct solo cards, or two distinct pairs. 
+    for bomb in card_ranks:
+        solos = [rank for rank in all_ranks if rank!=bomb]
+        for kickers in itertools.combinations(solos, 2):
+            if not jokers.issubset(kickers):
+                add_hand(const.CARD_CATEGORY.BOMB_WITH_SOLO, bomb, 
+                    counts_of([(bomb, 4)] + [(rank, 1) for rank in kickers]))
+
+        pairs = [rank for rank in card_ranks if rank!=bomb]
+        for kickers in itertools.combinations(pairs, 2):
+            add_hand(const.CARD_CATEGORY.BOMB_WITH_PAIR, bomb, 
+                counts_of([(bomb, 4)] + [(rank, 2) for rank in kickers]))
+
+    return table
@@ -1,10 +1,48 @@
+import argparse
 from example import LandlordGame
 from game.core.player import Player
+from game.events import EVENT, ConsoleSink
+from game.instrumentation import ChromeTracer, PhaseTimer
+from game.interface.tournament import TournamentRunner
 
 MAX_PLAYERS = 3
 
+def get_arguments() -> argparse.Namespace:
+    '''Return the command line arguments.'''
+    parser = argparse.ArgumentParser(description="Simulate games of landlord.")
+    parser.add_argument("--games", type=int, default=None,
+                        help="play a tournament with this many games across a pool of processes.")
+    parser.add_argument("--seed", type=int, default=0, help="the master seed of the tournament.")
+    parser.add_argument("--processes", type=int, default=None, 
+                        help="the number of worker processes. Default is one per CPU.")
+    parser.add_argument("--timings", choices=["table", "json"], default=None,
+                        help="print the time spent in each phase of a single game, as a table or JSON.")
+    parser.add_argument("--trace", default=None, metavar="PATH",
+                        help="write a Chrome trace of a single game, viewable in Perfetto or chrome://tracing.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="print every event of a single game, instead of only the deal of each round.")
+    return parser.parse_args()
+
 if __name__=='__main__':
-    game = LandlordGame([Player() for _ in range(MAX_PLAYERS)])
-    while not game.has_game_ended():        
-        game.play()
-    
\ No newline at end of file
+    args = get_arguments()
+    if args.games is not None:
+        runner = TournamentRunner(args.games, master_seed=args.seed, processes=args.processes)
+        print(runner.play())
+    else:
+        if args.trace:
+            phase_timer = ChromeTracer(args.trace)
+        else:
+            phase_timer = PhaseTimer() if args.timings else None
+
+        event_sink = ConsoleSink() if args.verbose else ConsoleSink(events=(EVENT.DEAL,))
+        game = LandlordGame([Player() for _ in range(MAX_PLAYERS)], phase_timer=phase_timer, event_sink=event_sink)
+        while not game.has_game_ended():        
+            game.play()
+
+        if args.trace:
+            phase_timer.close()
+
+        if args.timings=="table":
+            print(phase_timer.format_table())
+        elif args.timings=="json":
+            print(phase_timer.to_json())
@@ -26,3 +26,12 @@ class CARD_CATEGORY:
     ROCKET = 13
 
 MAX_STAKE_LIMIT = 12
+
+SUITS = ["hearts", "diamonds", "clubs", "spades"]
+JOKER_SUIT = "joker"
+
+# card numbers ordered from the lowest to the highest ranking card. The position
+# of a card number in the tuple is its rank index.
+RANK_ORDER = (3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 1, 2, 14, 15)
+RANK_INDEX = {number:index for index, number in enumerate(RANK_ORDER)}
+TOTAL_RANKS = 15
@@ -0,0 +1,61 @@
+import unittest
+import os
+import random
+import tempfile
+import benchmarks.compare as compare
+from benchmarks.runner import main
+
+class BenchmarkComparisonTestCase(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(1)
+        self.rounds = [[rng.gauss(1000, 50) for _ in range(200)] for _ in range(5)]
+
+    def _get_results(self, rounds_by_name):
+        return {"benchmarks":{name:{"rounds_ns":rounds} for name, rounds in rounds_by_name.items()}}
+
+    def test_median_function(self):
+        self.assertEqual(compare.get_median([3, 1, 2]), 2)
+        self.assertEqual(compare.get_median([4, 1, 2, 3]), 2.5)
+
+    def test_bootstrap_interval_contains_the_ratio(self):
+        low, high = compare.bootstrap_ratio_interval(self.rounds, self.rounds, resamples=200)
+        self.assertTrue(low<1<high)
+        slower_rounds = [[sample * 1.5 for sample in samples] for samples in self.rounds]
+        low, high = compare.bootstrap_ratio_interval(self.rounds, slower_rounds, resamples=200)
+        self.assertTrue(1.4<low<1.5<high<1.6)
+
+    def test_compare_results_function(self):
+        baseline = self._get_results({"same":self.rounds, "slower":self.rounds, "faster":self.rounds, "removed":self.rounds})
+        results = self._get_results({"same":self.rounds, 
+                                     "slower":[[sample * 1.2 for sample in samples] for samples in self.rounds],
+                                     "faster":[[sample * 0.8 for sample in samples] for samples in self.rounds],
+                                     "added":self.rounds})
+        comparisons = {comparison.get_name():comparison for comparison in compare.compare_results(baseline, results, resamples=200)}
+        self.assertEqual({name:comparison.get_status() for name, comparison in comparisons.items()}, 
+                         {"same":compare.UNCHANGED, "slower":compare.REGRESSION, "faster":compare.IMPROVEMENT, 
+                          "added":compare.MISSING, "removed":compare.MISSING})
+        self.assertAlmostEqual(comparisons["slower"].get_ratio(), 1.2)
+        self.assertTrue(comparisons["slower"].is_regression())
+        self.assertIsNone(comparisons["added"].get_interval())
+
+        # a change smaller than the threshold is not a regression.
+        results = self._get_results({"slower":[[sample * 1.03 for sample in samples] for samples in self.rounds]})
+        self.assertFalse(compare.compare_results(baseline, results, resamples=200)[0].is_regression())
+
+    def test_main_function_exits_with_status_one_on_a_regression(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            arguments = ["player_remove_cards", "--iterations", "20", "--rounds", "2", "--resamples", "50"]
+            self.assertEqual(main(arguments + ["--save-baseline", path]), 0)
+            baseline = compare.load_baseline(path)
+            self.assertEqual(baseline["benchmarks"]["player_remove_cards"]["iterations"], 20)
+
+            # make the baseline appear 100 times faster than any run.
+            for samples in baseline["benchmarks"]["player_remove_cards"]["rounds_ns"]:
+                samples[:] = [sample / 100 for sample in samples]
+            compare.save_baseline(baseline, path)
+            self.assertEqual(main(arguments + ["--compare", path]), 1)
+
+            with open(path, "w") as file:
+                file.write("{}")
+            self.assertRaises(ValueError, compare.load_baseline, path)
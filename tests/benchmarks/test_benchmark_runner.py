@@ -0,0 +1,51 @@
+import unittest
+import json
+import os
+import tempfile
+from benchmarks.runner import main, run_benchmarks
+from benchmarks.suite import BENCHMARKS, get_fixture_hands
+from benchmarks.timing import BenchmarkResult, get_percentile, measure
+
+class BenchmarkRunnerTestCase(unittest.TestCase):
+    def test_percentiles_and_ops_per_second(self):
+        self.assertEqual(get_percentile([1, 2, 3, 4, 5], 50), 3)
+        self.assertEqual(get_percentile([1, 2], 50), 1.5)
+        self.assertEqual(get_percentile([7], 99), 7)
+
+        result = BenchmarkResult("test", [100, 200, 300, 400])
+        self.assertEqual(result.get_ops_per_second(), 4e9 / 1000)
+        self.assertEqual(result.get_percentiles(), {"p50":250, "p90":370, "p99":397})
+        self.assertEqual(result.to_dict()["rounds_ns"], [[100, 200, 300, 400]])
+        result.add_round(BenchmarkResult("test", [500]))
+        self.assertEqual(result.get_samples(), [100, 200, 300, 400, 500])
+        self.assertEqual(result.get_rounds(), [[100, 200, 300, 400], [500]])
+
+    def test_measure_function_does_not_time_the_setup(self):
+        calls = list()
+        result = measure("test", lambda: (len(calls),), calls.append, iterations=5, warmup=2)
+        self.assertEqual(calls, [0, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(result.get_samples()), 5)
+        self.assertRaises(ValueError, measure, "test", tuple, calls.append, 0)
+
+    def test_every_benchmark_runs(self):
+        self.assertTrue(len(get_fixture_hands())>100)
+        results = run_benchmarks(iterations=3, warmup=1, rounds=2)
+        self.assertEqual(list(results["benchmarks"]), list(BENCHMARKS))
+        for result in results["benchmarks"].values():
+            self.assertEqual(result["iterations"], 3)
+            self.assertEqual([len(samples) for samples in result["rounds_ns"]], [2, 1])
+            self.assertTrue(result["ops_per_second"]>0)
+            self.assertTrue(result["min_ns"]<=result["p50_ns"]<=result["p99_ns"]<=result["max_ns"])
+
+        self.assertRaises(ValueError, run_benchmarks, ["unknown"])
+        self.assertRaises(ValueError, run_benchmarks, iterations=2, rounds=3)
+
+    def test_results_are_written_as_json(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "results.json")
+            self.assertEqual(main(["bidding_round", "--iterations", "4", "--warmup", "0", "--rounds", "1", "--output", path]), 0)
+            with open(path) as file:
+                results = json.load(file)
+
+        self.assertEqual(list(results["benchmarks"]), ["bidding_round"])
+        self.assertEqual(results["benchmarks"]["bidding_round"]["iterations"], 4)
@@ -0,0 +1,50 @@
+import unittest
+import random
+from example import LandlordGame
+from game.core.deck import CardDeck
+from game.core.player import Player
+try:
+    import numpy as np
+    from game.core.rng import BufferedRandom
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is required by the buffered random number generator.")
+class BufferedRandomTestCase(unittest.TestCase):
+    def test_random_numbers_are_reproducible_across_buffers(self):
+        rng1, rng2 = BufferedRandom(7, buffer_size=16), BufferedRandom(7, buffer_size=16)
+        numbers = [rng1.random() for _ in range(100)]
+        self.assertEqual(numbers, [rng2.random() for _ in range(100)])
+        self.assertTrue(all(0<=number<1 for number in numbers))
+        self.assertEqual(len(set(numbers)), 100)
+
+        rng1.seed(7)
+        self.assertEqual(numbers, [rng1.random() for _ in range(100)])
+
+    def test_choice_and_shuffle_functions(self):
+        rng = BufferedRandom(1)
+        items = list(range(10))
+        self.assertEqual({rng.choice(items) for _ in range(500)}, set(items))
+        self.assertRaises(IndexError, rng.choice, list())
+        
+        rng.shuffle(items)
+        self.assertEqual(sorted(items), list(range(10)))
+        self.assertNotEqual(items, list(range(10)))
+        self.assertRaises(ValueError, BufferedRandom, 1, 0)
+
+    def test_rng_is_shared_by_the_deck_and_players(self):
+        deck1, deck2 = CardDeck(BufferedRandom(3)), CardDeck(BufferedRandom(3))
+        deck1.shuffle()
+        deck2.shuffle()
+        self.assertEqual(deck1.get_card_deck(), deck2.get_card_deck())
+
+        stakes = list()
+        for rng_type in [BufferedRandom, BufferedRandom, random.Random]:
+            game = LandlordGame([Player() for _ in range(3)], rng_type(11))
+            # the global random module must not affect the game.
+            random.seed(len(stakes))
+            for _ in range(3):
+                game.play()
+            stakes.append([player.get_stake_amount() for player in game.get_players()])
+
+        self.assertEqual(stakes[0], stakes[1])
@@ -1,7 +1,7 @@
 import unittest
 from tests import helpers
 import misc.constants as const
-from game.core.card import Card
+from game.core.card import Card, CARDS, get_card
 from game.core.deck import CardDeck
 
 class CardTestCase(unittest.TestCase):
@@ -114,4 +114,23 @@ class CardTestCase(unittest.TestCase):
 
         card = Card(15, "joker")
         self.assertEqual(str(card), const.RED_JOKER_REPR)
-        
\ No newline at end of file
+        
+    def test_card_objects_are_immutable(self):
+        '''Test that the card number, suit and points cannot be changed.'''
+        card = Card(3, "hearts")
+        with self.assertRaises(AttributeError):
+            card._number = 4
+        with self.assertRaises(AttributeError):
+            card.colour = "red"
+        self.assertEqual(card.get_number(), 3)
+
+    def test_deck_reuses_the_same_card_objects(self):
+        '''Test that resetting the deck does not create new Card objects.'''
+        self.assertEqual(len(CARDS), 54)
+        cards = self.deck.get_card_deck().copy()
+        self.deck.reset()
+        for old_card, new_card in zip(cards, self.deck.get_card_deck()):
+            self.assertIs(old_card, new_card)
+
+        for card in self.deck.get_card_deck():
+            self.assertIs(get_card(card.get_number(), card.get_suit()), card)
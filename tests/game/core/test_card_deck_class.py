@@ -1,5 +1,6 @@
 import unittest
-from game.core.deck import CardDeck
+import random
+from game.core.deck import CardDeck, TOTAL_DEALS, DEAL_BYTES, encode_deal, decode_deal, sample_deal
 
 class CardDeckTestCase(unittest.TestCase):
     def setUp(self):
@@ -93,4 +94,36 @@ class CardDeckTestCase(unittest.TestCase):
         self.assertEqual(len(player2), 17) 
         self.assertEqual(len(player3), 17) 
         self.assertEqual(len(wildcards), 3) 
-        
\ No newline at end of file
+        
+    def test_shuffle_function_uses_the_provided_random_number_generator(self):
+        deck1, deck2 = CardDeck(random.Random(2)), CardDeck(random.Random(2))
+        deck1.shuffle()
+        random.shuffle(self.deck.get_card_deck())
+        deck2.shuffle()
+        self.assertEqual(deck1.get_card_deck(), deck2.get_card_deck())
+
+    def test_encode_deal_and_decode_deal_functions(self):
+        for _ in range(50):
+            self.deck.reset()
+            self.deck.shuffle()
+            deal = self.deck.deal()
+            rank = encode_deal(*deal)
+            self.assertTrue(0<=rank<TOTAL_DEALS)
+            self.assertEqual(len(rank.to_bytes(DEAL_BYTES, "big")), 12)
+            for part, decoded_part in zip(deal, decode_deal(rank)):
+                self.assertEqual(set(part), set(decoded_part))
+
+        self.assertEqual(encode_deal(*decode_deal(0)), 0)
+        self.assertEqual(encode_deal(*decode_deal(TOTAL_DEALS-1)), TOTAL_DEALS-1)
+        self.assertRaises(ValueError, decode_deal, TOTAL_DEALS)
+        self.assertRaises(ValueError, decode_deal, -1)
+
+        player1, player2, player3, wildcards = decode_deal(12345)
+        self.assertRaises(ValueError, encode_deal, player1, player1, player3, wildcards)
+        self.assertRaises(ValueError, encode_deal, player1[1:], player2, player3, wildcards + player1[:1])
+
+    def test_sample_deal_function(self):
+        deal1, deal2 = sample_deal(random.Random(8)), sample_deal(random.Random(8))
+        self.assertEqual(deal1, deal2)
+        self.assertEqual([len(part) for part in deal1], [17, 17, 17, 3])
+        self.assertEqual(len(set(deal1[0] + deal1[1] + deal1[2] + deal1[3])), 54)
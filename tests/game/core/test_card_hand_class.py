@@ -1,9 +1,11 @@
 import unittest
+import random
 from tests import helpers
 import misc.constants as const
+import game.rules as rules
 from game.core.card import Card
 from game.core.deck import CardDeck
-from game.core.hand import CardHand
+from game.core.hand import CardHand, generate_hand_rank_counts
 
 class CardHandTestCase(unittest.TestCase):
     def setUp(self):
@@ -158,6 +160,20 @@ class CardHandTestCase(unittest.TestCase):
         self.assertTrue(self.hand.is_valid()) 
         self.hand.reset()
 
+    def test_set_random_hand_function_only_leads_a_solo_with_a_single_card_draw(self):
+        class NoSingleRandom(random.Random):
+            def random(self):
+                return 0.99
+
+        hand = CardHand(NoSingleRandom(1))
+        cards = self.hlpr.convert_hand_numbers_to_card_objects([[3,3,5], [3,5,9]])
+        for _ in range(10):
+            self.assertEqual(len(hand.set_random_hand(cards[0])), 2)
+            hand.reset()
+
+        # a single card is played when the cards hold no other hand.
+        self.assertEqual(len(hand.set_random_hand(cards[1])), 1)
+
     def test_set_random_hand_raises_type_error_when_non_card_object_parameter_passed(self):
         with self.assertRaises(TypeError):
             card = Card(3, "hearts")
@@ -190,6 +206,20 @@ class CardHandTestCase(unittest.TestCase):
             hand = hands[i]
             self.assertEqual(self.hand.get_hand_category(hand), category[i].pop())
 
+    def test_get_hand_class_function_returns_category_rank_and_length(self):
+        hands = [[5,5,5,9], [7,8,9,10,11,12], [13,13,1,1,2]]
+        hands = self.hlpr.convert_hand_numbers_to_card_objects(hands)
+        self.assertEqual(self.hand.get_hand_class(hands[0]), 
+            (const.CARD_CATEGORY.TRIO_WITH_SOLO, const.RANK_INDEX[5], 4))
+        self.assertEqual(self.hand.get_hand_class(hands[1]), 
+            (const.CARD_CATEGORY.SOLO_CHAIN, const.RANK_INDEX[12], 6))
+        self.assertIs(self.hand.get_hand_class(hands[2]), rules.NOT_A_HAND)
+
+        self.hand.set_hand(hands[0])
+        self.assertTrue(self.hand.is_valid())
+        self.hand.set_hand(hands[2])
+        self.assertFalse(self.hand.is_valid())
+
     def test_set_random_hand_function_with_category_set_returns_stronger_hand_in_the_same_category(self):
         opponent_hands = [[3,3,4,4,5,5], [5,6,7,8,9], [11,11,11,3,3], [6]] 
         opponent_hands = self.hlpr.convert_hand_numbers_to_card_objects(opponent_hands)
@@ -218,6 +248,72 @@ class CardHandTestCase(unittest.TestCase):
             self.assertEqual(len(player_hand), 0) 
             self.hand.reset()
 
+    def test_generate_hand_rank_counts_yields_every_hand_in_the_cards(self):
+        hand_table = rules.get_hand_table()
+        for _ in range(20):
+            self.deck.shuffle()
+            c1, c2, c3, wildcards = self.deck.deal()
+            rank_counts = self.hand.get_rank_counts(c1+wildcards)
+            hands = list(generate_hand_rank_counts(rank_counts))
+            self.assertEqual(len(hands), len(set(hands)))
+
+            expected_hands = [counts for counts in hand_table 
+                if all([count<=total for count, total in zip(counts, rank_counts)])]
+            self.assertEqual(set(hands), set(expected_hands))
+            self.deck.reset()
+
+        full_deck = self.hand.get_rank_counts(self.deck.get_card_deck())
+        self.assertEqual(len(list(generate_hand_rank_counts(full_deck))), len(hand_table))
+
+    def test_generate_hands_method_yields_all_kicker_combinations_and_chain_lengths(self):
+        cards = [[3,3,3,4,4,4,5,5,5,5,6,7,8,9,9,14,15]]
+        cards = self.hlpr.convert_hand_numbers_to_card_objects(cards)[0]
+        hands = list(self.hand.generate_hands(cards))
+        for hand in hands:
+            self.assertTrue(set(hand).issubset(set(cards)))
+            self.assertIsNot(self.hand.get_hand_class(hand), rules.NOT_A_HAND)
+
+        categories = [self.hand.get_hand_category(hand) for hand in hands]
+        self.assertEqual(categories.count(const.CARD_CATEGORY.ROCKET), 1)
+        self.assertEqual(categories.count(const.CARD_CATEGORY.BOMB_WITH_PAIR), 3)
+        # solo chains of five to seven cards from the three to the nine.
+        self.assertEqual(categories.count(const.CARD_CATEGORY.SOLO_CHAIN), 6)
+        # the 3-4 and 4-5 trio chains with 20 kicker pairs each and the 3-4-5 chain with 16 kicker trios, 
+        # as kickers cannot be taken from the chain or include both jokers.
+        self.assertEqual(categories.count(const.CARD_CATEGORY.AIRPLANE_WITH_SOLO), 56)
+
+    def test_generate_hand_rank_counts_only_yields_hands_that_beat_the_previous_hand(self):
+        hand_table = rules.get_hand_table()
+        previous_hands = [[5], [9,9], [13,13,13,2,2], [3,4,5,6,7], [3,3,4,4,5,5], [5,5,5,5], 
+                          [4,4,4,5,5,5,3,7], [14,15]]
+        previous_hands = self.hlpr.convert_hand_numbers_to_card_objects(previous_hands)
+        for _ in range(5):
+            self.deck.shuffle()
+            c1, c2, c3, wildcards = self.deck.deal()
+            rank_counts = self.hand.get_rank_counts(c1+wildcards)
+            all_hands = list(generate_hand_rank_counts(rank_counts))
+            for previous_hand in previous_hands:
+                previous_hand_class = self.hand.get_hand_class(previous_hand)
+                hands = list(generate_hand_rank_counts(rank_counts, previous_hand_class))
+                self.assertEqual(len(hands), len(set(hands)))
+
+                expected_hands = [counts for counts in all_hands 
+                    if rules.can_beat(hand_table[counts], previous_hand_class)]
+                self.assertEqual(set(hands), set(expected_hands))
+            self.deck.reset()
+
+    def test_generate_hands_method_yields_only_higher_hands_of_the_same_shape(self):
+        previous_hand = [[3,4,5,6,7]]
+        cards = [[4,5,6,7,8,9,9,9,9,12,14,15]]
+        previous_hand = self.hlpr.convert_hand_numbers_to_card_objects(previous_hand)[0]
+        cards = self.hlpr.convert_hand_numbers_to_card_objects(cards)[0]
+        categories = [self.hand.get_hand_category(hand) for hand in self.hand.generate_hands(cards, previous_hand)]
+        self.assertEqual(sorted(categories), [const.CARD_CATEGORY.SOLO_CHAIN, const.CARD_CATEGORY.SOLO_CHAIN, 
+                                              const.CARD_CATEGORY.BOMB, const.CARD_CATEGORY.ROCKET])
+
+    def test_generate_hands_method_yields_nothing_for_empty_cards(self):
+        self.assertEqual(list(self.hand.generate_hands(list())), [])
+
     def test_valid_get_rocket_hand_method(self):
         solo_hand = [Card(12, 'hearts'), Card(13, 'hearts'), 
                     Card(1, 'hearts'), Card(14, 'joker'), Card(15, 'joker')]
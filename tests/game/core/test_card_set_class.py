@@ -0,0 +1,85 @@
+import unittest
+from tests import helpers
+import misc.constants as const
+from game.core.card import Card
+from game.core.cardset import CardSet, get_card_index
+from game.core.deck import CardDeck
+from game.core.player import Player
+
+class CardSetTestCase(unittest.TestCase):
+    def setUp(self):
+        pass
+
+    def tearDown(self):
+        self.deck.reset()
+
+    @classmethod
+    def setUpClass(cls):
+        cls.deck = CardDeck()
+        cls.hlpr = helpers.TestHelpers()
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.deck
+        del cls.hlpr
+
+    def test_full_deck_card_set_contains_every_card(self):
+        card_set = self.deck.get_card_set()
+        self.assertEqual(len(card_set), 54)
+        self.assertTrue(card_set.get_mask() < 2**64)
+        for card in self.deck.get_card_deck():
+            self.assertIn(card, card_set)
+
+    def test_every_card_has_a_unique_index(self):
+        indexes = set()
+        for card in self.deck.get_card_deck():
+            indexes.add(get_card_index(card.get_number(), card.get_suit()))
+        self.assertEqual(len(indexes), 54)
+
+    def test_get_card_index_raises_value_error_for_unknown_cards(self):
+        with self.assertRaises(ValueError):
+            get_card_index(16, "hearts")
+
+        with self.assertRaises(ValueError):
+            get_card_index(5, "stars")
+
+    def test_get_cards_returns_cards_from_lowest_to_highest_rank(self):
+        cards = [Card(15, "joker"), Card(1, "spades"), Card(3, "clubs"), Card(2, "hearts")]
+        numbers = [card.get_number() for card in CardSet.from_cards(cards).get_cards()]
+        self.assertEqual(numbers, [3, 1, 2, 15])
+
+    def test_rank_counts_match_the_number_of_cards_per_rank(self):
+        self.deck.shuffle()
+        c1, c2, c3, wildcards = self.deck.deal()
+        rank_counts = CardSet.from_cards(c1).get_rank_counts()
+        self.assertEqual(len(rank_counts), const.TOTAL_RANKS)
+        self.assertEqual(sum(rank_counts), 17)
+
+        freq_map = self.hlpr.get_number_frequency_map(c1)
+        for number, freq in freq_map.items():
+            self.assertEqual(rank_counts[const.RANK_INDEX[number]], freq)
+            self.assertEqual(CardSet.from_cards(c1).get_rank_count(number), freq)
+
+    def test_union_difference_and_intersection(self):
+        self.deck.shuffle()
+        c1, c2, c3, wildcards = self.deck.deal()
+        s1, s2 = CardSet.from_cards(c1), CardSet.from_cards(c2)
+        self.assertEqual(len(s1 | s2), 34)
+        self.assertEqual(len((s1 | s2) - s2), 17)
+        self.assertEqual((s1 | s2) - s2, s1)
+        self.assertEqual(len(s1 & s2), 0)
+        self.assertFalse(s1 & s2)
+        self.assertEqual(len(s1 | s2 | CardSet.from_cards(c3) | CardSet.from_cards(wildcards)), 54)
+
+    def test_player_accepts_card_set(self):
+        self.deck.shuffle()
+        c1, c2, c3, wildcards = self.deck.deal()
+        player = Player()
+        player.set_cards(CardSet.from_cards(c1))
+        self.assertEqual(len(player.get_cards()), 17)
+        player.add_wildcards(CardSet.from_cards(wildcards))
+        self.assertEqual(len(player.get_cards()), 20)
+        self.assertEqual(player.get_card_set(), CardSet.from_cards(c1+wildcards))
+
+        player.remove_cards(player.get_cards()[:5])
+        self.assertEqual(len(player.get_card_set()), 15)
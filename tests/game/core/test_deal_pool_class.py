@@ -0,0 +1,50 @@
+import unittest
+from game.core.card import CARDS
+from game.core.deck import CardDeck
+from game.core.player import Player
+try:
+    import numpy as np
+    from game.core.dealpool import DealPool
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is required by the deal pool.")
+class DealPoolTestCase(unittest.TestCase):
+    def test_deals_contain_every_card_once(self):
+        pool = DealPool(size=8, seed=1)
+        for _ in range(20):
+            player1, player2, player3, wildcards = pool.next_deal()
+            self.assertEqual([len(player1), len(player2), len(player3), len(wildcards)], [17, 17, 17, 3])
+            self.assertEqual(len(player1 | player2 | player3 | wildcards), 54)
+
+        self.assertEqual(len(pool), 4)
+        self.assertRaises(ValueError, DealPool, 0)
+
+    def test_deals_are_reproducible_and_uniform(self):
+        # the deals only depend on the seed, not the number of deals generated at a time.
+        pool1, pool2 = DealPool(size=100, seed=4), DealPool(size=30, seed=4)
+        deals = [pool1.next_deal() for _ in range(150)]
+        self.assertEqual(deals, [pool2.next_deal() for _ in range(150)])
+        pool2 = DealPool(size=100, seed=5)
+        self.assertNotEqual(deals, [pool2.next_deal() for _ in range(150)])
+
+        # each card should be a wildcard in about 3 of every 54 deals.
+        wildcard_counts = dict.fromkeys(CARDS, 0)
+        for _ in range(5400):
+            for card in pool1.next_deal()[3]:
+                wildcard_counts[card] += 1
+        self.assertTrue(all(200<count<400 for count in wildcard_counts.values()))
+
+    def test_card_deck_deals_from_the_pool(self):
+        deck = CardDeck(pool=DealPool(size=4, seed=2))
+        for _ in range(6):
+            deck.shuffle()
+            player1, player2, player3, wildcards = deck.deal()
+            self.assertEqual(deck.get_card_deck(), wildcards.get_cards())
+            self.assertEqual(deck.deal(), (list(), list(), list(), list()))
+
+            player = Player()
+            player.set_cards(player1)
+            player.add_wildcards(wildcards)
+            self.assertEqual(len(player.get_cards()), 20)
+            deck.reset()
@@ -0,0 +1,55 @@
+import unittest
+from tests import helpers
+import misc.constants as const
+from game.core.deck import CardDeck
+from game.core.hand import CardHand
+from game.core.moveindex import MoveIndex
+
+class MoveIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        self.deck.shuffle()
+
+    def tearDown(self):
+        self.deck.reset()
+
+    @classmethod
+    def setUpClass(cls):
+        cls.deck = CardDeck()
+        cls.hlpr = helpers.TestHelpers()
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.deck
+        del cls.hlpr
+
+    def test_move_index_groups_cards_by_rank(self):
+        c1, c2, c3, wildcards = self.deck.deal()
+        move_index = MoveIndex(c1)
+        self.assertEqual(len(move_index), 17)
+        self.assertEqual(move_index.get_rank_counts(), CardHand().get_rank_counts(c1))
+        for rank in range(const.TOTAL_RANKS):
+            for card in move_index.get_cards_by_rank(rank):
+                self.assertEqual(const.RANK_INDEX[card.get_number()], rank)
+        
+        self.assertEqual(sorted(move_index.get_cards(), key=id), sorted(c1, key=id))
+
+    def test_add_and_remove_cards_patch_the_index(self):
+        c1, c2, c3, wildcards = self.deck.deal()
+        move_index = MoveIndex(c1)
+        move_index.add_cards(wildcards)
+        self.assertEqual(len(move_index), 20)
+        self.assertEqual(move_index.get_rank_counts(), CardHand().get_rank_counts(c1+wildcards))
+
+        cards = c1 + wildcards
+        while cards:
+            hand, cards = cards[:3], cards[3:]
+            move_index.remove_cards(hand)
+            self.assertEqual(len(move_index), len(cards))
+            self.assertEqual(move_index.get_rank_counts(), CardHand().get_rank_counts(cards))
+
+    def test_remove_cards_removes_cards_by_number(self):
+        cards = self.hlpr.convert_hand_numbers_to_card_objects([[3,3,3,5,5,14,15]])[0]
+        move_index = MoveIndex(cards)
+        move_index.remove_cards(self.hlpr.convert_hand_numbers_to_card_objects([[3,3,15]])[0])
+        numbers = [card.get_number() for card in move_index.get_cards()]
+        self.assertEqual(numbers, [3,5,5,14])
@@ -1,4 +1,5 @@
 import unittest
+import random
 from tests import helpers 
 from game.core.deck import CardDeck
 from game.core.player import Player
@@ -202,4 +203,37 @@ class PlayerClassTestCase(unittest.TestCase):
         self.player.remove_cards(hand)
         self.assertEqual(len(self.player.get_cards()), 0)
     
-        
\ No newline at end of file
+        
+    def test_move_index_is_updated_as_cards_are_played(self):
+        c1, c2, c3, wildcards = self.deck.deal()
+        self.player.set_cards(c1)
+        move_index = self.player.get_move_index()
+        self.player.add_wildcards(wildcards)
+        self.assertIs(self.player.get_move_index(), move_index)
+
+        while self.player.get_cards():
+            self.player.hand.reset()
+            self.player.play_hand()
+            self.assertIs(self.player.get_move_index(), move_index)
+            self.assertEqual(len(move_index), len(self.player.get_cards()))
+            self.assertEqual(move_index.get_rank_counts(), 
+                             self.player.hand.get_rank_counts(self.player.get_cards()))
+
+    def test_player_uses_the_provided_random_number_generator(self):
+        self.deck.shuffle()
+        cards = self.deck.deal()[0]
+        results = list()
+        for _ in range(2):
+            player = Player(random.Random(5))
+            bids = [player.get_random_bid_amount() for _ in range(20)]
+            player.set_cards(list(cards))
+            hands = list()
+            while player.get_cards():
+                player.hand.reset()
+                hands.append(player.play_hand())
+            results.append((bids, hands))
+
+        self.assertEqual(results[0], results[1])
+        self.assertIs(player.hand.rng, player.rng)
+        player.set_rng(None)
+        self.assertIs(player.hand.rng, random)
@@ -0,0 +1,119 @@
+import unittest
+import random
+import game.rules as rules
+from game.core.deck import CardDeck
+from game.core.hand import CardHand, generate_hand_rank_counts
+try:
+    import numpy as np
+    from game.engine.batch import NO_SOLO_LEAD, BatchEngine, count_bits, get_hand_catalog, _count_bits_by_byte
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is required by the batch engine.")
+class BatchEngineTestCase(unittest.TestCase):
+    def tearDown(self):
+        self.deck.reset()
+
+    @classmethod
+    def setUpClass(cls):
+        cls.catalog = get_hand_catalog()
+        cls.deck = CardDeck(random.Random(1))
+        cls.hand = CardHand()
+
+    @classmethod
+    def tearDownClass(cls):
+        del cls.catalog
+        del cls.deck
+        del cls.hand
+
+    def get_mask_hands(self, masks):
+        bits = np.unpackbits(masks.view(np.uint8), bitorder='little')
+        return {tuple(self.catalog.hand_counts[index]) for index in np.flatnonzero(bits)}
+
+    def test_catalog_contains_every_hand_in_the_hand_table(self):
+        hand_table = rules.get_hand_table()
+        self.assertEqual(self.catalog.total_hands, len(hand_table))
+        for index in range(0, self.catalog.total_hands, 97):
+            hand_class = hand_table[tuple(self.catalog.hand_counts[index])]
+            self.assertEqual(hand_class, (self.catalog.categories[index], self.catalog.ranks[index],
+                                          self.catalog.lengths[index]))
+
+    def test_masks_match_the_hands_generated_for_the_cards(self):
+        hand_table = rules.get_hand_table()
+        previous_hands = [None] + random.Random(2).sample(range(self.catalog.total_hands), 20)
+        for _ in range(5):
+            self.deck.shuffle()
+            c1, c2, c3, wildcards = self.deck.deal()
+            rank_counts = self.hand.get_rank_counts(c1+wildcards)
+            playable = self.catalog.get_playable_masks(np.array([rank_counts]))[0]
+            for previous_hand in previous_hands:
+                if previous_hand is None:
+                    previous_hand_class, beating = rules.NOT_A_HAND, self.catalog.beating_masks[-1]
+                else:
+                    previous_hand_class = hand_table[tuple(self.catalog.hand_counts[previous_hand])]
+                    beating = self.catalog.beating_masks[previous_hand]
+
+                expected_hands = set(generate_hand_rank_counts(rank_counts, previous_hand_class))
+                self.assertEqual(self.get_mask_hands(playable & beating), expected_hands)
+            self.deck.reset()
+
+    def test_choose_random_hands_returns_hands_that_beat_the_previous_hand(self):
+        rank_counts = np.array([[4,0,0,0,0,0,0,0,0,0,0,0,0,1,1], [1,1,1,1,1,0,0,0,0,0,0,0,0,0,0], 
+                                [0,0,0,0,0,0,0,0,0,0,0,0,0,0,1]])
+        solo_three = self.catalog.solo_hands[0]
+        previous_hands = np.array([solo_three, -1, solo_three])
+        rng = np.random.default_rng(3)
+        for _ in range(20):
+            hands = self.catalog.choose_random_hands(rank_counts, previous_hands, rng.random(3))
+            for i in range(2):
+                hand_class = (self.catalog.categories[hands[i]], self.catalog.ranks[hands[i]], 
+                              self.catalog.lengths[hands[i]])
+                self.assertTrue((self.catalog.hand_counts[hands[i]]<=rank_counts[i]).all())
+                previous = previous_hands[i]
+                previous_class = rules.NOT_A_HAND if previous<0 else (self.catalog.categories[previous],
+                    self.catalog.ranks[previous], self.catalog.lengths[previous])
+                self.assertTrue(rules.can_beat(hand_class, previous_class))
+
+            self.assertEqual(hands[2], self.catalog.solo_hands[rules.RED_JOKER_RANK])
+
+        hands = self.catalog.choose_random_hands(rank_counts[2:], np.array([self.catalog.rocket_hand]), 
+                                                 rng.random(1))
+        self.assertEqual(hands[0], -1)
+
+    def test_choose_random_hands_leaves_out_the_solos_of_a_lead(self):
+        rank_counts = np.array([[2,1,0,1,0,0,0,0,0,0,0,0,0,1,0], [1,0,1,0,1,0,0,0,0,0,0,0,0,0,0]])
+        rng = np.random.default_rng(4)
+        for _ in range(20):
+            hands = self.catalog.choose_random_hands(rank_counts, np.full(2, NO_SOLO_LEAD), rng.random(2))
+            self.assertTrue(self.catalog.lengths[hands[0]]>1)
+            self.assertEqual(hands[1], -1)
+
+    def test_bits_are_counted_without_bitwise_count(self):
+        masks = np.array([[0, 1, 2**64-1], [2**63, 0b1011, 2**40+7]], dtype=np.uint64)
+        expected = np.array([[0, 1, 64], [1, 3, 4]])
+        self.assertTrue((_count_bits_by_byte(masks)==expected).all())
+        self.assertTrue((count_bits(masks)==expected).all())
+        self.assertTrue((_count_bits_by_byte(masks[:, 1:])==expected[:, 1:]).all())
+
+    def test_play_method_plays_a_round_in_every_game(self):
+        engine = BatchEngine(200, seed=7)
+        for _ in range(5):
+            ended = engine.has_game_ended()
+            played = engine.play()
+            self.assertFalse((played & ended).any())
+            self.assertTrue((engine.get_stakes().sum(axis=1)==180).all())
+
+            games = np.flatnonzero(played)
+            landlords, winners = engine.get_landlords()[games], engine.get_winners()[games]
+            self.assertTrue(((landlords>=0) & (winners>=0)).all())
+            self.assertTrue((engine.rank_counts[games, winners].sum(axis=1)==0).all())
+            self.assertTrue((engine.get_round_stakes()[games]>=1).all())
+
+    def test_games_are_reproducible_from_the_seed(self):
+        engines = [BatchEngine(50, seed=11), BatchEngine(50, seed=11)]
+        for _ in range(3):
+            for engine in engines:
+                engine.play()
+
+        self.assertTrue((engines[0].get_stakes()==engines[1].get_stakes()).all())
+        self.assertTrue((engines[0].get_winners()==engines[1].get_winners()).all())
@@ -0,0 +1,125 @@
+import unittest
+import random
+import game.rules as rules
+import misc.constants as const
+from game.core.card import get_card
+from game.core.hand import generate_hand_rank_counts
+from game.engine.endgame import EndgameSolver, pack_rank_counts, unpack_rank_counts
+
+SUITS = ("hearts", "diamonds", "clubs", "spades")
+
+def create_cards(numbers):
+    '''Return a list of Card objects with the card numbers, using a different suit for each repeated number.'''
+    cards = list()
+    for number in numbers:
+        suit = "joker" if number in (14, 15) else SUITS[[card.get_number() for card in cards].count(number)]
+        cards.append(get_card(number, suit))
+    return cards
+
+def get_rank_counts(cards):
+    rank_counts = [0] * const.TOTAL_RANKS
+    for card in cards:
+        rank_counts[const.RANK_INDEX[card.get_number()]] += 1
+    return tuple(rank_counts)
+
+def landlord_wins(seats, landlord, turn, previous_class, previous_player):
+    '''Return True if the landlord wins with perfect play, searching every line of play.'''
+    if turn==previous_player:
+        previous_class, previous_player = rules.NOT_A_HAND, None
+
+    landlord_to_move = turn==landlord
+    results = list()
+    for hand in generate_hand_rank_counts(seats[turn], previous_class):
+        remaining = tuple(count - played for count, played in zip(seats[turn], hand))
+        if not any(remaining):
+            return landlord_to_move
+
+        next_seats = list(seats)
+        next_seats[turn] = remaining
+        results.append(landlord_wins(next_seats, landlord, (turn+1) % 3, rules.classify(hand), turn))
+
+    if previous_class is not rules.NOT_A_HAND:
+        results.append(landlord_wins(seats, landlord, (turn+1) % 3, previous_class, previous_player))
+
+    return any(results) if landlord_to_move else all(results)
+
+class EndgameSolverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.solver = EndgameSolver()
+
+    def tearDown(self):
+        del self.solver
+
+    def test_rank_counts_are_packed(self):
+        rank_counts = get_rank_counts(create_cards([3, 3, 5, 1, 1, 1, 1, 2, 14, 15]))
+        self.assertEqual(unpack_rank_counts(pack_rank_counts(rank_counts)), rank_counts)
+        self.assertEqual(pack_rank_counts(rank_counts) - pack_rank_counts(get_rank_counts(create_cards([3, 1]))),
+                         pack_rank_counts(get_rank_counts(create_cards([3, 5, 1, 1, 1, 2, 14, 15]))))
+
+    def test_solve_small_positions(self):
+        # the landlord plays the pair.
+        self.assertTrue(self.solver.solve([create_cards([3, 3]), create_cards([2]), create_cards([15])], 0, 0))
+        # the landlord must split the cards, and the peasant beats either card with the red joker.
+        self.assertFalse(self.solver.solve([create_cards([3, 4]), create_cards([15]), create_cards([5])], 0, 0))
+        # the peasants can not beat the two, so the landlord plays the two, then the three.
+        self.assertTrue(self.solver.solve([create_cards([3, 2]), create_cards([1]), create_cards([5])], 0, 0))
+        # the landlord can not beat the pair of twos on the table, and the peasant then plays the three.
+        self.assertFalse(self.solver.solve([create_cards([4, 5]), create_cards([13]), create_cards([3])], 0, 0,
+                                           create_cards([2, 2]), 2))
+        # the peasant passes the partner's pair, which the landlord can not beat.
+        self.assertFalse(self.solver.solve([create_cards([4, 4]), create_cards([3]), create_cards([1])], 0, 2,
+                                           create_cards([2, 2]), 1))
+
+    def test_solve_matches_exhaustive_search(self):
+        rng = random.Random(5)
+        deck = [number for number in range(1, 14) for _ in range(4)] + [14, 15]
+        for _ in range(60):
+            rng.shuffle(deck)
+            sizes = [rng.randint(1, 3) for _ in range(3)]
+            hands = [create_cards(deck[sum(sizes[:seat]):sum(sizes[:seat+1])]) for seat in range(3)]
+            landlord, turn = rng.randrange(3), rng.randrange(3)
+            solver = EndgameSolver()
+            self.assertEqual(solver.solve(hands, landlord, turn),
+                             landlord_wins([get_rank_counts(cards) for cards in hands], landlord, turn, rules.NOT_A_HAND, None))
+
+    def test_best_move_keeps_the_outcome(self):
+        hands = [create_cards([3, 3, 7, 9, 12]), create_cards([4, 5, 6, 8, 2]), create_cards([10, 10, 11, 13, 1])]
+        landlord_result = self.solver.solve(hands, 0, 0)
+        move, result = self.solver.get_best_move(hands, 0, 0)
+        self.assertEqual(result, landlord_result)
+        self.assertIsNot(rules.classify(move), rules.NOT_A_HAND)
+
+        # after a winning move, the landlord still wins.
+        remaining = [tuple(count - played for count, played in zip(get_rank_counts(hands[0]), move))] + \
+                    [get_rank_counts(cards) for cards in hands[1:]]
+        if landlord_result and any(remaining[0]):
+            self.assertTrue(landlord_wins(remaining, 0, 1, rules.classify(move), 0))
+
+        # with no hand to beat the rocket, the seat passes.
+        self.assertEqual(self.solver.get_best_move([create_cards([3, 4]), create_cards([5]), create_cards([6])], 0, 0,
+                                                   create_cards([14, 15]), 2)[0], None)
+
+    def test_solved_positions_are_kept(self):
+        hands = [create_cards([3, 4, 5, 9, 9]), create_cards([6, 7, 8, 1]), create_cards([10, 11, 12, 2])]
+        result = self.solver.solve(hands, 0, 0)
+        nodes = self.solver.get_nodes()
+        self.assertTrue(self.solver.get_table_size()>0)
+        self.assertEqual(self.solver.solve(hands, 0, 0), result)
+        self.assertEqual(self.solver.get_nodes(), nodes)
+
+        # a small table is cleared as it fills, without changing the result.
+        self.assertEqual(EndgameSolver(table_size=4).solve(hands, 0, 0), result)
+        self.solver.clear()
+        self.assertEqual(self.solver.get_table_size(), 0)
+        self.assertEqual(self.solver.get_nodes(), 0)
+
+    def test_invalid_positions(self):
+        hands = [create_cards([3]), create_cards([4]), create_cards([5])]
+        self.assertRaises(ValueError, self.solver.solve, hands[:2], 0, 0)
+        self.assertRaises(ValueError, self.solver.solve, [hands[0], hands[1], list()], 0, 0)
+        self.assertRaises(ValueError, self.solver.solve, hands, 3, 0)
+        self.assertRaises(ValueError, self.solver.solve, hands, 0, 0, create_cards([3, 4]), 1)
+        self.assertRaises(ValueError, self.solver.solve, hands, 0, 0, create_cards([6]))
+
+if __name__=='__main__':
+    unittest.main()
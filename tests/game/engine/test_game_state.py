@@ -0,0 +1,149 @@
+import unittest
+import random
+from tests import helpers
+from game.engine.gameplay import GameplayEngine
+from game.engine.state import GameState, get_rank_counts
+from game.core.player import Player
+from game.interface.simulation import SimulationInterface
+
+class GameStateTestCase(unittest.TestCase):
+    def setUp(self):
+        self.hlpr = helpers.TestHelpers()
+        self.hands = self.hlpr.convert_hand_numbers_to_card_objects([[3, 4, 9, 9, 2], [5, 6, 7, 13], [8, 10, 11, 12, 1]])
+
+    def tearDown(self):
+        del self.hlpr, self.hands
+
+    def test_hash_is_updated_on_every_move(self):
+        state = GameState(self.hands)
+        hashes = {state.get_hash()}
+        for hand in [[3], [7], [1], None, None, [8], None]:
+            if hand is None:
+                state.pass_turn()
+            else:
+                state.play_hand(self.hlpr.convert_hand_numbers_to_card_objects([hand])[0])
+
+            self.assertEqual(state.get_hash(), state.compute_hash())
+            self.assertNotIn(state.get_hash(), hashes)
+            hashes.add(state.get_hash())
+
+        # seat 2 played the ace, both other seats passed, so seat 2 led the eight.
+        self.assertEqual(state.get_turn(), 1)
+        self.assertEqual(state.get_previous_player(), 2)
+        self.assertEqual(state.get_passes(), 1)
+        self.assertEqual(state.get_total_cards(0), 4)
+
+    def test_same_position_has_the_same_hash(self):
+        # the landlord plays the three then the four, or the four then the three, and leads after each.
+        states = [GameState(self.hands), GameState(self.hands)]
+        for state, order in zip(states, [[3, 4], [4, 3]]):
+            for number in order:
+                state.play_hand(self.hlpr.convert_hand_numbers_to_card_objects([[number]])[0])
+                state.pass_turn()
+                state.pass_turn()
+
+        self.assertEqual(states[0].get_hash(), states[1].get_hash())
+        self.assertEqual(states[0].get_turn(), 0)
+        self.assertIsNone(states[0].get_previous_hand())
+
+        remaining = self.hlpr.convert_hand_numbers_to_card_objects([[9, 9, 2]])[0]
+        self.assertEqual(GameState([remaining] + self.hands[1:]).get_hash(), states[0].get_hash())
+        self.assertNotEqual(GameState([remaining] + self.hands[1:], turn=1).get_hash(), states[0].get_hash())
+
+    def test_invalid_moves(self):
+        state = GameState(self.hands)
+        self.assertRaises(ValueError, state.pass_turn)
+        self.assertRaises(ValueError, state.play_hand, self.hlpr.convert_hand_numbers_to_card_objects([[5]])[0])
+        self.assertRaises(ValueError, state.play_hand, list())
+        self.assertRaises(ValueError, GameState, self.hands[:2])
+        self.assertRaises(ValueError, GameState, self.hands, 3)
+
+    def test_undo_move_restores_the_position(self):
+        state = GameState(self.hands, stake=3)
+        start = (state.get_hash(), [state.get_rank_counts(seat) for seat in range(3)], state.get_turn(), state.get_stake())
+        for hand in [[3], [7], [1], None, None, [8]]:
+            state.apply_move(None if hand is None else get_rank_counts(self.hlpr.convert_hand_numbers_to_card_objects([hand])[0]))
+
+        self.assertEqual(len(state.get_history()), 6)
+        # seat 2 regained control after both other seats passed its ace.
+        self.assertEqual(state.get_stake(), 6)
+        while state.get_history():
+            state.undo_move()
+            self.assertEqual(state.get_hash(), state.compute_hash())
+
+        self.assertEqual((state.get_hash(), [state.get_rank_counts(seat) for seat in range(3)], state.get_turn(), 
+                          state.get_stake()), start)
+        self.assertIsNone(state.get_previous_hand())
+        self.assertRaises(ValueError, state.undo_move)
+
+    def test_stake_doubles_by_the_gameplay_rules(self):
+        hands = self.hlpr.convert_hand_numbers_to_card_objects([[3, 3, 3, 3, 5], [14, 15, 6], [7, 8]])
+        state = GameState(hands)
+        state.apply_move(get_rank_counts(hands[0][:4]))
+        self.assertEqual(state.get_stake(), 2)
+        state.apply_move(get_rank_counts(hands[1][:2]))
+        self.assertEqual(state.get_stake(), 4)
+        state.undo_move()
+        self.assertEqual(state.get_stake(), 2)
+
+        # the stake does not double past the limit.
+        state = GameState(hands, stake=16)
+        state.apply_move(get_rank_counts(hands[0][:4]))
+        self.assertEqual(state.get_stake(), 16)
+
+    def test_random_lines_are_undone(self):
+        rng = random.Random(3)
+        deck = self.hlpr.convert_hand_numbers_to_card_objects([[number for number in range(1, 14) for _ in range(4)] + [14, 15]])[0]
+        rng.shuffle(deck)
+        state = GameState([deck[:20], deck[20:37], deck[37:54]])
+        start = state.get_hash()
+        for _ in range(200):
+            while not state.is_round_over() and rng.random()<0.9:
+                moves = state.get_legal_moves()
+                self.assertEqual(state.get_previous_hand() is not None, None in moves)
+                state.apply_move(rng.choice(moves))
+                self.assertEqual(state.get_hash(), state.compute_hash())
+
+            for _ in range(rng.randint(0, len(state.get_history()))):
+                state.undo_move()
+
+        while state.get_history():
+            state.undo_move()
+
+        self.assertEqual(state.get_hash(), start)
+        self.assertEqual(state.get_stake(), 1)
+        self.assertEqual(sum(state.get_total_cards(seat) for seat in range(3)), 54)
+
+    def test_gameplay_engine_keeps_the_state(self):
+        players = [Player(random.Random(seed)) for seed in range(3)]
+        game = SimulationInterface(players, random.Random(4))
+        gameplay = GameplayEngine()
+        self.assertIsNone(gameplay.get_state())
+
+        wildcards = game.deal_cards_to_players()
+        players[0].set_bid(3)
+        game._execute_bidding()
+        game.give_landlord_wildcards(wildcards)
+        order = gameplay.get_play_order(game.get_landlord(), game.get_peasants())
+        winner, stake = gameplay.play_round(order, game.get_round_stake())
+
+        state = gameplay.get_state()
+        self.assertTrue(state.is_round_over())
+        self.assertEqual(state.get_hash(), state.compute_hash())
+        for seat, player in enumerate(reversed(order)):
+            self.assertEqual(state.get_rank_counts(seat), get_rank_counts(player.get_cards()))
+        self.assertEqual(state.get_total_cards(list(reversed(order)).index(winner)), 0)
+        self.assertEqual(state.get_stake(), stake)
+        self.assertRaises(ValueError, gameplay.apply_move, None)
+
+        # the moves of the round are undone back to the deal.
+        while state.get_history():
+            gameplay.undo_move()
+        self.assertEqual(sum(state.get_total_cards(seat) for seat in range(3)), 54)
+        self.assertEqual(state.get_total_cards(0), 20)
+        self.assertEqual(state.get_stake(), game.get_round_stake())
+        self.assertEqual(state.get_hash(), state.compute_hash())
+        self.assertRaises(ValueError, GameplayEngine().undo_move)
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import unittest
+import random
+import time
+from tests import helpers
+from game.core.player import Player
+from game.engine.endgame import pack_rank_counts, unpack_rank_counts
+from game.engine.gameplay import GameplayEngine
+from game.engine.mcts import MCTSPlayer, MCTSSearch, ParallelMCTSSearch, get_position
+from game.engine.state import GameState, get_rank_counts
+from game.instrumentation import PHASE, PhaseTimer
+from game.interface.simulation import SimulationInterface
+try:
+    import numpy as np
+    from game.core.rng import BufferedRandom
+except ImportError:
+    np = None
+
+class MCTSPlayerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.hlpr = helpers.TestHelpers()
+        self.search = MCTSSearch(random.Random(1))
+
+    def tearDown(self):
+        del self.hlpr, self.search
+
+    def _get_cards(self, numbers):
+        return self.hlpr.convert_hand_numbers_to_card_objects([numbers])[0]
+
+    def test_position_holds_what_the_seat_has_seen(self):
+        hands = [self._get_cards(numbers) for numbers in ([3, 3, 9, 2], [5, 6, 7], [8, 10, 1])]
+        state = GameState(hands)
+        state.apply_move(get_rank_counts(hands[0][:2]))
+        state.apply_move(None)
+        turn, cards, unseen, totals, previous_hand, previous_player, wildcards = get_position(state)
+        self.assertEqual((turn, totals, previous_player, wildcards), (2, (2, 3, 3), 0, 0))
+        self.assertEqual(unpack_rank_counts(cards), get_rank_counts(hands[2]))
+        self.assertEqual(unpack_rank_counts(previous_hand), get_rank_counts(hands[0][:2]))
+        # every card but the seat's own cards and the pair of threes is unseen.
+        self.assertEqual(sum(unpack_rank_counts(unseen)), 54 - 3 - 2)
+        self.assertEqual(unpack_rank_counts(unseen)[0], 2)
+
+    def test_position_holds_the_wildcards_the_landlord_has_not_played(self):
+        deck = self._get_cards([number for number in range(1, 14) for _ in range(4)] + [14, 15])
+        random.Random(5).shuffle(deck)
+        state = GameState([deck[:20], deck[20:37], deck[37:]], wildcards=deck[:3])
+        self.assertEqual(get_position(state)[6], 0)
+        state.apply_move(get_rank_counts(deck[:1]))
+        position = get_position(state)
+        expected = [max(0, count - played) for count, played in zip(get_rank_counts(deck[:3]), get_rank_counts(deck[:1]))]
+        self.assertEqual(unpack_rank_counts(position[6]), tuple(expected))
+
+        # every deal of the search gives the landlord the wildcards it holds.
+        class DealSearch(MCTSSearch):
+            def _iterate(self, root, seats, turn, previous_class, previous_player):
+                self.deals.append(list(seats))
+                super()._iterate(root, seats, turn, previous_class, previous_player)
+
+        search = DealSearch(random.Random(2))
+        search.deals = list()
+        search.search(position, playouts=30)
+        self.assertEqual(len(search.deals), 30)
+        for deal in search.deals:
+            landlord_cards = unpack_rank_counts(deal[0])
+            self.assertEqual(sum(landlord_cards), 19)
+            self.assertTrue(all(count>=wildcard for count, wildcard in zip(landlord_cards, expected)))
+
+        # the landlord can not hold more wildcards than cards.
+        self.assertRaises(ValueError, search.search, position[:6] + (position[2],))
+
+    def _get_winning_position(self):
+        '''Return the position of a landlord holding a pair of threes, with the rest of the deck held
+        by the peasants. The landlord wins by playing the pair, and loses the lead with either three.'''
+        deck = self._get_cards([number for number in range(1, 14) for _ in range(4)] + [14, 15])
+        random.Random(3).shuffle(deck)
+        threes = [card for card in deck if card.get_number()==3][:2]
+        rest = [card for card in deck if card not in threes]
+        return get_position(GameState([threes, rest[:26], rest[26:]]))
+
+    def test_search_finds_the_winning_move(self):
+        position = self._get_winning_position()
+        visits = self.search.search(position, playouts=200)
+        self.assertEqual(sum(visits.values()), 200)
+        self.assertEqual(self.search.get_best_move(position, playouts=200), unpack_rank_counts(position[1]))
+
+    def test_parallel_search_merges_the_trees(self):
+        position = self._get_winning_position()
+        with ParallelMCTSSearch(2, random.Random(4)) as search:
+            visits = search.search(position, playouts=101)
+            pool = search.pool
+            self.assertEqual(sum(visits.values()), 101)
+            self.assertEqual(search.get_playouts(), 101)
+            # the worker processes are kept for the next search.
+            self.assertEqual(search.get_best_move(position, playouts=200), unpack_rank_counts(position[1]))
+            self.assertIs(search.pool, pool)
+
+        self.assertIsNone(search.pool)
+        # the trees are seeded, so the counts do not depend on the order the processes finish in.
+        with ParallelMCTSSearch(2, random.Random(4)) as search:
+            self.assertEqual(search.search(position, playouts=101), visits)
+
+        self.assertEqual(ParallelMCTSSearch(1, random.Random(5)).search(position, playouts=50),
+                         MCTSSearch(random.Random(5)).search(position, playouts=50))
+
+    @unittest.skipIf(np is None, "NumPy is required by the buffered random number generator.")
+    def test_parallel_search_with_a_buffered_random(self):
+        position = self._get_winning_position()
+        visits = list()
+        for _ in range(2):
+            with ParallelMCTSSearch(2, BufferedRandom(6)) as search:
+                visits.append(search.search(position, playouts=40))
+
+        self.assertEqual(sum(visits[0].values()), 40)
+        self.assertEqual(visits[0], visits[1])
+
+    def test_only_move_is_played_without_a_search(self):
+        hands = [self._get_cards([4]), self._get_cards([5, 6]), self._get_cards([7, 8])]
+        self.assertEqual(self.search.get_best_move(get_position(GameState(hands))), get_rank_counts(hands[0]))
+
+        # the peasant can not beat the two, so it passes.
+        state = GameState([self._get_cards([2, 4]), hands[1], hands[2]])
+        state.apply_move(get_rank_counts(self._get_cards([2])))
+        self.assertIsNone(self.search.get_best_move(get_position(state)))
+        self.assertEqual(self.search.get_playouts(), 0)
+
+    def test_playout_leads_with_every_hand_but_the_solos(self):
+        cards = pack_rank_counts(get_rank_counts(self._get_cards([3, 3, 5, 6, 7, 8, 9])))
+        moves = self.search._get_moves(cards, None)
+        leading_moves = self.search._get_leading_moves(cards)
+        self.assertEqual(len(moves) - len(leading_moves), 6)
+        self.assertTrue(all(sum(unpack_rank_counts(move))>1 for move, _ in leading_moves))
+        self.assertEqual(self.search._get_leading_moves(pack_rank_counts(get_rank_counts(self._get_cards([3, 5])))), [])
+
+    def test_search_stops_at_the_time_limit(self):
+        rng = random.Random(2)
+        deck = self._get_cards([number for number in range(1, 14) for _ in range(4)] + [14, 15])
+        rng.shuffle(deck)
+        position = get_position(GameState([deck[:20], deck[20:37], deck[37:]]))
+        start = time.perf_counter()
+        visits = self.search.search(position, playouts=10**9, time_limit=0.05)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(sum(visits.values()), self.search.get_playouts())
+        self.assertTrue(self.search.get_playouts()>0)
+
+        self.search.clear()
+        self.assertEqual(self.search.get_playouts(), 0)
+        self.assertRaises(ValueError, self.search.search, position[:3] + ((20, 17, 16),) + position[4:])
+
+    def test_player_plays_a_round(self):
+        players = [MCTSPlayer(random.Random(3), playouts=20), Player(random.Random(4)), Player(random.Random(5))]
+        phase_timer = PhaseTimer()
+        game = SimulationInterface(players, random.Random(6), phase_timer)
+        gameplay = GameplayEngine()
+        wildcards = game.deal_cards_to_players()
+        players[0].set_bid(3)
+        game._execute_bidding()
+        game.give_landlord_wildcards(wildcards)
+        order = gameplay.get_play_order(game.get_landlord(), game.get_peasants())
+        winner, _ = gameplay.play_round(order, game.get_round_stake(), wildcards)
+
+        self.assertEqual(len(winner.get_cards()), 0)
+        self.assertIs(players[0].get_game_state(), gameplay.get_state())
+        self.assertEqual(gameplay.get_state().get_wildcards(), get_rank_counts(wildcards))
+        self.assertEqual(players[0].get_seat(), list(reversed(order)).index(players[0]))
+        self.assertTrue(phase_timer.get_calls(PHASE.SEARCH)>0)
+
+    def test_parallel_player_plays_a_round(self):
+        players = [MCTSPlayer(random.Random(8), playouts=8, processes=2), Player(random.Random(9)), Player(random.Random(10))]
+        game = SimulationInterface(players, random.Random(11))
+        gameplay = GameplayEngine()
+        wildcards = game.deal_cards_to_players()
+        players[0].set_bid(3)
+        game._execute_bidding()
+        game.give_landlord_wildcards(wildcards)
+        order = gameplay.get_play_order(game.get_landlord(), game.get_peasants())
+        winner, _ = gameplay.play_round(order, game.get_round_stake())
+        players[0].close()
+
+        self.assertEqual(len(winner.get_cards()), 0)
+        self.assertEqual(players[0].get_search().get_processes(), 2)
+        self.assertTrue(players[0].get_search().get_playouts()>0)
+
+    def test_player_without_a_state_plays_at_random(self):
+        player = MCTSPlayer(random.Random(7), playouts=20)
+        player.set_cards(self._get_cards([3, 4, 4, 9]))
+        player.set_random_hand()
+        self.assertTrue(player.get_hand())
+        self.assertEqual(player.get_search().get_playouts(), 0)
+
+if __name__=='__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import os
+import tempfile
+from game.interface.replay import ReplayGame
+from game.interface.tournament import play_game
+from game.records import GameRecord, GameRecorder, GameRecordReader, GameRecordWriter
+
+class ReplayGameTestCase(unittest.TestCase):
+    def _record_game(self, seed, max_rounds=None):
+        recorder = GameRecorder()
+        result = play_game(0, seed, max_rounds=max_rounds, event_sink=recorder)
+        return recorder.get_records(), result
+
+    def test_replay_reproduces_the_recorded_rounds(self):
+        records, result = self._record_game(7)
+        recorder = GameRecorder()
+        game = ReplayGame(records, event_sink=recorder)
+        while game.play():
+            self.assertEqual([player.get_stake_amount() for player in game.get_players()],
+                             game.get_record().get_stakes())
+
+        self.assertEqual([player.get_stake_amount() for player in game.get_players()], result.get_stakes())
+        self.assertEqual(recorder.get_records(), records)
+
+    def test_replay_from_seed(self):
+        records, result = self._record_game(8, max_rounds=4)
+        game = ReplayGame.from_seed(8, max_rounds=4)
+        total_rounds = 0
+        while game.play():
+            self.assertEqual(game.get_record(), records[total_rounds])
+            total_rounds += 1
+
+        self.assertEqual(total_rounds, result.get_total_rounds())
+        self.assertEqual([player.get_stake_amount() for player in game.get_players()], result.get_stakes())
+
+    def test_replay_rescores_an_archive(self):
+        records, _ = self._record_game(9, max_rounds=4)
+        with tempfile.TemporaryDirectory() as directory:
+            old_path, new_path = os.path.join(directory, "old.llgr"), os.path.join(directory, "new.llgr")
+            with GameRecordWriter(old_path) as writer:
+                for record in records:
+                    writer.write(record)
+
+            with GameRecordWriter(new_path) as writer:
+                game = ReplayGame(GameRecordReader(old_path), stakes=[1000, 1000, 1000], event_sink=writer)
+                while game.play():
+                    pass
+
+            rescored = list(GameRecordReader(new_path))
+
+        self.assertEqual(len(rescored), len(records))
+        for record, new_record in zip(records, rescored):
+            self.assertEqual(new_record.get_moves(), record.get_moves())
+            self.assertEqual(new_record.get_round_stake(), record.get_round_stake())
+            self.assertEqual(sum(new_record.get_stakes()), 3000)
+
+    def test_replay_resets_the_stakes_at_each_game(self):
+        records, results = list(), list()
+        for seed in (11, 12, 13):
+            game_records, result = self._record_game(seed)
+            records += game_records
+            results.append(result)
+
+        game = ReplayGame(records)
+        replayed = list()
+        while game.play():
+            self.assertEqual([player.get_stake_amount() for player in game.get_players()],
+                             game.get_record().get_stakes())
+            replayed.append(game.get_record())
+
+        self.assertEqual(replayed, records)
+        self.assertEqual([player.get_stake_amount() for player in game.get_players()], results[-1].get_stakes())
+
+        # a record of the game after its last round is left over, so it can not be replayed.
+        ended_records, _ = self._record_game(11)
+        last = ended_records[-1]
+        left_over = GameRecord(last.get_round_number()+1, last.get_stakes(), last.get_deal_rank(), last.get_bids(), 
+                               last.get_round_stake(), last.get_stakes(), last.get_moves())
+        game = ReplayGame(ended_records + [left_over])
+        for _ in ended_records:
+            game.play()
+        self.assertRaises(ValueError, game.play)
+
+    def test_replay_rejects_records_that_can_not_be_replayed(self):
+        records, _ = self._record_game(10, max_rounds=1)
+        record = records[0]
+
+        truncated = GameRecord(0, record.get_start_stakes(), record.get_deal_rank(), record.get_bids(), record.get_round_stake(),
+                               record.get_stakes(), record.get_moves()[:-1])
+        self.assertRaises(ValueError, ReplayGame([truncated]).play)
+
+        extended = GameRecord(0, record.get_start_stakes(), record.get_deal_rank(), record.get_bids(), record.get_round_stake(),
+                              record.get_stakes(), record.get_moves() + [None])
+        self.assertRaises(ValueError, ReplayGame([extended]).play)
+
+        # every player bids 0, so no landlord is chosen.
+        no_landlord = GameRecord(0, record.get_start_stakes(), record.get_deal_rank(), [0, 0, 0], record.get_round_stake(),
+                                 record.get_stakes(), record.get_moves())
+        self.assertRaises(ValueError, ReplayGame([no_landlord]).play)
+
+        # a deck holds four cards of each rank, so no player holds six threes.
+        impossible_move = tuple([6] + [0] * 14)
+        moved = GameRecord(0, record.get_start_stakes(), record.get_deal_rank(), record.get_bids(), record.get_round_stake(),
+                           record.get_stakes(), [impossible_move] + record.get_moves()[1:])
+        self.assertRaises(ValueError, ReplayGame([moved]).play)
+
+if __name__=='__main__':
+    unittest.main()
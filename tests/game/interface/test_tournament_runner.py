@@ -0,0 +1,34 @@
+import unittest
+from game.interface.tournament import TournamentRunner, derive_game_seed, play_game
+
+class TournamentRunnerTestCase(unittest.TestCase):
+    def test_game_seeds_are_derived_from_the_master_seed(self):
+        seeds = [derive_game_seed(1, game_number) for game_number in range(100)]
+        self.assertEqual(len(set(seeds)), 100)
+        self.assertEqual(seeds, [derive_game_seed(1, game_number) for game_number in range(100)])
+        self.assertNotEqual(seeds, [derive_game_seed(2, game_number) for game_number in range(100)])
+
+    def test_games_with_the_same_seed_have_the_same_result(self):
+        result1, result2 = play_game(0, seed=42, max_rounds=5), play_game(0, seed=42, max_rounds=5)
+        self.assertEqual(result1.get_stakes(), result2.get_stakes())
+        self.assertEqual(result1.get_rounds_won(), result2.get_rounds_won())
+        self.assertTrue(result1.get_total_rounds()<=5)
+        self.assertEqual(sum(result1.get_stakes()), 180)
+
+    def test_results_do_not_depend_on_the_number_of_processes(self):
+        results = list()
+        for processes in [1, 2]:
+            runner = TournamentRunner(6, master_seed=3, processes=processes, max_rounds=3)
+            game_results = sorted(runner.run(), key=lambda result: result.get_game_number())
+            self.assertEqual([result.get_game_number() for result in game_results], list(range(6)))
+            results.append([(result.get_seed(), result.get_stakes(), result.get_rounds_won())
+                            for result in game_results])
+
+        self.assertEqual(results[0], results[1])
+
+    def test_play_method_summarises_every_game(self):
+        summary = TournamentRunner(4, master_seed=9, processes=1, max_rounds=2).play()
+        self.assertEqual(summary["games"], 4)
+        self.assertTrue(summary["rounds"]<=8)
+        self.assertTrue(sum(summary["rounds_won"])>=summary["rounds"])
+        self.assertTrue(sum(summary["games_won"])>=4)
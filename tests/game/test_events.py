@@ -0,0 +1,87 @@
+import unittest
+import io
+import json
+import os
+import random
+import tempfile
+from example import LandlordGame
+from game.core.player import Player
+from game.events import EVENT, NULL_SINK, BufferedFileSink, ConsoleSink, EventSink, RingBufferSink
+
+class EventSinkTestCase(unittest.TestCase):
+    def setUp(self):
+        self.players = [Player() for _ in range(3)]
+
+    def tearDown(self):
+        del self.players
+
+    def _play_round(self, event_sink):
+        game = LandlordGame(self.players, random.Random(6), event_sink=event_sink)
+        while not game.play():
+            pass
+
+        return game
+
+    def test_games_discard_events_by_default(self):
+        game = LandlordGame(self.players)
+        self.assertIs(game.get_event_sink(), NULL_SINK)
+        self.assertFalse(NULL_SINK.is_enabled())
+        NULL_SINK.emit(EVENT.DEAL, wildcards=list())
+
+    def test_sink_without_emit_can_not_be_constructed(self):
+        class IncompleteSink(EventSink):
+            pass
+
+        self.assertRaises(TypeError, EventSink)
+        self.assertRaises(TypeError, IncompleteSink)
+
+    def test_ring_buffer_sink_keeps_the_latest_events(self):
+        event_sink = RingBufferSink()
+        self._play_round(event_sink)
+        events = event_sink.get_events()
+        turns = [event for event in events if event["event"]==EVENT.TURN]
+        # the round ends on the turn the winner plays their last cards.
+        self.assertTrue(turns[-1]["hand"])
+
+        events = [event for event in events if event["event"]!=EVENT.TURN]
+        self.assertEqual([event["event"] for event in events[-4:]], [EVENT.DEAL, EVENT.BID, EVENT.PLAY, EVENT.SETTLE])
+        
+        deal, bid, play, settle = events[-4:]
+        self.assertEqual([len(hand) for hand in deal["hands"]], [17, 17, 17])
+        self.assertEqual(len(deal["wildcards"]), 3)
+        self.assertEqual(bid["stake"], max(bid for bid in bid["bids"] if bid is not None))
+        self.assertIn(play["winner"], [0, 1, 2])
+        self.assertEqual(settle["stakes"], [player.get_stake_amount() for player in self.players])
+        self.assertEqual(sum(settle["stakes"]), 180)
+
+        event_sink = RingBufferSink(capacity=2)
+        for number in range(5):
+            event_sink.emit(EVENT.SETTLE, stakes=number)
+        self.assertEqual([event["stakes"] for event in event_sink.get_events()], [3, 4])
+        event_sink.clear()
+        self.assertEqual(event_sink.get_events(), list())
+        self.assertRaises(ValueError, RingBufferSink, 0)
+
+    def test_buffered_file_sink_writes_json_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "events.jsonl")
+            with BufferedFileSink(path, buffer_size=3) as event_sink:
+                self._play_round(event_sink)
+                with open(path) as file:
+                    written = len(file.readlines())
+                self.assertEqual(written % 3, 0)
+
+            with open(path) as file:
+                events = [json.loads(line) for line in file]
+
+        self.assertEqual(events[-1]["event"], EVENT.SETTLE)
+        self.assertTrue(len(events)>written)
+        deal = [event for event in events if event["event"]==EVENT.DEAL][-1]
+        self.assertTrue(all(type(card)==str for card in deal["wildcards"]))
+
+    def test_console_sink_prints_the_chosen_events(self):
+        stream = io.StringIO()
+        self._play_round(ConsoleSink(stream, events=(EVENT.SETTLE,)))
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertTrue(lines[0].startswith("settle: stakes="))
@@ -1,5 +1,6 @@
 import unittest
-from tests import helpers 
+import random
+from tests import helpers, legacy_rules
 import misc.constants as const
 import game.rules as rules
 
@@ -488,4 +489,127 @@ class GameRulesTestCase(unittest.TestCase):
             with self.assertRaises(RuntimeError):
                 number_freq = self.hlpr.get_number_frequency_map(hand)
                 rules.get_hand_category(number_freq)
-    
\ No newline at end of file
+    
+    ''' Hand Classification Tests '''
+    def test_get_rank_counts_function_counts_cards_by_rank(self):
+        rank_counts = rules.get_rank_counts({3:2, 1:3, 2:1, 15:1})
+        self.assertEqual(len(rank_counts), const.TOTAL_RANKS)
+        self.assertEqual(rank_counts[const.RANK_INDEX[3]], 2)
+        self.assertEqual(rank_counts[const.RANK_INDEX[1]], 3)
+        self.assertEqual(rank_counts[const.RANK_INDEX[2]], 1)
+        self.assertEqual(rank_counts[const.RANK_INDEX[15]], 1)
+        self.assertEqual(sum(rank_counts), 7)
+
+    def test_hand_table_contains_every_hand_of_each_category(self):
+        expected_totals = {const.CARD_CATEGORY.SOLO:15, const.CARD_CATEGORY.SOLO_CHAIN:36,
+            const.CARD_CATEGORY.PAIR:13, const.CARD_CATEGORY.PAIR_CHAIN:52,
+            const.CARD_CATEGORY.TRIO:13, const.CARD_CATEGORY.TRIO_CHAIN:45,
+            const.CARD_CATEGORY.TRIO_WITH_SOLO:182, const.CARD_CATEGORY.TRIO_WITH_PAIR:169,
+            const.CARD_CATEGORY.AIRPLANE_WITH_SOLO:7161, const.CARD_CATEGORY.AIRPLANE_WITH_PAIR:2939,
+            const.CARD_CATEGORY.BOMB:13, const.CARD_CATEGORY.BOMB_WITH_SOLO:1170,
+            const.CARD_CATEGORY.BOMB_WITH_PAIR:858, const.CARD_CATEGORY.ROCKET:1}
+        totals = dict()
+        for rank_counts, (category, rank, length) in rules.get_hand_table().items():
+            totals[category] = totals.get(category, 0) + 1
+            self.assertEqual(sum(rank_counts), length)
+            self.assertTrue(length<=rules.MAX_HAND_SIZE)
+            self.assertTrue(rank_counts[rank]>0)
+
+        self.assertEqual(totals, expected_totals)
+
+    def test_classify_function_matches_the_legacy_hand_category_predicates(self):
+        def legacy_category(number_freq):
+            try:
+                return legacy_rules.get_hand_category(number_freq)
+            except RuntimeError:
+                return None
+
+        rng = random.Random(12)
+        deck = [number for number in range(1, 14) for _ in range(4)] + [14, 15]
+        long_hands = 0
+        for _ in range(20000):
+            # a random part of a deal, a few random ranks with random counts, or a run of ranks with 
+            # random kickers, so the bombs, chains and airplanes longer than 8 cards are also compared.
+            shape = rng.randint(0, 2)
+            if shape==0:
+                numbers = rng.sample(deck, rng.randint(1, rules.MAX_HAND_SIZE))
+            elif shape==1:
+                numbers = list()
+                for number in rng.sample(range(1, 16), rng.randint(1, 8)):
+                    numbers += [number] * (1 if number>13 else rng.randint(1, 4))
+            else:
+                count, low = rng.randint(1, 3), rng.randint(3, 13)
+                numbers = [(number-1) % 13 + 1 for number in range(low, min(low+rng.randint(2, 12), 15))] * count
+                kicker_count = rng.randint(1, 2)
+                for number in rng.sample(range(1, 16), rng.randint(0, 6)):
+                    numbers += [number] * (1 if number>13 else kicker_count)
+            numbers = numbers[:rules.MAX_HAND_SIZE]
+
+            number_freq = dict()
+            for number in numbers:
+                number_freq[number] = number_freq.get(number, 0) + 1
+
+            hand_class = rules.classify(rules.get_rank_counts(number_freq))
+            category = None if hand_class is rules.NOT_A_HAND else hand_class[0]
+            self.assertEqual(category, legacy_category(number_freq), sorted(numbers))
+            if category is not None and len(numbers)>8:
+                long_hands += 1
+
+        self.assertTrue(long_hands>500)
+
+    def test_classify_function_returns_category_comparison_rank_and_length(self):
+        hands = [[7], [3,4,5,6,7], [9,10,11,12,13,1], [5,5,5,14], [10,10,10,11,11,11,3,4], [2,2,2,2,3,4], [14,15]]
+        expected = [(const.CARD_CATEGORY.SOLO, 7), (const.CARD_CATEGORY.SOLO_CHAIN, 7), 
+            (const.CARD_CATEGORY.SOLO_CHAIN, 1), (const.CARD_CATEGORY.TRIO_WITH_SOLO, 5),
+            (const.CARD_CATEGORY.AIRPLANE_WITH_SOLO, 11), (const.CARD_CATEGORY.BOMB_WITH_SOLO, 2),
+            (const.CARD_CATEGORY.ROCKET, 15)]
+        hands = self.hlpr.convert_hand_numbers_to_card_objects(hands)
+        for i in range(len(hands)):
+            number_freq = self.hlpr.get_number_frequency_map(hands[i])
+            category, rank, length = rules.classify(rules.get_rank_counts(number_freq))
+            self.assertEqual(category, expected[i][0])
+            self.assertEqual(const.RANK_ORDER[rank], expected[i][1])
+            self.assertEqual(length, len(hands[i]))
+
+    def test_classify_function_recognises_bomb_with_kicker_hands_holding_several_bombs(self):
+        hands = [[7,7,7,7,8,8,8,8,3,3,6,6,9,9,10,10], [3,3,3,3,4,4,4,4,5,6,7,15], 
+                 [5,5,5,5,9,9,9,9,2,2,2,2,3,4,6,7,8,14]]
+        expected = [(const.CARD_CATEGORY.BOMB_WITH_PAIR, 8), (const.CARD_CATEGORY.BOMB_WITH_SOLO, 4),
+            (const.CARD_CATEGORY.BOMB_WITH_SOLO, 2)]
+        hands = self.hlpr.convert_hand_numbers_to_card_objects(hands)
+        for i in range(len(hands)):
+            number_freq = self.hlpr.get_number_frequency_map(hands[i])
+            category, rank, length = rules.classify(rules.get_rank_counts(number_freq))
+            self.assertEqual((category, const.RANK_ORDER[rank], length), expected[i] + (len(hands[i]),))
+            self.assertEqual(rules.get_hand_category(number_freq), expected[i][0])
+
+        # two bombs need four kickers, which can not include the rocket. 
+        for numbers in [[3,3,3,3,4,4,4,4,5,6], [3,3,3,3,4,4,4,4,5,6,14,15], [3,3,3,3,4,4,4,4,5,5,6,7]]:
+            cards = self.hlpr.convert_hand_numbers_to_card_objects([numbers])[0]
+            number_freq = self.hlpr.get_number_frequency_map(cards)
+            self.assertIs(rules.classify(rules.get_rank_counts(number_freq)), rules.NOT_A_HAND)
+
+    def test_classify_function_returns_sentinel_when_hand_is_in_an_unrecognised_category(self):
+        hands = self.hlpr.get_hands_with_unrecognised_card_category()
+        hands = self.hlpr.convert_hand_numbers_to_card_objects(hands)
+        for hand in hands:
+            number_freq = self.hlpr.get_number_frequency_map(hand)
+            self.assertIs(rules.classify(rules.get_rank_counts(number_freq)), rules.NOT_A_HAND)
+
+    def test_can_beat_function_requires_same_category_length_and_higher_rank(self):
+        def hand_class(numbers):
+            cards = self.hlpr.convert_hand_numbers_to_card_objects([numbers])[0]
+            return rules.classify(rules.get_rank_counts(self.hlpr.get_number_frequency_map(cards)))
+
+        self.assertTrue(rules.can_beat(hand_class([9]), hand_class([8])))
+        self.assertFalse(rules.can_beat(hand_class([8]), hand_class([9])))
+        self.assertTrue(rules.can_beat(hand_class([4,5,6,7,8]), hand_class([3,4,5,6,7])))
+        self.assertFalse(rules.can_beat(hand_class([4,5,6,7,8,9]), hand_class([3,4,5,6,7])))
+        self.assertFalse(rules.can_beat(hand_class([6,6,6,3]), hand_class([5,5,5,1,1])))
+        self.assertTrue(rules.can_beat(hand_class([3,3,3,3]), hand_class([2,2,2,1,1])))
+        self.assertTrue(rules.can_beat(hand_class([7,7,7,7]), hand_class([5,5,5,5])))
+        self.assertFalse(rules.can_beat(hand_class([3,3,3,3]), hand_class([5,5,5,5])))
+        self.assertTrue(rules.can_beat(hand_class([14,15]), hand_class([2,2,2,2])))
+        self.assertFalse(rules.can_beat(hand_class([2,2,2,2]), hand_class([14,15])))
+        self.assertTrue(rules.can_beat(hand_class([3]), rules.NOT_A_HAND))
+        self.assertFalse(rules.can_beat(rules.NOT_A_HAND, hand_class([3])))
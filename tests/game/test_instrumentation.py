@@ -0,0 +1,182 @@
+import unittest
+import json
+import os
+import tempfile
+import random
+from example import LandlordGame
+from game.core.hand import CardHand
+from game.core.player import Player
+import misc.constants as const
+from tests import helpers
+from game.core.deck import CardDeck
+from game.core.hand import generate_hand_rank_counts
+from game.instrumentation import PHASE, PHASES, NULL_TIMER, NULL_MOVE_STATS, ChromeTracer, MoveStats, NullPhaseTimer, PhaseTimer
+from game.instrumentation import get_histogram_bucket
+
+class PhaseTimerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.phase_timer = PhaseTimer()
+
+    def tearDown(self):
+        self.phase_timer.reset()
+
+    def test_phases_are_recorded(self):
+        for _ in range(3):
+            self.phase_timer.stop(PHASE.DEAL, self.phase_timer.start())
+        self.phase_timer.stop(PHASE.BID, self.phase_timer.start() - 2000000)
+
+        self.assertEqual(self.phase_timer.get_calls(PHASE.DEAL), 3)
+        self.assertEqual(self.phase_timer.get_calls(PHASE.PLAY), 0)
+        self.assertTrue(self.phase_timer.get_total_time(PHASE.BID)>=0.002)
+
+        summary = json.loads(self.phase_timer.to_json())
+        self.assertEqual(list(summary), list(PHASES))
+        self.assertEqual(summary[PHASE.DEAL]["calls"], 3)
+        self.assertEqual(summary[PHASE.PLAY], {"calls":0, "total_seconds":0, "mean_seconds":0})
+
+        table = self.phase_timer.format_table().splitlines()
+        self.assertEqual(len(table), len(PHASES)+1)
+        deal_row = table[1 + PHASES.index(PHASE.DEAL)]
+        self.assertTrue(deal_row.startswith("deal") and " 3 " in deal_row)
+
+        self.phase_timer.reset()
+        self.assertEqual(self.phase_timer.get_calls(PHASE.DEAL), 0)
+
+    def test_null_timer_records_nothing(self):
+        self.assertIsInstance(NULL_TIMER, NullPhaseTimer)
+        self.assertFalse(NULL_TIMER.is_enabled())
+        NULL_TIMER.stop(PHASE.DEAL, NULL_TIMER.start())
+        self.assertEqual(NULL_TIMER.get_calls(PHASE.DEAL), 0)
+        self.assertIs(CardHand().phase_timer, NULL_TIMER)
+
+    def test_game_records_every_phase(self):
+        players = [Player() for _ in range(3)]
+        game = LandlordGame(players, random.Random(11), self.phase_timer)
+        rounds_played = sum(game.play() for _ in range(5))
+        self.assertEqual(self.phase_timer.get_calls(PHASE.DEAL), 5)
+        self.assertEqual(self.phase_timer.get_calls(PHASE.PLAY), rounds_played)
+        self.assertEqual(self.phase_timer.get_calls(PHASE.SETTLE), rounds_played)
+        self.assertTrue(self.phase_timer.get_calls(PHASE.GENERATE)>=rounds_played)
+        self.assertTrue(self.phase_timer.get_calls(PHASE.FILTER)>0)
+        # the players' hands are replaced every round, and keep the timer.
+        self.assertIs(players[0].hand.phase_timer, self.phase_timer)
+
+        game.set_phase_timer(None)
+        self.assertIs(players[0].hand.phase_timer, NULL_TIMER)
+        calls = self.phase_timer.get_calls(PHASE.DEAL)
+        game.play()
+        self.assertEqual(self.phase_timer.get_calls(PHASE.DEAL), calls)
+
+class ChromeTracerTestCase(unittest.TestCase):
+    def test_game_phases_are_written_as_trace_events(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            with ChromeTracer(path) as tracer:
+                game = LandlordGame([Player() for _ in range(3)], random.Random(5), tracer)
+                while not game.play():
+                    pass
+
+            tracer.stop(PHASE.DEAL, tracer.start())
+            with open(path) as file:
+                events = json.load(file)
+
+        phase_events = [event for event in events if event["ph"]=="X"]
+        self.assertEqual(len(phase_events), sum(tracer.get_calls(phase) for phase in PHASES) - 1)
+        self.assertEqual(sum(event["name"]==PHASE.TURN for event in phase_events), tracer.get_calls(PHASE.TURN))
+        self.assertTrue(all(event["dur"]>=0 and event["ts"]>=0 for event in phase_events))
+
+        # each turn is inside the play phase, which is inside the round.
+        round_event = [event for event in phase_events if event["name"]==PHASE.ROUND][-1]
+        play_event = [event for event in phase_events if event["name"]==PHASE.PLAY][-1]
+        turn_event = [event for event in phase_events if event["name"]==PHASE.TURN][-1]
+        self.assertTrue(round_event["ts"]<=play_event["ts"]<=turn_event["ts"])
+        self.assertTrue(turn_event["ts"] + turn_event["dur"]<=play_event["ts"] + play_event["dur"]<=
+                        round_event["ts"] + round_event["dur"] + 1)
+
+class MoveStatsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.move_stats = MoveStats()
+
+    def tearDown(self):
+        self.move_stats.reset()
+
+    @classmethod
+    def setUpClass(cls):
+        cls.test_helpers = helpers.TestHelpers()
+
+    def test_turns_are_recorded_in_histograms(self):
+        self.assertEqual([get_histogram_bucket(size) for size in [0, 1, 2, 3, 4, 7, 8, 100]], [0, 1, 2, 2, 4, 4, 8, 64])
+        self.move_stats.record_turn({const.CARD_CATEGORY.SOLO:5, const.CARD_CATEGORY.PAIR:2}, 3)
+        self.move_stats.record_turn(dict(), 0)
+        self.assertEqual(self.move_stats.get_turns(), 2)
+        self.assertEqual(self.move_stats.get_total_candidates(), 7)
+        self.assertEqual(self.move_stats.get_total_survivors(), 3)
+        self.assertEqual(self.move_stats.get_largest_turn(), 7)
+        self.assertEqual(self.move_stats.get_turn_histogram(), {4:1, 0:1})
+        self.assertEqual(self.move_stats.get_category_histograms(), {const.CARD_CATEGORY.SOLO:{4:1}, const.CARD_CATEGORY.PAIR:{2:1}})
+
+        total = MoveStats()
+        total.merge(self.move_stats)
+        total.merge(self.move_stats)
+        summary = json.loads(total.to_json())
+        self.assertEqual(summary["turns"], 4)
+        self.assertEqual(summary["category_candidates"], {"solo":10, "pair":4})
+        self.assertEqual(summary["turn_histogram"], {"0":2, "4":2})
+
+        NULL_MOVE_STATS.record_turn({const.CARD_CATEGORY.SOLO:1}, 1)
+        NULL_MOVE_STATS.merge(total)
+        self.assertEqual(NULL_MOVE_STATS.get_turns(), 0)
+
+    def test_candidates_are_counted_when_a_hand_is_chosen(self):
+        hand = CardHand(random.Random(1))
+        hand.set_move_stats(self.move_stats)
+        deck = CardDeck(random.Random(2))
+        deck.shuffle()
+        cards = deck.deal()[0]
+        previous_hand = self.test_helpers.convert_hand_numbers_to_card_objects([[3]])[0]
+
+        hand.set_random_hand(cards, previous_hand)
+        rank_counts = hand.get_rank_counts(cards)
+        expected = len(list(generate_hand_rank_counts(rank_counts, hand.get_hand_class(previous_hand))))
+        self.assertEqual(self.move_stats.get_turns(), 1)
+        self.assertEqual(self.move_stats.get_total_candidates(), expected)
+        self.assertEqual(self.move_stats.get_total_survivors(), expected)
+
+        # the hands passed to set_hand() are filtered by the hands that beat the previous hand.
+        hand.reset()
+        valid_hands = list(hand.generate_hands(cards))
+        hand.set_hand(None, previous_hand, valid_hands)
+        self.assertEqual(self.move_stats.get_turns(), 2)
+        self.assertEqual(self.move_stats.get_total_candidates(), expected + len(valid_hands))
+        self.assertEqual(self.move_stats.get_total_survivors(), 2 * expected)
+        self.assertIn(hand.get_hand(), valid_hands)
+
+    def test_counting_candidates_does_not_change_the_hand(self):
+        previous_hand = self.test_helpers.convert_hand_numbers_to_card_objects([[3]])[0]
+        valid_hands = self.test_helpers.convert_hand_numbers_to_card_objects([[5], [7]])
+        hands = list()
+        for move_stats in [None, self.move_stats]:
+            hand = CardHand(random.Random(3))
+            hand.set_move_stats(move_stats)
+            hand.set_hand(None, previous_hand, (valid_hand for valid_hand in valid_hands))
+            hands.append(hand.get_hand())
+
+        self.assertEqual(hands[0], hands[1])
+        self.assertIn(hands[1], valid_hands)
+        self.assertEqual(self.move_stats.get_total_candidates(), 2)
+        self.assertEqual(self.move_stats.get_total_survivors(), 2)
+
+    def test_gameplay_engine_holds_the_last_rounds_stats(self):
+        game = LandlordGame([Player() for _ in range(3)], random.Random(4))
+        game.gameplay_engine.set_move_stats(self.move_stats)
+        while not game.play():
+            pass
+
+        self.assertIs(game.gameplay_engine.get_move_stats(), self.move_stats)
+        self.assertTrue(self.move_stats.get_turns()>0)
+        # the stats are cleared at the start of each round.
+        self.move_stats.record_turn({const.CARD_CATEGORY.SOLO:10**6}, 0)
+        while not game.play():
+            pass
+        self.assertTrue(self.move_stats.get_largest_turn()<10**6)
+        self.assertEqual(sum(self.move_stats.get_turn_histogram().values()), self.move_stats.get_turns())
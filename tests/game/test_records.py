@@ -0,0 +1,105 @@
+import unittest
+import os
+import random
+import tempfile
+from example import LandlordGame
+from game.core.card import Card
+from game.core.player import Player
+from game.core.hand import get_rank_counts
+from game.records import FILE_HEADER, GameRecord, GameRecordReader, GameRecordWriter
+
+class GameRecordTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.llgr")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def _play_games(self, seed, total_rounds):
+        players = [Player() for _ in range(3)]
+        with GameRecordWriter(self.path) as writer:
+            game = LandlordGame(players, random.Random(seed), event_sink=writer)
+            stakes = list()
+            while len(stakes)<total_rounds and not game.has_game_ended():
+                if game.play():
+                    stakes.append([player.get_stake_amount() for player in players])
+
+        return writer, stakes
+
+    def test_record_round_trips_through_bytes(self):
+        moves = [get_rank_counts([Card(number, "hearts") for number in (3, 4, 5, 6, 7)]), None, None,
+                 get_rank_counts([Card(3, "clubs"), Card(3, "spades")])]
+        record = GameRecord(2, [36, 0, 51], 2**90 + 12345, [1, None, 3], 6, [30, -6, 57], moves)
+        data = record.to_bytes()
+
+        copy = GameRecord.from_bytes(data)
+        self.assertEqual(copy, record)
+        self.assertEqual(copy.get_round_number(), 2)
+        self.assertEqual(copy.get_start_stakes(), [36, 0, 51])
+        self.assertEqual(copy.get_deal_rank(), 2**90 + 12345)
+        self.assertEqual(copy.get_bids(), [1, None, 3])
+        self.assertEqual(copy.get_round_stake(), 6)
+        self.assertEqual(copy.get_stakes(), [30, -6, 57])
+        self.assertEqual(copy.get_moves(), moves)
+        # the header, the round number, seven stakes, the number of turns, two bytes for each hand and one
+        # for each pass.
+        self.assertEqual(len(data), 15 + 1 + 7 + 1 + 6)
+        # the ranks of the chain and of the pair, each followed by the number of cards of each rank less one.
+        self.assertEqual(data[-6:], bytes([0b11111, 0, 0, 0, 1, 1]))
+
+        self.assertRaises(ValueError, GameRecord.from_bytes, data[:-1])
+        self.assertRaises(ValueError, GameRecord.from_bytes, data[:10])
+        self.assertRaises(ValueError, GameRecord(0, [0] * 3, 0, [None] * 3, 0, [0] * 3, [(5,) + (0,) * 14]).to_bytes)
+        # the pair of threes is read back as a three and a four, which is not a hand.
+        self.assertRaises(ValueError, GameRecord.from_bytes, data[:-2] + bytes([0b11, 0]))
+
+        # the moves are encoded from their rank counts, so hands outside the hand table are kept.
+        suits = ("hearts", "clubs", "spades", "diamonds")
+        two_bombs = get_rank_counts([Card(number, suit) for number in (7, 8) for suit in suits] +
+                                    [Card(number, suit) for number in (3, 6, 9, 10) for suit in suits[:2]])
+        record = GameRecord(0, [0] * 3, 0, [None] * 3, 0, [0] * 3, [two_bombs])
+        self.assertEqual(GameRecord.from_bytes(record.to_bytes()).get_moves(), [two_bombs])
+
+    def test_writer_records_each_round_played(self):
+        writer, stakes = self._play_games(3, 5)
+        self.assertEqual(writer.get_total_records(), len(stakes))
+
+        records = list(GameRecordReader(self.path))
+        self.assertEqual([record.get_stakes() for record in records], stakes)
+        self.assertEqual([record.get_round_number() for record in records], list(range(len(records))))
+        self.assertEqual([record.get_start_stakes() for record in records[1:]], stakes[:-1])
+        for record in records:
+            hands = record.get_deal()
+            self.assertEqual([len(cards) for cards in hands], [17, 17, 17, 3])
+            self.assertGreater(record.get_round_stake(), 0)
+            self.assertTrue(any(bid is not None for bid in record.get_bids()))
+
+            # the winner plays every card in their hand, so at least 17 cards are played.
+            moves = record.get_moves()
+            self.assertIsNotNone(moves[-1])
+            self.assertGreaterEqual(sum(sum(move) for move in moves if move is not None), 17)
+
+        self.assertEqual(os.path.getsize(self.path),
+                         len(FILE_HEADER) + sum(len(record.to_bytes()) for record in records))
+
+    def test_writer_appends_to_existing_file(self):
+        self._play_games(4, 2)
+        records = list(GameRecordReader(self.path))
+        self._play_games(4, 2)
+        self.assertEqual(list(GameRecordReader(self.path)), records + records)
+
+    def test_reader_rejects_invalid_files(self):
+        with open(self.path, "wb") as file:
+            file.write(b"not a record file")
+        self.assertRaises(ValueError, list, GameRecordReader(self.path))
+        self.assertRaises(ValueError, GameRecordWriter, self.path)
+
+        os.remove(self.path)
+        self._play_games(5, 1)
+        with open(self.path, "r+b") as file:
+            file.truncate(os.path.getsize(self.path) - 1)
+        self.assertRaises(ValueError, list, GameRecordReader(self.path))
+
+if __name__=='__main__':
+    unittest.main()